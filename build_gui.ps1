@@ -11,10 +11,12 @@ if (-not (Test-Path ".venv")) {
 
 & .\.venv\Scripts\Activate.ps1
 python -m pip install --upgrade pip
-pip install requests pyinstaller
+pip install -r requirements.txt pyinstaller
 
 $env:NACF_MODEL = $ModelName
 
-pyinstaller --onefile --windowed --name NotACultureFitGUI --clean src\nacf_ui.py
+pyinstaller --onefile --windowed --name NotACultureFitGUI --clean `
+  --add-data "assets\manager_sprite.png;assets" --add-data "assets\NotACultureFit.ico;assets" --add-data "content;content" `
+  src\Not_a_Culture_Fit.py
 
 Write-Host "`nBuilt GUI at dist\NotACultureFitGUI.exe" -ForegroundColor Green
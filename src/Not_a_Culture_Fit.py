@@ -6,27 +6,131 @@ First-run bootstrap will install/start Ollama and pull the model if needed.
 """
 
 from __future__ import annotations
-import os, sys, random, threading, time, subprocess, shutil, webbrowser, textwrap
+import os, sys, json, random, threading, time, shutil
+import glob, math, operator, re, unicodedata, zlib
+from array import array
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 
-import requests  # pip install requests
-# Pillow (sprite). If missing in dev, app still runs without the image.
-try:
-    from PIL import Image, ImageTk  # pip install Pillow
-except Exception:
-    Image = ImageTk = None
+# -------- Deferred imports --------
+# requests alone is ~120 ms of a cold start; it and the bootstrap/cache-only modules load on first use.
+# The loaders use plain import statements so PyInstaller still finds them. Profile with:
+#   python src/nacf_bench.py --startup
+class _LazyModule:
+    """Stands in for a module until one of its attributes is first read."""
+
+    def __init__(self, load: Callable[[], Any]):
+        self._load, self._module = load, None
+
+    def __getattr__(self, name: str):
+        if self._module is None:
+            self._module = self._load()
+        return getattr(self._module, name)
+
+def _load_requests():
+    import requests  # pip install requests
+    import requests.adapters
+    return requests
+
+def _load_subprocess():
+    import subprocess
+    return subprocess
+
+def _load_webbrowser():
+    import webbrowser
+    return webbrowser
+
+def _load_sqlite3():
+    import sqlite3
+    return sqlite3
+
+def _load_hashlib():
+    import hashlib
+    return hashlib
+
+requests = _LazyModule(_load_requests)
+subprocess = _LazyModule(_load_subprocess)
+webbrowser = _LazyModule(_load_webbrowser)
+sqlite3 = _LazyModule(_load_sqlite3)
+hashlib = _LazyModule(_load_hashlib)
 
 # -------- Resource paths (dev + PyInstaller onefile) --------
 def resource_path(*parts):
     base = getattr(sys, "_MEIPASS", os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
     return os.path.join(base, *parts)
 
+def cache_path(*parts):
+    """Per-user writable cache (critiques, prescaled assets). NACF_CACHE_DIR overrides the location."""
+    base = os.environ.get("NACF_CACHE_DIR") or (
+        os.path.join(os.environ["LOCALAPPDATA"], "NotACultureFit") if os.environ.get("LOCALAPPDATA")
+        else os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "not-a-culture-fit"))
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, *parts)
+
 # ---------- Config ----------
+# One server, or a comma-separated list to spread critiques across several Ollama hosts
 OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434").rstrip("/")
 MODEL_NAME = os.environ.get("NACF_MODEL", "llama3")
 NUM_QUESTIONS_PER_INTERVIEW = 10
+# Content packs (questions, names, rejections) and who the kiosk remembers questions for
+CONTENT_DIR = os.environ.get("NACF_CONTENT_DIR") or resource_path("content")
+KIOSK_CANDIDATE = os.environ.get("NACF_CANDIDATE", "kiosk")
+# Campaign kiosks: themed interviews (comma-separated tags) and a difficulty ramp like "1-3"
+INTERVIEW_THEME = [t for t in os.environ.get("NACF_THEME", "").split(",") if t.strip()]
+INTERVIEW_RAMP = os.environ.get("NACF_RAMP", "")
+# Stream critiques token-by-token into the chat (NACF_STREAM=0 restores the blocking call)
+STREAM_CRITIQUES = os.environ.get("NACF_STREAM", "1") != "0"
+GENERATION_OPTIONS: Dict[str, Any] = {"temperature": 0.9, "top_p": 0.95, "repeat_penalty": 1.1, "num_predict": 160}
+# Critique length budget: num_predict follows the answer length and the measured token rate, and shrinks
+# while p95 critique latency is over the SLO (NACF_LATENCY_SLO_MS=0 keeps the fixed num_predict)
+LATENCY_SLO_S = float(os.environ.get("NACF_LATENCY_SLO_MS", "8000")) / 1000
+MIN_PREDICT = 48  # one full sentence
+CRITIQUE_STOP = ["\n\n", "QUESTION:", "CANDIDATE_ANSWER:"]
+# Replies are cleaned of markdown and cut off (connection closed) after this many sentences; 0 = no limit
+REPLY_MAX_SENTENCES = int(os.environ.get("NACF_MAX_SENTENCES", "3"))
+# Critique cache: repeated answers are served from disk once VARIANTS critiques exist for them
+CRITIQUE_CACHE = os.environ.get("NACF_CACHE", "1") != "0"
+CACHE_VARIANTS = int(os.environ.get("NACF_CACHE_VARIANTS", "3"))
+CACHE_MAX_ENTRIES = int(os.environ.get("NACF_CACHE_MAX", "5000"))
+CACHE_TTL_S = float(os.environ.get("NACF_CACHE_TTL_DAYS", "30")) * 86400
+# Semantic cache: answers whose embeddings are this close to an already critiqued one reuse its critiques
+SEMANTIC_CACHE = os.environ.get("NACF_SEMANTIC_CACHE", "1") != "0"
+EMBED_MODEL = os.environ.get("NACF_EMBED_MODEL", "nomic-embed-text")
+SEMANTIC_THRESHOLD = float(os.environ.get("NACF_SEMANTIC_THRESHOLD", "0.9"))
+SEMANTIC_MAX_PER_QUESTION = int(os.environ.get("NACF_SEMANTIC_MAX", "256"))
+EMBED_TIMEOUT_S = 10.0
+EMBED_RETRY_S = 300.0  # after a failed embedding call (model not pulled, server too old), skip lookups this long
+# Chat mode: persona sent once as a system message, answers kept as an interview-long /api/chat history
+CHAT_MODE = os.environ.get("NACF_CHAT", "1") != "0"
+CHAT_HISTORY_TURNS = int(os.environ.get("NACF_CHAT_HISTORY", "10"))
+# LLM-written rejection letter, drafted in idle time from this question on so the final screen is instant
+LLM_DECISION = os.environ.get("NACF_LLM_DECISION", "0") == "1"
+DECISION_SPECULATE_FROM_Q = int(os.environ.get("NACF_DECISION_FROM_Q", "8"))
+# How long Ollama keeps the model resident after each call ("30m", "-1" = forever, "0" = unload)
+KEEP_ALIVE = os.environ.get("NACF_KEEP_ALIVE", "30m")
+# HTTP: pooled keep-alive connections, split connect/read timeouts, retry on connection resets
+HTTP_POOL_SIZE = int(os.environ.get("NACF_HTTP_POOL", "8"))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("NACF_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.environ.get("NACF_READ_TIMEOUT", "120"))
+HTTP_RETRIES = int(os.environ.get("NACF_HTTP_RETRIES", "2"))
+HTTP_BACKOFF = float(os.environ.get("NACF_HTTP_BACKOFF", "0.25"))
+HEALTH_INTERVAL_S = float(os.environ.get("NACF_HEALTH_INTERVAL", "10"))
+# Chat log: lines kept in the Text widget, messages kept in memory, older ones spilled to disk and paged back on scroll
+CHAT_MAX_LINES = int(os.environ.get("NACF_CHAT_LINES", "400"))
+CHAT_MEMORY_MESSAGES = int(os.environ.get("NACF_CHAT_MEMORY", "1000"))
+CHAT_PAGE_MESSAGES = 20
+# Worker results reach Tk through one queue drained every UI_FRAME_MS (16-33 ms = 60-30 fps)
+UI_FRAME_MS = int(os.environ.get("NACF_UI_FRAME_MS", "16"))
+# Shared work queue: fixed Ollama concurrency, bounded backlog, interactive critiques ahead of background work
+WORKERS = int(os.environ.get("NACF_WORKERS", "2"))
+WORK_QUEUE_SIZE = int(os.environ.get("NACF_QUEUE_SIZE", "32"))
+# Metrics export: Prometheus text on NACF_METRICS_PORT (/metrics) and/or a JSON file rewritten periodically
+METRICS_PORT = int(os.environ.get("NACF_METRICS_PORT", "0"))
+METRICS_JSON = os.environ.get("NACF_METRICS_JSON", "")
+METRICS_INTERVAL_S = float(os.environ.get("NACF_METRICS_INTERVAL", "60"))
 
 # ---------- Palette ----------
 CHARCOAL = "#2f3b4a"
@@ -37,293 +141,2002 @@ CARD_BG  = "#ffffff"
 INK      = "#1e2329"
 MUTED    = "#6b7785"
 
-# ---------- Data ----------
-ADJECTIVES = [
-    "Synergistic","Quantum","Elastic","Ethical","Aggressively","Holistic",
-    "Frictionless","Disruptive","Blockchain","Serverless","Omnichannel",
-    "Ranch-Flavored","Ambient","Subprime","Eco-Competitive","Hypermobile",
-    "Bleeding-Edge","Ceremonial","Chaotic Good","Militarized","Plausible"
-]
-NOUNS = [
-    "Compliance","Insights","Dynamics","Optimizations","Enablement",
-    "Monetization","Parabolas","Incentives","Liquidity","Pipelines",
-    "Onboarding","KPIs","Clickthroughs","Entanglement","Arbitrage",
-    "Synergies","Wrangling","Migrations","Intelligence","Silos"
-]
-SUFFIXES = ["LLC","& Sons","Group","Ltd.","PLC","AG","S.A.","LLP","Holdings","Worldwide","International","Global","Capital"]
-MANAGER_FIRST = [
-    "Gristle","Nebula","Chadwick","Velvet","Cabbage","Stark","Peony","Vortex","Crispin","Zamboni",
-    "Tarragon","Gloria-7","Kevlar","Juniper","Tungsten","Paprika","Mirth","Drizzle","Quantum","Burlap"
-]
-MANAGER_LAST = [
-    "Mcdagger","FOMO","Von Spreadsheet","Gallowglass","Afterparty","Hardskill","Dumpster","Blunderbuss",
-    "KPIson","Debtforge","Coldbrew","Synergywolf","Carbonara","Quarterclose","Powerpoint","Benchmarker",
-    "BrassTax","Hedgefund","Moonshot","Stakeholder"
-]
-REJECTION_REASONS = [
-    "We chose a candidate with more hands-on experience in interpretive dance-based standups.",
-    "Your vibe didn’t align with our brand of cheerful despair.",
-    "We needed someone who can forklift their own emotional baggage — with certification.",
-    "Our algorithm confused your answer with a pizza coupon and auto-rejected it.",
-    "You scored highly, but our culture fit requires a deep love of meetings without chairs.",
-    "We pivoted to hiring a raccoon we found behind the office dumpster (series A mascot).",
-    "Finance says your ROI on birthday cake consumption was negative YoY.",
-    "We’re pursuing candidates who are fluent in both Kubernetes and Gregorian chant.",
-    "Legal advised us to hire someone we can’t legally describe.",
-    "We need a visionary who’s comfortable failing upward at scale.",
-    "Our hiring freeze thawed, then refroze, then asked for PTO.",
-    "You didn’t mention synergy enough; we require at least 12 synergies per response.",
-    "Your answers were too correct for our experimental chaos environment.",
-    "The role has been replaced by a spreadsheet with a knife.",
-    "We require 8+ years experience in a framework announced yesterday.",
-    "Our team voted and the snack bar lobbied against you.",
-    "Astral HR determined your aura clashes with our brand palette.",
-    "We promoted the role to Principal Intern and there can only be one.",
-    "We’re optimizing for people who clap when planes land.",
-    "We ran out of lanyards; please reapply after Q4 restock."
-]
-QUESTION_BANK: List[str] = [
-    "How would you explain the internet to a medieval blacksmith using only bread metaphors?",
-    "Estimate how many pigeons it would take to move a Honda Civic one meter and justify the math.",
-    "Describe a time you had to refactor your personality for Q3.",
-    "If our roadmap were a casserole, what ingredient are you removing and why?",
-    "Design a scrum ceremony for procrastination and outline the deliverables.",
-    "Teach me Kubernetes using three spoons and a haunting memory.",
-    "Our core value is ‘respectfully unhinged.’ Tell me about a time you were both.",
-    "How many tabs should a high performer have open, minimum?",
-    "You have 30 seconds to unionize a swarm of bees. Go.",
-    "Pitch a new metric that will ruin morale but look great on slides.",
-    "What’s your favorite exception to swallow silently and why?",
-    "Write a brief postmortem for a meeting that never happened.",
-    "What shade of beige best represents enterprise alignment?",
-    "Draft an apology to a printer you’ve wronged.",
-    "Explain CAP theorem to my dog who only understands vibes.",
-    "If you were a microservice, which one would constantly restart and why?",
-    "Tell me about a time you scaled empathy horizontally.",
-    "How would you migrate our feelings to the cloud?",
-    "Create an OKR for taking shorter walks to the fridge.",
-    "How do you handle feedback delivered exclusively via vibes and tambourine?",
-    "Invent a governance policy for office succulents.",
-    "Why are we still using JIRA? Give three spiritual reasons.",
-    "Design a dark pattern that convinces me to hydrate.",
-    "What is the ethical number of monitors? Defend your position.",
-    "How would you deprecate lunch?",
-    "Choose: tabs, spaces, or fire. Explain.",
-    "Write a migration plan from hope to resignation with zero downtime.",
-    "Tell me about a time you Tetris’d a budget into existence.",
-    "Draft an RFC for replacing chairs with large exercise balls.",
-    "How would you normalize chaos in third normal form?",
-    "Convince me that the coffee is fine (it isn’t).",
-    "If the build breaks in the forest and no one hears it, who’s on call?",
-    "Design a feature no one asked for but everyone will be forced to use.",
-    "How many microservices is too many? Use only farm animals in your proof.",
-    "Pitch a startup that sells silence as a subscription.",
-    "Tell me about conflict you escalated to the moon for brand reasons.",
-    "Estimate our NPS among ghosts.",
-    "Write a 2-sentence SLA for hugs.",
-    "What’s the minimum viable ritual to summon a deploy that works?",
-    "Refactor this sentence: ‘We value family’ into something concerning.",
-    "Describe your personal caching strategy for grudges.",
-    "How would you shard the concept of trust?",
-    "Name a hill you refused to die on and why it was the parking lot.",
-    "Design a captcha humans consistently fail but bots love.",
-    "Tell me a secret about Excel that scares you.",
-    "Draft a zero-trust architecture for snacks.",
-    "What makes a meeting truly mandatory in your heart?",
-    "How would you handle a teammate who only communicates via forwardable emails?",
-    "Define ‘senior’ without using the words ‘tired’ or ‘seen things.’",
-    "Write release notes for a nap.",
-    "Explain your approach to load balancing friendships at work.",
-    "What KPI would you use to measure joy?",
-    "Create a risk register for office birthdays.",
-    "How many story points is an existential crisis?",
-    "Walk me through your incident response for vibes being off.",
-    "Suggest a reorg that increases morale for exactly 11 minutes.",
-    "When should we pivot to selling hoodies?",
-    "Design a security policy for the office microwave?",
-    "Write a 1-line regex that ruins your week.",
-    "How would you compress a scream to fit in a status update?",
-    "Draft a memo convincing us to adopt tabs ironically.",
-    "What is your philosophy on staplers?",
-    "Build a decision tree for bringing up The Cloud.",
-    "Tell me about a time your calendar became sentient.",
-    "Propose a feature that adds value by removing joy.",
-    "What is the acceptable RTO (Return To Office) for a soul?",
-    "How do you sunset a coworker’s novelty mug collection?",
-    "Compare our roadmap to a haunted carnival ride.",
-    "Write a performance review for caffeine.",
-    "How would you monetize eye contact?",
-    "Create an escalation path for printer jams that ends in therapy.",
-    "What’s your personal SLA for replying to ‘quick question’?",
-    "Describe a migration from Slack to interpretive dance.",
-    "Explain monorepos to a raccoon with a MBA.",
-    "How do you ensure backwards compatibility with past mistakes?",
-    "Propose a feature flag for hope.",
-    "What is the ethical way to A/B test birthdays?",
-    "Draft a 3-point plan to de-bureaucratize bureaucracy.",
-    "How many meetings until we call it a festival?",
-    "What’s your disaster recovery plan for weekends?",
-    "Write a PR description for changing nothing but sounding brave.",
-    "Design an org chart inspired by spaghetti.",
-    "Map our tech stack to kitchen appliances and identify the cursed blender.",
-    "When is it okay to paginate an apology?",
-    "Explain observability using soap operas.",
-    "What is your policy on feral requirements?",
-    "Draft a compliance checklist for vibes-based hiring.",
-    "How would you improve our latency to joy?",
-    "Write a migration guide from optimism to realism.",
-    "What should our 404 page apologize for?",
-    "Estimate the blast radius of a spicy Slack emoji.",
-    "Invent a new agile ceremony called ‘Feelings Triage.’",
-    "How do you version-control promises?",
-    "When does a backlog become folklore?",
-    "Give a blameless postmortem for a snack theft you committed.",
-    "What’s the SSO (Single Snack Onboarding) process?",
-    "How would you sandbox an executive idea safely?",
-    "Write a Helm chart for regret.",
-    "Explain your approach to debugging people.",
-    "Propose a dress code for Zoom squares.",
-    "What is our core competency if not emails?",
-    "Create a performance rubric for vibes.",
-    "If budgets were seasons, which one just ghosted us?",
-    "What’s your policy on saving face vs. saving the repo?",
-    "How would you hotfix a friendship?",
-    "What’s the minimum number of dashboards to feel alive?",
-    "Write a termination email for a sticky note."
-]
-if len(QUESTION_BANK) < 100:
-    base = "Give an unreasonably detailed answer to: why meetings breed more meetings?"
-    QUESTION_BANK.extend([f"{base} (variant {i+1})" for i in range(100 - len(QUESTION_BANK))])
+# ---------- Content packs ----------
+# Questions, name parts and rejection reasons live in content/*.json ("core.json" first, then the rest by
+# name). Each pack may carry any of the CONTENT_LISTS plus "questions": plain strings or
+# {"text", "tags", "difficulty"} (1 easy .. 3 hard), with pack-level "tags" added to every question.
+# They are compiled once into a memory-mapped index in the cache dir, so a 100k-question library costs
+# neither import time nor RAM:
+#   header | meta JSON (fingerprint, pack ranges, tag postings, merged name lists) | padding
+#   | u64 near-duplicate signatures | u32 text offsets | u32 tag postings | u8 difficulty | UTF-8 blob
+CONTENT_LISTS = ("rejections", "adjectives", "nouns", "suffixes", "manager_first", "manager_last")
+DEFAULT_DIFFICULTY = 2
+_INDEX_MAGIC = b"NACFQIX2"
+_MINHASH_SEEDS = ((0x9E3779B1, 0x7F4A7C15), (0x85EBCA77, 0x165667B1), (0xC2B2AE3D, 0x27D4EB2F), (0x61C88647, 0x94D049BB))
 
-# ---------- Ollama bootstrap (Option A) ----------
-def ensure_ollama(url: str, model: str = "llama3", parent: tk.Tk | None = None) -> bool:
-    """Ensure Ollama is installed, reachable, and the model is present."""
-    # 1) Is the server up?
-    server_ok = False
-    try:
-        requests.get(f"{url}/api/tags", timeout=2)
-        server_ok = True
-    except Exception:
-        pass
-
-    # 2) If CLI missing, offer to install via winget
-    if not server_ok and shutil.which("ollama") is None:
-        ans = messagebox.askyesno(
-            "Ollama not found",
-            "This app uses Ollama (local LLM runtime).\n\nInstall it now via winget? (Requires admin)",
-            parent=parent,
-        )
-        if ans:
-            cmd = [
-                "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass",
-                "Start-Process", "winget",
-                "-ArgumentList", '"install -e --id Ollama.Ollama --silent"',
-                "-Verb", "RunAs"
-            ]
+def content_sources(content_dir: str) -> List[str]:
+    paths = glob.glob(os.path.join(glob.escape(content_dir), "*.json"))
+    return sorted(paths, key=lambda p: (os.path.basename(p) != "core.json", os.path.basename(p)))
+
+def content_fingerprint(paths: List[str]) -> str:
+    crc = 0
+    for path in paths:
+        crc = zlib.crc32(os.path.basename(path).encode("utf-8"), crc)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                crc = zlib.crc32(chunk, crc)
+    return f"{crc:08x}"
+
+def question_signature(text: str) -> int:
+    """
+    Four 16-bit min-hashes over the question's words and word pairs, packed into a u64. Questions sharing
+    3+ lanes have a Jaccard similarity around 0.75 or more: reworded or "(variant N)" copies.
+    """
+    words = [w for w in re.findall(r"[^\W\d_]+", text.casefold()) if len(w) > 2]
+    hashes = {zlib.crc32(f.encode("utf-8")) for f in words + [a + " " + b for a, b in zip(words, words[1:])]} or {0}
+    sig = 0
+    for mult, add in _MINHASH_SEEDS:
+        sig = (sig << 16) | (min((h * mult + add) & 0xFFFFFFFF for h in hashes) >> 16)
+    return sig
+
+def read_pack(path: str) -> tuple:
+    """A pack's JSON and its questions as (text, tags, difficulty) tuples; ValueError if it is malformed."""
+    with open(path, encoding="utf-8") as f:
+        pack = json.load(f)
+    if not isinstance(pack, dict):
+        raise ValueError("not a JSON object")
+    for name in CONTENT_LISTS:
+        if not isinstance(pack.get(name, []), list) or not all(isinstance(x, str) for x in pack.get(name, [])):
+            raise ValueError(f'"{name}" is not a list of strings')
+    questions = []
+    for q in pack.get("questions", []):
+        q = {"text": q} if isinstance(q, str) else q
+        if not isinstance(q, dict) or not isinstance(q.get("text"), str):
+            raise ValueError(f"question without text: {str(q)[:60]}")
+        try:
+            tags = dict.fromkeys(str(t).casefold() for t in [*pack.get("tags", []), *q.get("tags", [])])
+            level = max(0, min(255, int(q.get("difficulty") or 0)))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"{q['text'][:60]!r}: {e}") from e
+        questions.append((q["text"], list(tags), level))
+    return pack, questions
+
+def near_duplicate(a: int, b: int) -> bool:
+    return sum(((a ^ b) >> shift) & 0xFFFF == 0 for shift in (0, 16, 32, 48)) >= 3
+
+class QuestionIndex:
+    """
+    Read-only, memory-mapped question store: len(), [i], difficulty(i), signature(i), each pack's
+    [start, end) range and, per tag, the sorted ids carrying it (tagged(tag)).
+    """
+
+    def __init__(self, path: str):
+        import mmap
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:8] != _INDEX_MAGIC:
+            raise ValueError(f"not a question index: {path}")
+        meta_len, self.count = int.from_bytes(self._map[8:12], "little"), int.from_bytes(self._map[12:16], "little")
+        self.meta: Dict[str, Any] = json.loads(self._map[16:16 + meta_len])
+        self.packs: Dict[str, tuple] = {name: tuple(r) for name, r in self.meta["packs"].items()}
+        self.tags: Dict[str, tuple] = {name: tuple(r) for name, r in self.meta["tags"].items()}
+        view, pos, n = memoryview(self._map), 16 + meta_len + (-(16 + meta_len) % 8), self.count
+        self._views = []
+        def section(size: int, fmt: str):  # zero-copy
+            nonlocal pos
+            v = view[pos:pos + size * {"Q": 8, "I": 4, "B": 1}[fmt]].cast(fmt); pos += v.nbytes
+            self._views.append(v)
+            return v
+        self._signatures, self._offsets = section(n, "Q"), section(n + 1, "I")
+        self._postings, self._difficulty = section(self.meta["postings"], "I"), section(n, "B")
+        self._blob = pos
+        self._views.append(view)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> str:
+        lo, hi = self._offsets[i], self._offsets[i + 1]
+        return self._map[self._blob + lo:self._blob + hi].decode("utf-8")
+
+    def difficulty(self, i: int) -> int:
+        return self._difficulty[i] or DEFAULT_DIFFICULTY
+
+    def signature(self, i: int) -> int:
+        return self._signatures[i]
+
+    def tagged(self, tag: str) -> memoryview:
+        start, n = self.tags.get(tag, (0, 0))
+        return self._postings[start:start + n]
+
+    def close(self):
+        for v in reversed(self._views): v.release()
+        self._map.close(); self._file.close()
+
+    @staticmethod
+    def build(paths: List[str], out_path: str, fingerprint: str):
+        lists: Dict[str, List[str]] = {name: [] for name in CONTENT_LISTS}
+        packs: Dict[str, List[int]] = {}
+        by_tag: Dict[str, List[int]] = {}
+        offsets, blob = array("I", [0]), bytearray()
+        signatures, difficulty = array("Q"), array("B")
+        skipped: Dict[str, str] = {}
+        for path in paths:
             try:
-                subprocess.run(" ".join(cmd), shell=True, check=True)
-                messagebox.showinfo("Ollama installed", "Ollama was installed. Starting service…", parent=parent)
-            except Exception as e:
-                messagebox.showerror("Install failed", f"Could not install Ollama:\n{e}", parent=parent)
-                return False
-        else:
-            messagebox.showinfo("Installation required",
-                                "Please install Ollama and relaunch.\nhttps://ollama.com/download",
-                                parent=parent)
-            try: webbrowser.open("https://ollama.com/download")
-            except Exception: pass
-            return False
+                pack, questions = read_pack(path)
+            except (OSError, ValueError) as e:
+                # One broken add-on pack shouldn't take the app down; a broken core.json should
+                if os.path.basename(path) == "core.json":
+                    raise ValueError(f"{path}: {e}") from e
+                skipped[os.path.basename(path)] = str(e)
+                continue
+            for name in CONTENT_LISTS:
+                lists[name] += [x for x in pack.get(name, []) if x not in lists[name]]
+            start = len(offsets) - 1
+            for text, tags, level in questions:
+                i = len(offsets) - 1
+                for tag in tags:
+                    by_tag.setdefault(tag, []).append(i)
+                blob += text.encode("utf-8"); offsets.append(len(blob))
+                signatures.append(question_signature(text))
+                difficulty.append(level)
+            packs[pack.get("name") or os.path.splitext(os.path.basename(path))[0]] = [start, len(offsets) - 1]
+        postings, tags = array("I"), {}
+        for tag, ids in sorted(by_tag.items()):
+            tags[tag] = [len(postings), len(ids)]; postings.extend(ids)
+        meta = json.dumps({"fingerprint": fingerprint, "packs": packs, "tags": tags, "postings": len(postings),
+                           "lists": lists, "skipped": skipped}, ensure_ascii=False).encode("utf-8")
+        tmp = f"{out_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_INDEX_MAGIC + len(meta).to_bytes(4, "little") + (len(offsets) - 1).to_bytes(4, "little"))
+            f.write(meta + b"\0" * (-(16 + len(meta)) % 8))
+            for arr in (signatures, offsets, postings, difficulty):
+                f.write(arr.tobytes())
+            f.write(blob)
+        os.replace(tmp, out_path)
 
-    # 3) Try to start the Windows service (ignore errors)
-    try:
-        subprocess.run(["sc", "start", "Ollama"], check=False, capture_output=True)
-    except Exception:
-        pass
+class Content:
+    """
+    Merged content packs: name lists as interned tuples, questions behind a QuestionIndex, and the packs
+    left out for being malformed (skipped: file name -> reason).
+    """
+
+    def __init__(self, index: QuestionIndex):
+        self.questions = index
+        self.skipped: Dict[str, str] = index.meta.get("skipped", {})
+        lists = index.meta["lists"]
+        self.rejections, self.adjectives, self.nouns, self.suffixes, self.manager_first, self.manager_last = (
+            tuple(sys.intern(x) for x in lists[name]) for name in CONTENT_LISTS)
 
-    # 4) Wait for server to be reachable (try foreground serve as fallback)
-    for _ in range(30):  # ~15s
+    @classmethod
+    def load(cls, content_dir: str = CONTENT_DIR) -> "Content":
+        paths = content_sources(content_dir)
+        fingerprint = content_fingerprint(paths)
+        # Named by content, not location: a onefile build unpacks to a new temp dir on every launch
+        out = cache_path("content", f"questions-{fingerprint}.idx")
         try:
-            requests.get(f"{url}/api/tags", timeout=1.5)
-            server_ok = True
-            break
-        except Exception:
-            time.sleep(0.5)
+            index = QuestionIndex(out)
+            if index.meta.get("fingerprint") == fingerprint:
+                return cls(index)
+            index.close()
+        except (OSError, ValueError, KeyError):
+            pass
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        QuestionIndex.build(paths, out, fingerprint)
+        for stale in glob.glob(cache_path("content", "questions-*.idx")):
+            if stale != out:
+                try: os.remove(stale)
+                except OSError: pass  # still mapped by another process
+        return cls(QuestionIndex(out))
+
+_content: Content | None = None
+_content_lock = threading.Lock()
+
+def content() -> Content:
+    """The shared content store, compiled/opened on first use."""
+    global _content
+    with _content_lock:
+        if _content is None:
+            _content = Content.load()
+        return _content
+
+class SeenSet:
+    """
+    One bit per question a candidate has been asked, persisted next to the cache. Tied to the index
+    fingerprint: adding or editing a pack starts everyone fresh.
+    """
 
-    if not server_ok:
+    def __init__(self, path: str | None, size: int, fingerprint: str):
+        self.path, self.size, self.fingerprint = path, size, fingerprint
+        self.bits = bytearray((size + 7) // 8)
         try:
-            subprocess.Popen(["ollama", "serve"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except Exception:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data[:8] == fingerprint.encode("ascii") and len(data) == 8 + len(self.bits):
+                self.bits[:] = data[8:]
+        except (OSError, TypeError):
             pass
-        for _ in range(40):  # ~20s
-            try:
-                requests.get(f"{url}/api/tags", timeout=1.5)
-                server_ok = True
-                break
-            except Exception:
-                time.sleep(0.5)
 
-    if not server_ok:
-        messagebox.showerror("Ollama unavailable", f"Could not reach Ollama at {url}.\nStart Ollama and try again.", parent=parent)
-        return False
+    def __contains__(self, i: int) -> bool:
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
 
-    # 5) Ensure the model exists (pull on first run)
-    try:
-        r = requests.get(f"{url}/api/tags", timeout=5).json()
-        have = {m.get("name", "").split(":")[0] for m in r.get("models", [])}
-        need = model.split(":")[0]
-        if need not in have:
-            if messagebox.askyesno("Download model", f"Download '{model}' now? (one-time)", parent=parent):
-                subprocess.run(["cmd", "/c", f'ollama pull "{model}"'], check=True)
+    def add(self, i: int):
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def discard(self, i: int):
+        self.bits[i >> 3] &= ~(1 << (i & 7))
+
+    def save(self):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.fingerprint.encode("ascii") + bytes(self.bits))
+        os.replace(tmp, self.path)
+
+def select_questions(index: QuestionIndex, n: int, seen: SeenSet, *, span: tuple | None = None,
+                     theme: List[str] | None = None, ramp: tuple | None = None,
+                     rng: random.Random = random) -> List[int]:
+    """
+    n question ids, each unseen, not a near-duplicate of another pick and, with ramp=(first, last), at
+    the difficulty that slot calls for. theme draws from the union of those tags' postings, so a question
+    matching two theme tags is twice as likely, and a theme with fewer than n questions is topped up from
+    the rest of the bank; span=(lo, hi) limits ids to one pack. Random probing with constraints relaxed
+    in stages keeps this O(n) whatever the bank size; only when probing fails does it scan the pool, and
+    a pool with nothing left unseen starts the candidate over (a new round).
+    """
+    lo, hi = span or (0, len(index))
+    pools = [index.tagged(t) for t in theme or () if t in index.tags]
+    themed, pools = bool(pools), pools or [range(lo, hi)]
+    total = sum(len(p) for p in pools)
+    n = min(n, hi - lo)
+
+    def draw() -> int:
+        r = rng.randrange(total)
+        for pool in pools:
+            if r < len(pool): return pool[r]
+            r -= len(pool)
+
+    targets = [None] * n if not ramp else \
+        [round(ramp[0] + (ramp[1] - ramp[0]) * j / max(1, n - 1)) for j in range(n)]
+    picked: List[int] = []
+
+    def fits(i: int, target: int | None, slack: int) -> bool:
+        return (lo <= i < hi and i not in seen and i not in picked
+                and (target is None or slack > 1 or abs(index.difficulty(i) - target) <= slack)
+                and not any(near_duplicate(index.signature(i), index.signature(j)) for j in picked))
+
+    for target in targets:
+        choice = next((i for slack in (0, 1, 2) for i in (draw() for _ in range(16)) if fits(i, target, slack)), None)
+        while choice is None:  # slow path: everything left in the pool, best difficulty match first
+            left = [i for i in dict.fromkeys(i for pool in pools for i in pool) if lo <= i < hi and i not in picked]
+            if all(i in seen for i in left):
+                for i in left: seen.discard(i)
+            fresh = [i for i in left if i not in seen] or left
+            if fresh:
+                best = min(abs(index.difficulty(i) - target) if target else 0 for i in fresh)
+                choice = rng.choice([i for i in fresh if (abs(index.difficulty(i) - target) if target else 0) == best])
+            elif themed:  # the theme is used up in this interview: top up from the whole span
+                themed, pools, total = False, [range(lo, hi)], hi - lo
             else:
-                return False
-    except Exception:
+                break
+        if choice is None:
+            break
+        picked.append(choice); seen.add(choice)
+    return picked
+
+_seen_lock = threading.Lock()
+
+def seen_path(candidate: str) -> str:
+    safe = re.sub(r"[^\w.-]", "_", candidate)[:48]
+    os.makedirs(cache_path("seen"), exist_ok=True)
+    return cache_path("seen", f"{safe}-{zlib.crc32(candidate.encode('utf-8')):08x}.bin")
+
+# ---------- Metrics ----------
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+RATE_BUCKETS = (1, 2, 5, 10, 20, 40, 80, 160)
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        i = 0
+        while i < len(self.buckets) and value > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate from the buckets (linear within the bucket), like Prometheus' histogram_quantile."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                lo = self.buckets[i - 1] if i else 0.0
+                hi = self.buckets[i] if i < len(self.buckets) else lo
+                return lo + (hi - lo) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+def _labels(labels: Dict[str, str], **extra) -> str:
+    items = {**labels, **extra}
+    return "{" + ",".join(f'{k}="{v}"' for k, v in sorted(items.items())) + "}" if items else ""
+
+class Metrics:
+    """Thread-safe counters and histograms for the critique pipeline, exportable as Prometheus text or JSON."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: Dict[tuple, Histogram] = {}
+        self.counters: Dict[tuple, float] = {}
+        self.gauges: Dict[tuple, float] = {}
+
+    def observe(self, name: str, value: float, *, buckets: tuple = LATENCY_BUCKETS, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram(buckets)
+            hist.observe(value)
+
+    def inc(self, name: str, value: float = 1.0, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels: str):
+        with self._lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        return self.histograms.get((name, tuple(sorted(labels.items()))))
+
+    def prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for (name, labels), value in sorted({**self.counters, **self.gauges}.items()):
+                lines.append(f"{name}{_labels(dict(labels))} {value:g}")
+            for (name, labels), hist in sorted(self.histograms.items()):
+                cumulative = 0
+                for le, n in zip([*map(str, hist.buckets), "+Inf"], hist.counts):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_labels(dict(labels), le=le)} {cumulative}")
+                lines.append(f"{name}_sum{_labels(dict(labels))} {hist.sum:.6f}")
+                lines.append(f"{name}_count{_labels(dict(labels))} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": {f"{n}{_labels(dict(l))}": v for (n, l), v in self.counters.items()},
+                "gauges": {f"{n}{_labels(dict(l))}": v for (n, l), v in self.gauges.items()},
+                "histograms": {f"{n}{_labels(dict(l))}": {"count": h.count, "sum": round(h.sum, 6),
+                                                           "p50": round(h.quantile(0.5), 6),
+                                                           "p95": round(h.quantile(0.95), 6),
+                                                           "p99": round(h.quantile(0.99), 6)}
+                               for (n, l), h in self.histograms.items()},
+            }
+
+METRICS = Metrics()
+
+class Trace:
+    """
+    Timing marks for one critique, in seconds since the answer was submitted: started -> prompt_built ->
+    headers (connect + server queue) -> first_token -> last_byte -> ui_applied. finish() records each
+    stage plus Ollama's own load/prompt-eval/eval timings into METRICS.
+    """
+
+    def __init__(self, metrics: Metrics = METRICS):
+        self.metrics = metrics
+        self.t0 = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+        self.ollama: Dict[str, Any] = {}
+        self.source = "model"
+
+    def mark(self, stage: str):
+        self.marks.setdefault(stage, time.perf_counter() - self.t0)  # first occurrence wins
+
+    def finish(self):
+        for stage, at in self.marks.items():
+            self.metrics.observe("nacf_critique_stage_seconds", at, stage=stage, source=self.source)
+        self.metrics.inc("nacf_critiques_total", source=self.source)
+        o = self.ollama
+        for field in ("load_duration", "prompt_eval_duration", "eval_duration"):
+            if o.get(field):
+                self.metrics.observe(f"nacf_ollama_{field}_seconds", o[field] / 1e9)
+        if o.get("eval_count"):
+            self.metrics.inc("nacf_ollama_eval_tokens_total", o["eval_count"])
+            if o.get("eval_duration"):
+                self.metrics.observe("nacf_ollama_tokens_per_second", o["eval_count"] / (o["eval_duration"] / 1e9),
+                                     buckets=RATE_BUCKETS)
+
+def start_metrics_export(port: int = METRICS_PORT, json_path: str = METRICS_JSON,
+                         interval: float = METRICS_INTERVAL_S, metrics: Metrics = METRICS):
+    """Serve /metrics (Prometheus text) on port and/or rewrite json_path every interval seconds."""
+    if port:
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.prometheus().encode("utf-8")
+                self.send_response(200 if self.path.startswith("/metrics") else 404)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    if json_path:
+        def dump_forever():
+            while True:
+                time.sleep(interval)
+                try:
+                    with open(json_path + ".tmp", "w", encoding="utf-8") as f:
+                        json.dump({"time": time.time(), **metrics.snapshot()}, f, indent=2)
+                    os.replace(json_path + ".tmp", json_path)
+                except OSError:
+                    pass
+        threading.Thread(target=dump_forever, daemon=True).start()
+
+# ---------- Ollama HTTP client ----------
+class OllamaClient:
+    """Keep-alive connection pool for one Ollama server. Safe to share between worker threads."""
+
+    def __init__(self, url: str, *, pool_size: int = HTTP_POOL_SIZE,
+                 connect_timeout: float = HTTP_CONNECT_TIMEOUT, read_timeout: float = HTTP_READ_TIMEOUT,
+                 retries: int = HTTP_RETRIES, backoff: float = HTTP_BACKOFF):
+        self.url = url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        # Retries are handled in request() so probes can opt out; the adapter only pools.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method: str, path: str, *, retries: int | None = None, **kwargs) -> requests.Response:
+        """Send a request, retrying connection failures/resets with exponential backoff."""
+        kwargs.setdefault("timeout", self.timeout)
+        attempts = self.retries if retries is None else retries
+        for attempt in range(attempts + 1):
+            try:
+                return self.session.request(method, self.url + path, **kwargs)
+            except requests.ConnectionError:
+                if attempt >= attempts:
+                    raise
+                time.sleep(self.backoff * (2 ** attempt))
+        raise AssertionError("unreachable")
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+_clients: Dict[str, OllamaClient] = {}
+_clients_lock = threading.Lock()
+
+def ollama_client(url: str) -> OllamaClient:
+    """Shared client per server URL, so every call reuses the same connection pool."""
+    key = url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OllamaClient(key)
+        return client
+
+# ---------- Backend pool ----------
+def parse_backend_urls(text: str) -> List[str]:
+    return [u.strip().rstrip("/") for u in text.split(",") if u.strip()]
+
+class OllamaBackend:
+    def __init__(self, url: str):
+        self.url = url
+        self.client = ollama_client(url)
+        self.healthy = True         # optimistic until a probe or request says otherwise
+        self.inflight = 0
+        self.failures = 0
+        self.last_error = ""
+
+class BackendPool:
+    """
+    Routes each request to the least-loaded healthy Ollama backend, failing over to the next one on
+    connection/server errors. A daemon thread re-probes /api/tags every health_interval seconds.
+    """
+
+    def __init__(self, urls: List[str], *, health_interval: float = HEALTH_INTERVAL_S):
+        if not urls:
+            raise ValueError("BackendPool needs at least one URL")
+        self.backends = [OllamaBackend(u) for u in urls]
+        self.health_interval = health_interval
+        self._lock = threading.Lock()
+        self._checker: threading.Thread | None = None
+
+    def start_health_checks(self):
+        if self._checker is None and len(self.backends) > 1:
+            self._checker = threading.Thread(target=self._health_loop, daemon=True)
+            self._checker.start()
+
+    def _health_loop(self):
+        while True:
+            self.check_all()
+            time.sleep(self.health_interval)
+
+    def check(self, backend: OllamaBackend) -> bool:
+        try:
+            backend.client.get("/api/tags", timeout=(HTTP_CONNECT_TIMEOUT, 2), retries=0).raise_for_status()
+            ok = True
+        except Exception as e:
+            ok, backend.last_error = False, str(e)
+        with self._lock:
+            backend.healthy = ok
+            if ok: backend.failures = 0
+        return ok
+
+    def check_all(self):
+        probes = [threading.Thread(target=self.check, args=(b,), daemon=True) for b in self.backends]
+        for t in probes: t.start()
+        for t in probes: t.join()
+
+    def _candidates(self, prefer: str | None = None) -> List[OllamaBackend]:
+        """Healthy backends by load (a healthy `prefer` first), then unhealthy ones by fewest failures."""
+        with self._lock:
+            return sorted(self.backends, key=lambda b: (not b.healthy, b.url != prefer,
+                                                        b.inflight if b.healthy else b.failures))
+
+    def call(self, fn: Callable[[str], Any], *, can_failover: Callable[[], bool] = lambda: True,
+             prefer: str | None = None) -> Any:
+        """Run fn(url) on the best backend; on failure try the next one while can_failover() allows it."""
+        last_exc: Exception | None = None
+        for backend in self._candidates(prefer):
+            with self._lock:
+                backend.inflight += 1
+            try:
+                return fn(backend.url)
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status is not None and status < 500:
+                    raise  # the request itself is bad; another node won't help
+                with self._lock:
+                    backend.healthy = False; backend.failures += 1; backend.last_error = str(e)
+                last_exc = e
+                if not can_failover():
+                    raise
+            finally:
+                with self._lock:
+                    backend.inflight -= 1
+        assert last_exc is not None
+        raise last_exc
+
+_pools: Dict[tuple, BackendPool] = {}
+_pools_lock = threading.Lock()
+
+def backend_pool(url: str) -> BackendPool:
+    """Shared pool for a URL or comma-separated URL list; health checks start on first use."""
+    urls = tuple(parse_backend_urls(url))
+    with _pools_lock:
+        pool = _pools.get(urls)
+        if pool is None:
+            pool = _pools[urls] = BackendPool(list(urls))
+    pool.start_health_checks()
+    return pool
+
+# ---------- Ollama bootstrap (Option A) ----------
+BOOTSTRAP_WAIT_S = float(os.environ.get("NACF_BOOTSTRAP_WAIT", "35"))  # total wait for the server to come up
+BOOTSTRAP_SERVE_AFTER_S = 2.0  # start `ollama serve` if the service hasn't answered by then
+BOOTSTRAP_POLL_S = 0.25
+
+class OllamaBootstrap:
+    """
+    Background state machine that brings Ollama up:
+    probe -> (install) -> start -> wait -> model -> (pull) -> ready | failed.
+
+    on_status(text) receives progress lines. ask(kind, title, message) -> bool handles user prompts
+    ("yesno", "info", "error"); both are called from the worker thread, so GUI callers must marshal them.
+    With a comma-separated URL list, any reachable backend counts; install/start only targets the first.
+    """
+
+    def __init__(self, url: str, model: str, *,
+                 on_status: Optional[Callable[[str], None]] = None,
+                 ask: Optional[Callable[[str, str, str], bool]] = None):
+        self.urls = parse_backend_urls(url)
+        self.url = self.urls[0]
+        self.model = model
+        self.client = ollama_client(self.url)
+        self.on_status = on_status or (lambda text: None)
+        self.ask = ask or (lambda kind, title, message: False)
+        self.tags: Dict[str, Any] | None = None
+        self.serve_proc: subprocess.Popen | None = None
+
+    def run(self) -> bool:
+        state = "probe"
+        while state not in ("ready", "failed"):
+            state = getattr(self, f"_step_{state}")()
+        return state == "ready"
+
+    def _probe(self, timeout: float = 1.5) -> bool:
         try:
-            subprocess.run(["cmd", "/c", f'ollama pull "{model}"'], check=True)
+            self.tags = self.client.get("/api/tags", timeout=timeout, retries=0).json()
+            return True
         except Exception:
-            messagebox.showerror("Model missing", f"Could not confirm or download model '{model}'.", parent=parent)
             return False
 
-    return True
+    def _step_probe(self) -> str:
+        self.on_status("Checking Ollama…")
+        if len(self.urls) > 1:
+            pool = backend_pool(",".join(self.urls))
+            pool.check_all()
+            up = [b for b in pool.backends if b.healthy]
+            if up:
+                self.url, self.client = up[0].url, up[0].client
+        if self._probe(timeout=2):
+            return "model"
+        return "start" if shutil.which("ollama") else "install"
+
+    def _step_install(self) -> str:
+        if not self.ask("yesno", "Ollama not found",
+                        "This app uses Ollama (local LLM runtime).\n\nInstall it now via winget? (Requires admin)"):
+            self.ask("info", "Installation required", "Please install Ollama and relaunch.\nhttps://ollama.com/download")
+            try: webbrowser.open("https://ollama.com/download")
+            except Exception: pass
+            return "failed"
+        self.on_status("Installing Ollama…")
+        cmd = [
+            "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass",
+            "Start-Process", "winget",
+            "-ArgumentList", '"install -e --id Ollama.Ollama --silent"',
+            "-Verb", "RunAs"
+        ]
+        try:
+            subprocess.run(" ".join(cmd), shell=True, check=True)
+        except Exception as e:
+            self.ask("error", "Install failed", f"Could not install Ollama:\n{e}")
+            return "failed"
+        return "start"
+
+    def _step_start(self) -> str:
+        self.on_status("Starting Ollama service…")
+        # Fire-and-forget: the wait step polls while the service spins up.
+        try:
+            subprocess.Popen(["sc", "start", "Ollama"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception:
+            pass
+        return "wait"
+
+    def _step_wait(self) -> str:
+        started = time.monotonic()
+        while time.monotonic() - started < BOOTSTRAP_WAIT_S:
+            if self._probe():
+                return "model"
+            if self.serve_proc is None and time.monotonic() - started >= BOOTSTRAP_SERVE_AFTER_S:
+                self.on_status("Launching `ollama serve`…")
+                try:
+                    self.serve_proc = subprocess.Popen(["ollama", "serve"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                except Exception:
+                    self.serve_proc = False  # don't retry
+            time.sleep(BOOTSTRAP_POLL_S)
+        self.ask("error", "Ollama unavailable", f"Could not reach Ollama at {self.url}.\nStart Ollama and try again.")
+        return "failed"
+
+    def _step_model(self) -> str:
+        self.on_status(f"Checking model '{self.model}'…")
+        if self.tags is None and not self._probe(timeout=5):
+            return "pull"
+        have = {m.get("name", "").split(":")[0] for m in (self.tags or {}).get("models", [])}
+        if self.model.split(":")[0] in have:
+            return "ready"
+        if self.ask("yesno", "Download model", f"Download '{self.model}' now? (one-time)"):
+            return "pull"
+        return "failed"
+
+    def _step_pull(self) -> str:
+        self.on_status(f"Downloading '{self.model}'…")
+        try:
+            with self.client.post("/api/pull", json={"model": self.model, "stream": True},
+                                  stream=True, timeout=(HTTP_CONNECT_TIMEOUT, None)) as resp:
+                resp.raise_for_status()
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise RuntimeError(chunk["error"])
+                    total, done = chunk.get("total"), chunk.get("completed")
+                    if total and done is not None:
+                        self.on_status(f"Downloading '{self.model}'… {100 * done // total}%")
+            return "ready"
+        except Exception:
+            pass
+        try:
+            subprocess.run(["cmd", "/c", f'ollama pull "{self.model}"'], check=True)
+            return "ready"
+        except Exception:
+            self.ask("error", "Model missing", f"Could not confirm or download model '{self.model}'.")
+            return "failed"
 
 # ---------- Helpers ----------
 def gen_company_name() -> str:
+    c = content()
+    adjectives, nouns, suffixes = c.adjectives, c.nouns, c.suffixes
     return random.choice([
-        f"{random.choice(ADJECTIVES)} {random.choice(NOUNS)} {random.choice(SUFFIXES)}",
-        f"{random.choice(ADJECTIVES)} {random.choice(NOUNS)} & Associates",
-        f"{random.choice(NOUNS)} of {random.choice(ADJECTIVES)} {random.choice(SUFFIXES)}",
-        f"{random.choice(ADJECTIVES)}-{random.choice(NOUNS)} {random.choice(SUFFIXES)}",
+        f"{random.choice(adjectives)} {random.choice(nouns)} {random.choice(suffixes)}",
+        f"{random.choice(adjectives)} {random.choice(nouns)} & Associates",
+        f"{random.choice(nouns)} of {random.choice(adjectives)} {random.choice(suffixes)}",
+        f"{random.choice(adjectives)}-{random.choice(nouns)} {random.choice(suffixes)}",
     ])
 
 def gen_manager_name() -> str:
-    return f"{random.choice(MANAGER_FIRST)} {random.choice(MANAGER_LAST)}"
+    c = content()
+    return f"{random.choice(c.manager_first)} {random.choice(c.manager_last)}"
 
-def build_critique_prompt(company: str, manager: str, question: str, answer: str) -> str:
-    persona = f"""
+def pick_questions(n: int = NUM_QUESTIONS_PER_INTERVIEW, *, candidate: str | None = None, pack: str | None = None,
+                   theme: List[str] | None = None, ramp: tuple | None = None) -> List[str]:
+    """
+    n distinct, non-near-duplicate questions; see select_questions() for pack, theme and ramp. With a
+    candidate, questions they were already asked are skipped (persisted per candidate) until the pool
+    runs dry.
+    """
+    index = content().questions
+    span = index.packs[pack] if pack else None
+    theme = [t.strip().casefold() for t in theme or () if t.strip()]
+    if candidate is None:
+        return [index[i] for i in select_questions(index, n, SeenSet(None, len(index), ""), span=span,
+                                                   theme=theme, ramp=ramp)]
+    with _seen_lock:
+        seen = SeenSet(seen_path(candidate), len(index), index.meta["fingerprint"])
+        picked = select_questions(index, n, seen, span=span, theme=theme, ramp=ramp)
+        try:
+            seen.save()
+        except OSError:
+            pass  # read-only cache: repeats become possible, nothing else breaks
+    return [index[i] for i in picked]
+
+def parse_ramp(text: str) -> tuple | None:
+    """'1-3' -> (1, 3): difficulty of the first and last question; None unless both are 1..3."""
+    m = re.fullmatch(r"\s*(\d+)\s*(?:-\s*(\d+))?\s*", text or "")
+    ramp = (int(m.group(1)), int(m.group(2) or m.group(1))) if m else None
+    return ramp if ramp and all(1 <= level <= 3 for level in ramp) else None
+
+def rejection_reason() -> str:
+    return random.choice(content().rejections)
+
+def build_persona_prompt(company: str, manager: str) -> str:
+    return f"""
 You are {manager}, the unapologetically chaotic Hiring Manager at {company}.
 Your style is razor-witty, corporate-feral, and a little unhinged, but not hateful or discriminatory.
 Speak like a jaded executive life coach who lives inside a slide deck.
 Keep responses SHORT: 1–3 punchy sentences max. Address the candidate directly.
 """.strip()
+
+CRITIQUE_RULES = """
+- Be funny, specific, and cutting, like performance feedback written on a sticky note at 2am.
+- Avoid slurs or anything targeting protected classes.
+- No markdown, no lists, just prose (1–3 sentences).
+""".strip()
+FALLBACK_CRITIQUE = "I’ve seen stronger convictions in a lukewarm decaf. Next."  # when the model returns nothing
+
+def build_critique_prompt(company: str, manager: str, question: str, answer: str) -> str:
     task = f"""
 QUESTION: {question}
 CANDIDATE_ANSWER: {answer}
 TASK: Deliver a bespoke critique of the candidate's answer in the context of the question.
-- Be funny, specific, and cutting, like performance feedback written on a sticky note at 2am.
-- Avoid slurs or anything targeting protected classes.
-- No markdown, no lists, just prose (1–3 sentences).
+{CRITIQUE_RULES}
+""".strip()
+    return build_persona_prompt(company, manager) + "\n\n" + task
+
+class Conversation:
+    """
+    Interview-scoped /api/chat history. The persona and rules go out once as the system message and each
+    answer is a short user turn, so Ollama can reuse the evaluated prefix and only process the new Q&A
+    (and the manager can call back to earlier answers for free).
+    """
+
+    def __init__(self, company: str, manager: str, *, max_turns: int = CHAT_HISTORY_TURNS):
+        system = (build_persona_prompt(company, manager) +
+                  "\n\nEach message gives you an interview QUESTION and the CANDIDATE_ANSWER. Reply with a bespoke "
+                  "critique of that answer; feel free to call back to the candidate's earlier answers.\n" + CRITIQUE_RULES)
+        self.company, self.manager = company, manager
+        self.system = {"role": "system", "content": system}
+        self.turns: List[Dict[str, str]] = []
+        self.max_turns = max_turns
+        self.backend_url: str | None = None  # stick to one backend so its prompt cache stays warm
+
+    @staticmethod
+    def user_message(question: str, answer: str) -> Dict[str, str]:
+        return {"role": "user", "content": f"QUESTION: {question}\nCANDIDATE_ANSWER: {answer}"}
+
+    def messages_for(self, question: str, answer: str) -> List[Dict[str, str]]:
+        return [self.system, *self.turns, self.user_message(question, answer)]
+
+    def record(self, question: str, answer: str, critique: str):
+        self.turns += [self.user_message(question, answer), {"role": "assistant", "content": critique}]
+        del self.turns[:-2 * self.max_turns]
+
+    def decision_messages(self) -> List[Dict[str, str]]:
+        return [self.system, *self.turns, {"role": "user", "content": DECISION_TASK}]
+
+DECISION_TASK = """
+The interview is over. Write the candidate's rejection letter: 2–3 sentences, addressed to them, rejecting
+them for an absurd, oddly specific reason that calls back to at least one of their answers.
+No markdown, no sign-off, just prose.
 """.strip()
-    return persona + "\n\n" + task
 
-def ollama_generate(prompt: str, *, model: str, url: str) -> str:
-    endpoint = f"{url}/api/generate"
-    payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": False,
-                               "options": {"temperature": 0.9, "top_p": 0.95, "repeat_penalty": 1.1, "num_predict": 160}}
-    resp = requests.post(endpoint, json=payload, timeout=120)
+def build_decision_prompt(company: str, manager: str, transcript: List[Dict[str, str]]) -> str:
+    answers = "\n".join(f"Q: {t['question']}\nA: {t['answer']}" for t in transcript)
+    return build_persona_prompt(company, manager) + f"\n\nINTERVIEW SO FAR:\n{answers}\n\n" + DECISION_TASK
+
+def _keep_alive_value(keep_alive: str) -> Any:
+    """Ollama takes seconds as a number or a duration string; bare numbers must be sent as numbers."""
+    try:
+        return int(keep_alive)
+    except ValueError:
+        return keep_alive
+
+def ollama_warmup(*, model: str, url: str, keep_alive: str = KEEP_ALIVE) -> bool:
+    """
+    Load the model into memory (an empty prompt generates nothing) so the first critique isn't a cold start.
+    Every backend of a comma-separated URL list is warmed; True if any of them loaded it.
+    """
+    loaded = False
+    for backend_url in parse_backend_urls(url):
+        try:
+            resp = ollama_client(backend_url).post("/api/generate", json={"model": model, "prompt": "", "stream": False,
+                                                                          "keep_alive": _keep_alive_value(keep_alive)})
+            resp.raise_for_status()
+            loaded = True
+        except Exception:
+            pass
+        if SEMANTIC_CACHE and CRITIQUE_CACHE:
+            try:
+                ollama_embed("", model=EMBED_MODEL, url=backend_url)
+            except Exception:
+                pass  # no embedding model: the semantic cache stays off, see embed_answer
+    return loaded
+
+class Cancelled(Exception):
+    """The request was superseded; its result must be dropped."""
+
+class CancelToken:
+    """
+    Cancels one in-flight request from another thread. Closing the attached streaming response drops
+    the connection, which makes Ollama stop generating instead of finishing a critique nobody will read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._resp: requests.Response | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            resp, self._resp = self._resp, None
+        if resp is not None:
+            try: resp.close()
+            except Exception: pass
+
+    def attach(self, resp: requests.Response):
+        with self._lock:
+            if not self._cancelled:
+                self._resp = resp
+                return
+        resp.close()
+        raise Cancelled()
+
+    def raise_if_cancelled(self):
+        if self._cancelled:
+            raise Cancelled()
+
+_ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "e.g.", "i.e."}
+_MARKDOWN_LINE = re.compile(r"^\s*(?:[-*+•]|\d{1,2}[.)]|#{1,6}|>)\s+")
+_MARKDOWN_LINK = re.compile(r"\[(?=\S)|\]\([^)\s]*\)")  # [text](url) -> text, word by word
+_MARKDOWN_INLINE = re.compile(r"[*`]+|~~|(?<!\w)_+|_+(?!\w)")
+_SENTENCE_END = re.compile(r"\w(?:[!?]+|[.!?]*[!?]|\.)[\"'”’)\]]*$")  # not "..." or "…": those trail off
+
+class ProseFilter:
+    """
+    Streaming clean-up of a reply: drops the markdown the prompt forbids (list markers, headings, quotes,
+    emphasis, code ticks, links) and line breaks, and reports done once max_sentences sentences are out
+    (0 = no limit). Words are released once the whitespace after them arrives, so markup split across
+    tokens is still caught.
+    """
+
+    def __init__(self, max_sentences: int = REPLY_MAX_SENTENCES):
+        self.max_sentences = max_sentences
+        self.sentences = 0
+        self.done = False
+        self._pending = ""
+        self._line_start = True
+        self._started = False
+
+    def feed(self, piece: str) -> str:
+        if self.done:
+            return ""
+        self._pending += piece
+        cut = max(self._pending.rfind(c) for c in " \n\t")
+        if cut < 0:
+            return ""
+        ready, self._pending = self._pending[:cut + 1], self._pending[cut + 1:]
+        return self._words(ready)
+
+    def flush(self) -> str:
+        """Whatever is still held back, at the end of the reply."""
+        ready, self._pending = self._pending, ""
+        return "" if self.done else self._words(ready)
+
+    def clean(self, text: str) -> str:
+        return (self.feed(text) + self.flush()).strip()
+
+    def _words(self, text: str) -> str:
+        out: List[str] = []
+        for n, line in enumerate(text.split("\n")):
+            if n: self._line_start = True
+            if not line.strip():
+                continue
+            if self._line_start:
+                line, self._line_start = _MARKDOWN_LINE.sub("", line), False
+            line = _MARKDOWN_INLINE.sub("", _MARKDOWN_LINK.sub("", line))
+            for word in line.split():
+                out.append(" " + word if self._started else word)
+                self._started = True
+                if _SENTENCE_END.search(word) and word.casefold() not in _ABBREVIATIONS:
+                    self.sentences += 1
+                    if self.sentences == self.max_sentences:
+                        self.done = True
+                        return "".join(out)
+        return "".join(out)
+
+class ReplyReader:
+    """
+    Turns Ollama reply chunks into the text to show, for the requests and asyncio clients alike: error
+    chunks raise, text goes through a ProseFilter when max_sentences is set, and a trace gets first_token,
+    last_byte and Ollama's final stats. After feed(), stop is set once enough sentences are out; the
+    caller then closes the stream (see CancelToken). whole() handles a non-streaming reply.
+    """
+
+    def __init__(self, text_of: Callable[[Dict[str, Any]], str], *, max_sentences: int | None = None,
+                 trace: Trace | None = None):
+        self.text_of, self.trace = text_of, trace
+        self.prose = ProseFilter(max_sentences) if max_sentences is not None else None
+        self.parts: List[str] = []
+        self.received = 0
+        self.stop = False
+
+    def feed(self, chunk: Dict[str, Any]) -> str:
+        if chunk.get("error"):
+            raise RuntimeError(chunk["error"])
+        piece = self.text_of(chunk)
+        self.received += bool(piece)
+        if self.prose:
+            piece = self.prose.feed(piece) + (self.prose.flush() if chunk.get("done") else "")
+        if piece:
+            if self.trace: self.trace.mark("first_token")
+            self.parts.append(piece)
+        if chunk.get("done"):
+            self._end(chunk)
+        elif self.prose and self.prose.done:
+            METRICS.inc("nacf_early_stops_total")
+            self._end({"eval_count": self.received, "done_reason": "sentences"})
+            self.stop = True
+        return piece
+
+    def whole(self, reply: Dict[str, Any]) -> str:
+        self._end(reply)
+        text = self.text_of(reply)
+        return self.prose.clean(text) if self.prose else text.strip()
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts).strip()
+
+    def _end(self, stats: Dict[str, Any]):
+        if self.trace:
+            self.trace.mark("last_byte"); self.trace.ollama = stats
+
+def _ollama_call(path: str, payload: Dict[str, Any], text_of: Callable[[Dict[str, Any]], str], *, url: str,
+                 on_token: Optional[Callable[[str], None]], cancel: CancelToken | None, trace: Trace | None,
+                 options: Dict[str, Any] | None = None, max_sentences: int | None = None) -> str:
+    """Shared request/stream loop for /api/generate and /api/chat."""
+    client = ollama_client(url)
+    stream = on_token is not None or cancel is not None
+    payload = {**payload, "stream": stream, "keep_alive": _keep_alive_value(KEEP_ALIVE),
+               "options": dict(options or GENERATION_OPTIONS)}
+    reader = ReplyReader(text_of, max_sentences=max_sentences, trace=trace)
+    if not stream:
+        resp = client.post(path, json=payload)
+        resp.raise_for_status()
+        if trace: trace.mark("headers")
+        return reader.whole(resp.json())
+
+    with client.post(path, json=payload, stream=True) as resp:
+        if trace: trace.mark("headers")
+        if cancel: cancel.attach(resp)
+        resp.raise_for_status()
+        try:
+            for line in resp.iter_lines():
+                if cancel: cancel.raise_if_cancelled()
+                if not line:
+                    continue
+                piece = reader.feed(json.loads(line))
+                if piece and on_token: on_token(piece)
+                if reader.stop:
+                    break
+        except Exception:
+            if cancel: cancel.raise_if_cancelled()  # reading a closed response fails in assorted ways
+            raise
+    return reader.text
+
+def ollama_generate(prompt: str, *, model: str, url: str,
+                    on_token: Optional[Callable[[str], None]] = None,
+                    cancel: CancelToken | None = None, trace: Trace | None = None,
+                    options: Dict[str, Any] | None = None, max_sentences: int | None = None) -> str:
+    """
+    Run a completion. With on_token, stream NDJSON chunks and report each piece as it arrives.
+    A cancel token also forces streaming, so the request can be aborted mid-generation (raises Cancelled).
+    A trace gets the headers/first_token/last_byte marks and Ollama's timing fields.
+    options replaces GENERATION_OPTIONS for this call. With max_sentences the reply goes through a
+    ProseFilter, and a stream is closed as soon as that many sentences are out.
+    """
+    return _ollama_call("/api/generate", {"model": model, "prompt": prompt}, lambda c: c.get("response") or "",
+                        url=url, on_token=on_token, cancel=cancel, trace=trace, options=options,
+                        max_sentences=max_sentences)
+
+def ollama_chat(messages: List[Dict[str, str]], *, model: str, url: str,
+                on_token: Optional[Callable[[str], None]] = None,
+                cancel: CancelToken | None = None, trace: Trace | None = None,
+                options: Dict[str, Any] | None = None, max_sentences: int | None = None) -> str:
+    """Like ollama_generate, but for a chat history (/api/chat); returns the assistant's reply."""
+    return _ollama_call("/api/chat", {"model": model, "messages": messages},
+                        lambda c: (c.get("message") or {}).get("content") or "",
+                        url=url, on_token=on_token, cancel=cancel, trace=trace, options=options,
+                        max_sentences=max_sentences)
+
+class GenerationBudget:
+    """
+    Chooses num_predict for each critique. Short answers get a smaller share of the configured ceiling,
+    and the budget never exceeds what the measured token rate produces within the SLO after the usual
+    time to first token. A scale factor shrinks every budget while the p95 of recent critique latencies is
+    over the SLO, and grows back once p95 is well under it and nothing else is generating. Each
+    adjustment clears the latency window, so the next one waits for fresh samples.
+    """
+
+    def __init__(self, slo_s: float = LATENCY_SLO_S, *, ceiling: int | None = None, floor: int = MIN_PREDICT,
+                 window: int = 32, min_samples: int = 8):
+        self.slo_s = slo_s
+        self.ceiling = ceiling or int(GENERATION_OPTIONS.get("num_predict") or 160)
+        self.floor = min(floor, self.ceiling)
+        self.min_samples = min_samples
+        self.scale = 1.0
+        self.tokens_per_s = self.first_token_s = 0.0  # moving averages
+        self.inflight = 0
+        self.latencies: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def wanted(self, answer: str) -> int:
+        """num_predict for this answer with no latency pressure: its share of the ceiling."""
+        return min(self.ceiling, 64 + 4 * len(answer.split()))
+
+    def tokens_for(self, answer: str) -> int:
+        wanted = self.wanted(answer)
+        if not self.slo_s:
+            return self.ceiling
+        with self._lock:
+            budget = wanted * self.scale
+            if self.tokens_per_s:
+                budget = min(budget, self.tokens_per_s * max(self.slo_s - self.first_token_s, 0.0))
+        return max(self.floor, int(budget))
+
+    def start(self, answer: str) -> Dict[str, Any]:
+        """Options for one critique; pair with finish()."""
+        num_predict = self.tokens_for(answer)
+        with self._lock:
+            self.inflight += 1
+        METRICS.observe("nacf_generation_budget_tokens", num_predict, buckets=(32, 48, 64, 96, 128, 160, 256))
+        return {**GENERATION_OPTIONS, "num_predict": num_predict, "stop": CRITIQUE_STOP}
+
+    def trimmed(self, answer: str, options: Dict[str, Any]) -> bool:
+        """Whether options cut this answer's critique short to hold the SLO; such critiques aren't cached."""
+        return options["num_predict"] < self.wanted(answer)
+
+    @contextmanager
+    def generation(self, answer: str, trace: Trace):
+        """start() for the block, then finish() with the trace, or with None if the block raised."""
+        options = self.start(answer)
+        try:
+            yield options
+        except BaseException:
+            self.finish(None)
+            raise
+        self.finish(trace)
+
+    def finish(self, trace: Trace | None):
+        """Learn from a finished critique's trace (None if it failed or was cancelled)."""
+        with self._lock:
+            self.inflight -= 1
+            if trace is None or "last_byte" not in trace.marks:
+                return
+            marks, o = trace.marks, trace.ollama
+            tokens = o.get("eval_count", 0)
+            generating = o.get("eval_duration", 0) / 1e9 or marks["last_byte"] - marks.get("first_token", marks["last_byte"])
+            if tokens and generating > 0:
+                self.tokens_per_s = _ewma(self.tokens_per_s, tokens / generating)
+            if "first_token" in marks:
+                self.first_token_s = _ewma(self.first_token_s, marks["first_token"] - marks.get("prompt_built", 0.0))
+            if not self.slo_s:
+                return
+            self.latencies.append(marks["last_byte"])
+            if len(self.latencies) < self.min_samples:
+                return
+            p95 = sorted(self.latencies)[int(0.95 * (len(self.latencies) - 1))]
+            if p95 > self.slo_s:
+                self.scale = max(0.25, self.scale * 0.8)
+            elif p95 < 0.7 * self.slo_s and self.scale < 1.0 and not self.inflight:
+                self.scale = min(1.0, self.scale + 0.1)
+            else:
+                return
+            self.latencies.clear()
+            scale = self.scale
+        METRICS.set("nacf_generation_budget_scale", scale)
+
+def _ewma(average: float, sample: float, weight: float = 0.2) -> float:
+    return sample if not average else average + weight * (sample - average)
+
+GENERATION_BUDGET = GenerationBudget()
+
+def ollama_embed(text: str, *, model: str, url: str) -> List[float]:
+    """Embedding vector for text (/api/embeddings). Never retried: it sits in front of every cache miss."""
+    resp = ollama_client(url).post("/api/embeddings", retries=0, timeout=(HTTP_CONNECT_TIMEOUT, EMBED_TIMEOUT_S),
+                                   json={"model": model, "prompt": text, "keep_alive": _keep_alive_value(KEEP_ALIVE)})
     resp.raise_for_status()
-    data = resp.json()
-    return (data.get("response") or "").strip()
+    return resp.json()["embedding"]
+
+# ---------- Critique cache ----------
+def normalize_answer(answer: str) -> str:
+    """Fold case, punctuation and whitespace so "IDK!!" and "idk" share a cache entry."""
+    text = unicodedata.normalize("NFKC", answer).casefold()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+class CritiqueCache:
+    """
+    SQLite cache in front of the model, keyed by (model, options, question, normalized answer).
+    Each key is served once it has seen `variants` generations, then returns one of its distinct critiques
+    at random; a repeated critique counts every time, so a repetitive model still gets hits. Rows expire
+    after ttl_s and the least recently used rows are evicted beyond max_entries. With the semantic
+    cache on, an answer that embeds close to critiqued ones is served from their pooled critiques.
+    """
+    _COMPANY, _MANAGER = "\x00company\x00", "\x00manager\x00"
+
+    def __init__(self, path: str, *, variants: int = CACHE_VARIANTS,
+                 max_entries: int = CACHE_MAX_ENTRIES, ttl_s: float = CACHE_TTL_S):
+        self.variants, self.max_entries, self.ttl_s = variants, max_entries, ttl_s
+        self.hits = self.near_hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS critiques (
+            key TEXT NOT NULL, critique TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL,
+            generations INTEGER NOT NULL DEFAULT 1, PRIMARY KEY (key, critique))""")
+        if "generations" not in {row[1] for row in self._db.execute("PRAGMA table_info(critiques)")}:
+            self._db.execute("ALTER TABLE critiques ADD COLUMN generations INTEGER NOT NULL DEFAULT 1")
+        self._db.execute("CREATE INDEX IF NOT EXISTS critiques_lru ON critiques (last_used)")
+        self._db.execute("DELETE FROM critiques WHERE created < ?", (time.time() - ttl_s,))
+        self.semantic = SemanticIndex(self._db, self._lock) if SEMANTIC_CACHE else None
+
+    @staticmethod
+    def key(model: str, options: Dict[str, Any], question: str, answer: str) -> str:
+        raw = json.dumps([model, options, question, normalize_answer(answer)], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, *, company: str = "", manager: str = "") -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            rows = self._db.execute("SELECT critique, generations FROM critiques WHERE key = ? AND created >= ?",
+                                    (key, now - self.ttl_s)).fetchall()
+            if sum(n for _, n in rows) < self.variants:
+                return None
+            critique = random.choice(rows)[0]
+            self._db.execute("UPDATE critiques SET last_used = ? WHERE key = ? AND critique = ?", (now, key, critique))
+        # Critiques are stored with the interview's names templated out
+        return critique.replace(self._COMPANY, company).replace(self._MANAGER, manager)
+
+    def put(self, key: str, critique: str, *, company: str = "", manager: str = ""):
+        if company: critique = critique.replace(company, self._COMPANY)
+        if manager: critique = critique.replace(manager, self._MANAGER)
+        now = time.time()
+        with self._lock:
+            self._db.execute("INSERT INTO critiques (key, critique, created, last_used) VALUES (?, ?, ?, ?) "
+                             "ON CONFLICT (key, critique) DO UPDATE SET generations = generations + 1", (key, critique, now, now))
+            excess = self._db.execute("SELECT COUNT(*) FROM critiques").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._db.execute("DELETE FROM critiques WHERE rowid IN "
+                                 "(SELECT rowid FROM critiques ORDER BY last_used LIMIT ?)", (excess,))
+
+    def get_any(self, keys: List[str], *, company: str = "", manager: str = "") -> Optional[str]:
+        """Like get, but pooling the critiques of several keys (near-duplicate answers)."""
+        if not keys:
+            return None
+        now = time.time()
+        marks = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._db.execute(f"SELECT key, critique, generations FROM critiques WHERE key IN ({marks}) "
+                                    "AND created >= ?", (*keys, now - self.ttl_s)).fetchall()
+            if sum(n for *_, n in rows) < self.variants:
+                return None
+            key, critique, _ = random.choice(rows)
+            self._db.execute("UPDATE critiques SET last_used = ? WHERE key = ? AND critique = ?", (now, key, critique))
+        return critique.replace(self._COMPANY, company).replace(self._MANAGER, manager)
+
+    def count(self, result: str):
+        """Tally one lookup as "hit", "near" or "miss"."""
+        with self._lock:
+            self.hits += result == "hit"; self.near_hits += result == "near"; self.misses += result == "miss"
+        METRICS.inc("nacf_cache_requests_total", result=result)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = self._db.execute("SELECT COUNT(*) FROM critiques").fetchone()[0]
+        return {"hits": self.hits, "near_hits": self.near_hits, "misses": self.misses, "entries": size,
+                **({"vectors": self.semantic.size()} if self.semantic else {})}
+
+def unit_vector(values: List[float]) -> array:
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return array("f", (v / norm for v in values))
+
+class SemanticIndex:
+    """
+    Unit embedding vectors of critiqued answers, one bucket per (model, options, question), stored next
+    to the critiques and loaded into memory a question at a time. similar() is a linear scan of the
+    bucket: at most `per_question` vectors, the least recently matched evicted first; `max_entries`
+    bounds the table and `resident` the buckets kept in memory.
+    """
+
+    def __init__(self, db, lock: threading.Lock, *, threshold: float = SEMANTIC_THRESHOLD,
+                 per_question: int = SEMANTIC_MAX_PER_QUESTION, max_entries: int = CACHE_MAX_ENTRIES,
+                 resident: int = 64):
+        self.threshold, self.per_question, self.max_entries, self.resident = threshold, per_question, max_entries, resident
+        self._db, self._lock = db, lock
+        self._buckets: "OrderedDict[str, Dict[str, array]]" = OrderedDict()
+        db.execute("""CREATE TABLE IF NOT EXISTS answer_vectors (
+            bucket TEXT NOT NULL, key TEXT NOT NULL, vector BLOB NOT NULL, last_used REAL NOT NULL,
+            PRIMARY KEY (bucket, key))""")
+        db.execute("CREATE INDEX IF NOT EXISTS answer_vectors_lru ON answer_vectors (last_used)")
+
+    @staticmethod
+    def bucket_key(model: str, options: Dict[str, Any], question: str, embed_model: str = EMBED_MODEL) -> str:
+        raw = json.dumps([model, options, question, embed_model], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _bucket(self, bucket: str) -> Dict[str, array]:
+        vectors = self._buckets.get(bucket)
+        if vectors is None:
+            vectors = {}
+            for key, blob in self._db.execute("SELECT key, vector FROM answer_vectors WHERE bucket = ?", (bucket,)):
+                vectors[key] = array("f"); vectors[key].frombytes(blob)
+            self._buckets[bucket] = vectors
+            while len(self._buckets) > self.resident:
+                self._buckets.popitem(last=False)
+        self._buckets.move_to_end(bucket)
+        return vectors
+
+    def vector(self, bucket: str, key: str) -> array | None:
+        """The stored vector of an answer seen before, so repeats skip the embedding call."""
+        with self._lock:
+            return self._bucket(bucket).get(key)
+
+    def similar(self, bucket: str, vector: array, *, limit: int = 8) -> List[str]:
+        """Cache keys of the answers within threshold cosine similarity, closest first."""
+        with self._lock:
+            candidates = list(self._bucket(bucket).items())
+        # ~10 ms for a full bucket of 768-d vectors; scored outside the lock the cache shares
+        scored = sorted(((sum(map(operator.mul, vector, other)), key) for key, other in candidates), reverse=True)
+        keys = [key for score, key in scored[:limit] if score >= self.threshold]
+        if keys:
+            with self._lock:
+                self._db.execute(f"UPDATE answer_vectors SET last_used = ? WHERE bucket = ? AND key IN "
+                                 f"({','.join('?' * len(keys))})", (time.time(), bucket, *keys))
+        return keys
+
+    def add(self, bucket: str, key: str, vector: array):
+        with self._lock:
+            vectors = self._bucket(bucket)
+            vectors[key] = vector
+            self._db.execute("INSERT OR REPLACE INTO answer_vectors VALUES (?, ?, ?, ?)",
+                             (bucket, key, vector.tobytes(), time.time()))
+            if len(vectors) > self.per_question:
+                for (old,) in self._db.execute(
+                        "SELECT key FROM answer_vectors WHERE bucket = ? ORDER BY last_used LIMIT ?",
+                        (bucket, len(vectors) - self.per_question)).fetchall():
+                    vectors.pop(old, None)
+                    self._db.execute("DELETE FROM answer_vectors WHERE bucket = ? AND key = ?", (bucket, old))
+            excess = self._db.execute("SELECT COUNT(*) FROM answer_vectors").fetchone()[0] - self.max_entries
+            if excess > 0:
+                evicted = self._db.execute("SELECT bucket, key FROM answer_vectors ORDER BY last_used LIMIT ?",
+                                           (excess,)).fetchall()
+                self._db.executemany("DELETE FROM answer_vectors WHERE bucket = ? AND key = ?", evicted)
+                for old_bucket, old in evicted:
+                    self._buckets.get(old_bucket, {}).pop(old, None)
+
+    def size(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM answer_vectors").fetchone()[0]
+
+_embed_retry_at = 0.0
+
+def embedding_available() -> bool:
+    return SEMANTIC_CACHE and time.monotonic() >= _embed_retry_at
+
+def embedding_failed():
+    """Back off from the semantic cache for a while instead of paying a failing call on every answer."""
+    global _embed_retry_at
+    _embed_retry_at = time.monotonic() + EMBED_RETRY_S
+    METRICS.inc("nacf_embed_errors_total")
+
+def embed_answer(answer: str, embed: Callable[[str], List[float]]) -> array | None:
+    """Unit embedding of the normalized answer, or None while the semantic cache is off or unavailable."""
+    if not embedding_available():
+        return None
+    try:
+        values = embed(normalize_answer(answer))
+    except Exception:
+        embedding_failed()
+        return None
+    return unit_vector(values) if values else None
+
+class CachedAnswer:
+    """
+    One answer's trip through the critique cache, for generate_critique and the async sessions alike:
+    lookup() tries the exact key, then near-duplicate answers; store() files a freshly generated critique
+    along with the answer's embedding. embed(text) returns a raw embedding and runs only on a miss.
+    """
+
+    def __init__(self, cache: CritiqueCache, model: str, question: str, answer: str, *,
+                 embed: Callable[[str], List[float]]):
+        self.cache, self.answer, self.embed = cache, answer, embed
+        # Keyed on GENERATION_OPTIONS, not the budgeted ones: critiques cut short under load are never stored
+        self.key = CritiqueCache.key(model, GENERATION_OPTIONS, question, answer)
+        self.bucket = SemanticIndex.bucket_key(model, GENERATION_OPTIONS, question) if cache.semantic else ""
+        self.vector: array | None = None
+
+    def lookup(self, *, company: str = "", manager: str = "") -> Optional[str]:
+        cache = self.cache
+        cached = cache.get(self.key, company=company, manager=manager)
+        result = "hit" if cached else "miss"
+        if not cached and cache.semantic:
+            self.vector = cache.semantic.vector(self.bucket, self.key) or embed_answer(self.answer, self.embed)
+            if self.vector is not None:
+                cached = cache.get_any(cache.semantic.similar(self.bucket, self.vector), company=company, manager=manager)
+                result = "near" if cached else "miss"
+        cache.count(result)
+        return cached
+
+    def store(self, critique: str, *, company: str = "", manager: str = ""):
+        self.cache.put(self.key, critique, company=company, manager=manager)
+        if self.vector is not None:
+            self.cache.semantic.add(self.bucket, self.key, self.vector)
+
+_critique_cache: CritiqueCache | None = None
+_critique_cache_lock = threading.Lock()
+
+def critique_cache() -> CritiqueCache | None:
+    """Shared on-disk cache, or None when disabled (NACF_CACHE=0) or the file can't be opened."""
+    global _critique_cache
+    if not CRITIQUE_CACHE:
+        return None
+    with _critique_cache_lock:
+        if _critique_cache is None:
+            try:
+                _critique_cache = CritiqueCache(cache_path("critiques.sqlite3"))
+            except (OSError, sqlite3.Error):
+                return None
+        return _critique_cache
+
+def generate_critique(company: str, manager: str, question: str, answer: str, *, model: str, url: str,
+                      on_token: Optional[Callable[[str], None]] = None,
+                      cancel: CancelToken | None = None, trace: Trace | None = None,
+                      conversation: Conversation | None = None, interactive: bool = True) -> str:
+    """
+    Critique one answer: serve it from the cache when possible, otherwise ask the model and remember it.
+    With a conversation, the answer goes out as the next /api/chat turn and the reply is added to it;
+    only first-turn chat replies are cached, the later ones may refer to the candidate's other answers.
+    interactive=False (batch runs) skips GENERATION_BUDGET: nobody is waiting, so critiques get full length.
+    Raises Cancelled if the cancel token fires first. Pass a trace to add marks (e.g. ui_applied) and
+    finish it yourself; without one, the call records its own timings.
+    """
+    owned = trace is None
+    trace = trace or Trace()
+    trace.mark("started")
+    cache = critique_cache()
+    entry = cache and CachedAnswer(cache, model, question, answer, embed=lambda text: backend_pool(url).call(
+        lambda backend_url: ollama_embed(text, model=EMBED_MODEL, url=backend_url)))
+    if entry:
+        cached = entry.lookup(company=company, manager=manager)
+        if cached:
+            trace.source = "cache"
+            if conversation: conversation.record(question, answer, cached)
+            if owned: trace.finish()
+            return cached
+    streamed = [False]
+    def relay(piece: str):
+        streamed[0] = True
+        on_token(piece)
+
+    shareable = not (conversation and conversation.turns)
+    if conversation:
+        messages = conversation.messages_for(question, answer)
+        trace.mark("prompt_built")
+        def run(backend_url: str) -> str:
+            conversation.backend_url = backend_url
+            return ollama_chat(messages, model=model, url=backend_url, options=options, max_sentences=REPLY_MAX_SENTENCES,
+                               on_token=relay if on_token else None, cancel=cancel, trace=trace)
+    else:
+        prompt = build_critique_prompt(company, manager, question, answer)
+        trace.mark("prompt_built")
+        def run(backend_url: str) -> str:
+            return ollama_generate(prompt, model=model, url=backend_url, options=options,
+                                   max_sentences=REPLY_MAX_SENTENCES,
+                                   on_token=relay if on_token else None, cancel=cancel, trace=trace)
+
+    # Fail over to another backend only while nothing has been shown to the candidate yet
+    budget = GENERATION_BUDGET.generation(answer, trace) if interactive else \
+        nullcontext({**GENERATION_OPTIONS, "stop": CRITIQUE_STOP})
+    with budget as options:
+        critique = backend_pool(url).call(run, can_failover=lambda: not streamed[0] and not (cancel and cancel.cancelled),
+                                          prefer=conversation.backend_url if conversation else None)
+    shareable = shareable and not GENERATION_BUDGET.trimmed(answer, options)
+    if conversation and critique:
+        conversation.record(question, answer, critique)
+    if entry and critique and shareable:
+        entry.store(critique, company=company, manager=manager)
+    if owned: trace.finish()
+    return critique
+
+def generate_decision(company: str, manager: str, transcript: List[Dict[str, str]], *, model: str, url: str,
+                      messages: List[Dict[str, str]] | None = None, cancel: CancelToken | None = None) -> str:
+    """Personalized rejection letter. Pass a Conversation's decision_messages() to reuse its chat prefix."""
+    def run(backend_url: str) -> str:
+        if messages:
+            return ollama_chat(messages, model=model, url=backend_url, cancel=cancel, max_sentences=REPLY_MAX_SENTENCES)
+        return ollama_generate(build_decision_prompt(company, manager, transcript),
+                               model=model, url=backend_url, cancel=cancel, max_sentences=REPLY_MAX_SENTENCES)
+    return backend_pool(url).call(run, can_failover=lambda: not (cancel and cancel.cancelled))
+
+# ---------- Work queue ----------
+PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND = 0, 1
+_PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+class QueueFull(Exception):
+    pass
+
+class WorkItem:
+    def __init__(self, fn: Callable[[], None], priority: int, key: str | None):
+        self.fn, self.priority, self.key = fn, priority, key
+        self.enqueued = time.monotonic()
+        self.dropped = False
+
+class WorkQueue:
+    """
+    Fixed pool of worker threads over a bounded priority queue, so one process never has more than
+    `workers` requests on Ollama at once. Interactive items always run before background ones, and with
+    two or more workers background work never takes the last one; a single worker is shared (background
+    items then run whenever nothing interactive is waiting). Backpressure: an item with a key replaces the
+    pending item with the same key; when full, an interactive item evicts the newest pending background
+    item, otherwise submit() raises QueueFull.
+    """
+
+    def __init__(self, workers: int = WORKERS, max_size: int = WORK_QUEUE_SIZE, metrics: Metrics = METRICS):
+        self.workers, self.max_size, self.metrics = max(1, workers), max(1, max_size), metrics
+        self._cond = threading.Condition()
+        self._pending: List[WorkItem] = []
+        self._running_background = 0
+        for i in range(self.workers):
+            threading.Thread(target=self._loop, name=f"nacf-worker-{i}", daemon=True).start()
+
+    def submit(self, fn: Callable[[], None], *, priority: int = PRIORITY_BACKGROUND, key: str | None = None) -> WorkItem:
+        item = WorkItem(fn, priority, key)
+        with self._cond:
+            if key is not None:
+                for old in [p for p in self._pending if p.key == key]:
+                    self._pending.remove(old); old.dropped = True
+                    self.metrics.inc("nacf_queue_coalesced_total", priority=_PRIORITY_NAMES[old.priority])
+            if len(self._pending) >= self.max_size:
+                victims = [p for p in self._pending if p.priority > priority]
+                if not victims:
+                    self.metrics.inc("nacf_queue_rejected_total", priority=_PRIORITY_NAMES[priority])
+                    raise QueueFull(f"{len(self._pending)} requests already waiting")
+                victim = max(victims, key=lambda p: (p.priority, p.enqueued))
+                self._pending.remove(victim); victim.dropped = True
+                self.metrics.inc("nacf_queue_dropped_total", priority=_PRIORITY_NAMES[victim.priority])
+            self._pending.append(item)
+            self._record_depth()
+            self._cond.notify_all()
+        return item
+
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def _record_depth(self):
+        for priority, name in _PRIORITY_NAMES.items():
+            self.metrics.set("nacf_queue_depth", sum(p.priority == priority for p in self._pending), priority=name)
+
+    def _next(self) -> WorkItem | None:
+        if not self._pending:
+            return None
+        item = min(self._pending, key=lambda p: (p.priority, p.enqueued))
+        if item.priority == PRIORITY_BACKGROUND and self._running_background >= max(1, self.workers - 1):
+            return None
+        return item
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while (item := self._next()) is None:
+                    self._cond.wait()
+                self._pending.remove(item)
+                self._record_depth()
+                background = item.priority == PRIORITY_BACKGROUND
+                self._running_background += background
+            self.metrics.observe("nacf_queue_wait_seconds", time.monotonic() - item.enqueued,
+                                 priority=_PRIORITY_NAMES[item.priority])
+            try:
+                item.fn()
+            except Exception:
+                self.metrics.inc("nacf_queue_task_errors_total", priority=_PRIORITY_NAMES[item.priority])
+            finally:
+                with self._cond:
+                    self._running_background -= background
+                    self._cond.notify_all()
+
+_work_queue: WorkQueue | None = None
+_work_queue_lock = threading.Lock()
+
+def work_queue() -> WorkQueue:
+    """Process-wide queue shared by every window and helper that talks to Ollama."""
+    global _work_queue
+    with _work_queue_lock:
+        if _work_queue is None:
+            _work_queue = WorkQueue()
+        return _work_queue
+
+# ---------- Idle-time precompute ----------
+class IdleScheduler:
+    """
+    Runs speculative background jobs one at a time, only while no interactive request is in flight.
+    Jobs are keyed: submitting a key again replaces the pending job (the newest inputs win).
+    begin_interactive() marks a foreground request; it cancels the running job and puts it back at the
+    head of the line, to run again once the foreground is idle unless its key was resubmitted or clear()
+    was called in the meantime.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Callable[[CancelToken], None]] = {}
+        self._busy = 0
+        self._running: CancelToken | None = None
+        self._preempted = False
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def submit(self, key: str, job: Callable[[CancelToken], None]):
+        with self._cond:
+            self._pending.pop(key, None)
+            self._pending[key] = job
+            self._cond.notify()
+
+    def clear(self):
+        with self._cond:
+            self._pending.clear()
+            self._preempted = False
+            if self._running: self._running.cancel()
+
+    def begin_interactive(self):
+        with self._cond:
+            self._busy += 1
+            if self._running and not self._running.cancelled:
+                self._running.cancel(); self._preempted = True
+
+    def end_interactive(self):
+        with self._cond:
+            self._busy = max(0, self._busy - 1)
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._busy or not self._pending:
+                    self._cond.wait()
+                key = next(iter(self._pending))
+                job = self._pending.pop(key)
+                token = self._running = CancelToken()
+            done = threading.Event()
+
+            def run():
+                try:
+                    job(token)
+                except Exception:
+                    pass  # speculative work: a failure just means the fallback gets used
+                finally:
+                    done.set()
+            try:  # runs on the shared queue at background priority, so it counts against WORKERS
+                item = work_queue().submit(run, key=f"idle:{id(self)}")
+                while not done.wait(0.5) and not item.dropped:
+                    pass
+            except QueueFull:
+                pass
+            finally:
+                with self._cond:
+                    if self._preempted and key not in self._pending:
+                        self._pending = {key: job, **self._pending}
+                    self._running, self._preempted = None, False
+
+# ---------- Chat log ----------
+class ChatLog:
+    """
+    Bounded chat transcript for an always-on kiosk. The Text widget shows a window of messages
+    [first_shown, end_shown) of about max_lines lines: while the view follows the bottom, old messages are
+    trimmed off the top; scrolling to either edge pages neighbouring messages back in (the window is
+    capped at 3x the budget, trimming the far side). Messages stay in memory up to memory_messages, then
+    spill to an append-only JSONL file with offsets kept in RAM. Writes are queued until flush(), which
+    the app's UIPump runs once per frame, and applied with a single see("end").
+    """
+
+    def __init__(self, parent, *, max_lines: int = CHAT_MAX_LINES, memory_messages: int = CHAT_MEMORY_MESSAGES,
+                 archive_path: str | None = None, **text_options):
+        self.text = scrolledtext.ScrolledText(parent, **text_options)
+        self.text.configure(state="disabled", yscrollcommand=self._on_scroll)
+        for sequence in ("<MouseWheel>", "<Button-4>"):  # Windows/macOS, X11 wheel up
+            self.text.bind(sequence, self._on_wheel, add="+")
+        self.max_lines, self.memory_messages = max_lines, memory_messages
+        self.messages: List[List[str]] = []   # [text, tag], the in-memory tail
+        self.base = 0                          # absolute index of messages[0]
+        self.first_shown = self.end_shown = 0  # absolute message range in the widget
+        self.offsets: List[int] = []           # archive file offset of every spilled message
+        self._ops: List[tuple] = []
+        self._paging = False
+        try:
+            self.archive = open(archive_path or cache_path("chat-log.jsonl"), "w+b")
+        except OSError:
+            self.archive = None
+
+    def pack(self, **kw): self.text.pack(**kw)
+    def tag_configure(self, *args, **kw): self.text.tag_configure(*args, **kw)
+
+    @property
+    def count(self) -> int:
+        return self.base + len(self.messages)
+
+    # --- writes (queued, applied once per frame) ---
+    def add(self, text: str, tag: str):
+        self._ops.append(("add", text, tag))
+
+    def extend(self, piece: str):
+        """Append to the newest message (streamed bubbles)."""
+        self._ops.append(("extend", piece))
+
+    def clear(self):
+        """Empty the view; cleared messages stay in the log and page back in on scroll."""
+        self._ops.append(("clear",))
+
+    def flush(self):
+        ops, self._ops = self._ops, []
+        if not ops:
+            return
+        following = self.end_shown == self.count and self.text.yview()[1] >= 0.999
+        self.text.configure(state="normal")
+        for op in ops:
+            live = self.end_shown == self.count  # the widget shows the newest message
+            if op[0] == "add":
+                self.messages.append([op[1], op[2]])
+                if live:
+                    self.text.insert("end", op[1] + "\n", (op[2],)); self.end_shown += 1
+            elif op[0] == "extend" and self.messages:
+                self.messages[-1][0] += op[1]
+                if live: self.text.insert("end-2c", op[1], (self.messages[-1][1],))  # before the message's "\n"
+            elif op[0] == "clear":
+                self.text.delete("1.0", "end")
+                self.first_shown = self.end_shown = self.count
+        if following:
+            self._trim_top(self.max_lines)
+        self.text.configure(state="disabled")
+        if following: self.text.see("end")
+        self._spill()
+
+    # --- bounds ---
+    def _message(self, index: int) -> List[str]:
+        if index >= self.base:
+            return self.messages[index - self.base]
+        self.archive.seek(self.offsets[index])
+        return json.loads(self.archive.readline())
+
+    def _lines(self) -> int:
+        return int(self.text.index("end-1c").split(".")[0])
+
+    def _height(self, index: int) -> int:
+        return self._message(index)[0].count("\n") + 1
+
+    def _trim_top(self, budget: int):
+        while self._lines() > budget and self.first_shown < self.end_shown - 1:
+            self.text.delete("1.0", f"{self._height(self.first_shown) + 1}.0")
+            self.first_shown += 1
+
+    def _trim_bottom(self, budget: int):
+        while self._lines() > budget and self.first_shown < self.end_shown - 1:
+            self.text.delete(f"{self._lines() - self._height(self.end_shown - 1)}.0", "end")
+            self.end_shown -= 1
+
+    def _spill(self):
+        # Only messages above the widget window leave memory, so on-screen lookups never touch the disk
+        excess = min(len(self.messages) - self.memory_messages, self.first_shown - self.base)
+        if excess <= 0:
+            return
+        if self.archive is not None:
+            self.archive.seek(0, os.SEEK_END)
+            for text, tag in self.messages[:excess]:
+                self.offsets.append(self.archive.tell())
+                self.archive.write(json.dumps([text, tag], ensure_ascii=False).encode("utf-8") + b"\n")
+        del self.messages[:excess]
+        self.base += excess
+
+    # --- paging ---
+    def _on_scroll(self, first: str, last: str):
+        self.text.vbar.set(first, last)
+        if self._paging or (float(first) <= 0.0 and float(last) >= 1.0):
+            return  # everything fits (e.g. just after clear()): only a wheel turn pages, see _on_wheel
+        oldest = 0 if self.archive is not None else self.base
+        if float(first) <= 0.0 and self.first_shown > oldest:
+            self._paging = True; self.text.after_idle(self._page_up)
+        elif float(last) >= 1.0 and self.end_shown < self.count:
+            self._paging = True; self.text.after_idle(self._page_down)
+
+    def _on_wheel(self, event):
+        # The view can't scroll while the content fits, so yscrollcommand never fires; page in on wheel-up
+        oldest = 0 if self.archive is not None else self.base
+        if (getattr(event, "delta", 0) > 0 or getattr(event, "num", 0) == 4) and not self._paging \
+                and self.text.yview()[0] <= 0.0 and self.first_shown > oldest:
+            self._paging = True; self.text.after_idle(self._page_up)
+
+    def _page_up(self):
+        self._paging = False
+        oldest = 0 if self.archive is not None else self.base
+        start = max(oldest, self.first_shown - CHAT_PAGE_MESSAGES)
+        older = [self._message(i) for i in range(start, self.first_shown)]
+        if not older:
+            return
+        self.text.configure(state="normal")
+        for text, tag in reversed(older):
+            self.text.insert("1.0", text + "\n", (tag,))
+        self.first_shown = start
+        self._trim_bottom(self.max_lines * 3)
+        self.text.configure(state="disabled")
+        self.text.yview(f"{sum(t.count(chr(10)) + 1 for t, _ in older) + 1}.0")  # keep the old top in place
+
+    def _page_down(self):
+        self._paging = False
+        stop = min(self.count, self.end_shown + CHAT_PAGE_MESSAGES)
+        self.text.configure(state="normal")
+        for i in range(self.end_shown, stop):
+            text, tag = self._message(i)
+            self.text.insert("end", text + "\n", (tag,))
+        self.end_shown = stop
+        self._trim_top(self.max_lines * 3)
+        self.text.configure(state="disabled")
+
+# ---------- Sprite cache ----------
+# Sprites are scaled once per (source content, frame, height, DPI scale) and cached as PNG, which Tk 8.6
+# reads natively: a warm start shows the sprite without importing Pillow or resizing anything.
+SPRITE_HEIGHT = 220
+# Optional per-manager sprite sheets: one PNG per manager, square frames left to right in SPRITE_MOODS
+# order (a sheet with fewer frames reuses its first one). Without the directory, everyone gets the default.
+SPRITE_DIR = os.environ.get("NACF_SPRITE_DIR") or resource_path("assets", "sprites")
+SPRITE_MOODS = ("neutral", "unimpressed", "amused", "appalled")
+SPRITE_CACHE_SIZE = int(os.environ.get("NACF_SPRITE_CACHE", "16"))
+
+def sprite_scale(root: tk.Misc) -> float:
+    """Display scale in quarter steps (1.0 at 96 DPI)."""
+    try:
+        return max(1.0, round(root.winfo_fpixels("1i") / 96 * 4) / 4)
+    except tk.TclError:
+        return 1.0
+
+def png_size(path: str) -> tuple:
+    """(width, height) from the PNG header, without decoding."""
+    with open(path, "rb") as f:
+        head = f.read(24)
+    if head[:8] != b"\x89PNG\r\n\x1a\n":
+        raise OSError(f"not a PNG: {path}")
+    return int.from_bytes(head[16:20], "big"), int.from_bytes(head[20:24], "big")
+
+def sprite_cache_file(src: str, height: int, scale: float, frame: int | None = None) -> str:
+    with open(src, "rb") as f:
+        digest = f"{zlib.crc32(f.read()):08x}"  # the name changes when the source does
+    stem = os.path.splitext(os.path.basename(src))[0] + (f".{frame}" if frame is not None else "")
+    return cache_path("sprites", f"{stem}-{digest}-{height}px@{scale:g}x.png")
+
+def load_cached_sprite(src: str, height: int, scale: float) -> tk.PhotoImage | None:
+    try:
+        return tk.PhotoImage(file=sprite_cache_file(src, height, scale))
+    except (OSError, tk.TclError):
+        return None
+
+def prescale_sprite(src: str, height: int, scale: float, frame: int | None = None) -> str:
+    """
+    Write src (or one square frame of a sheet) scaled to height*scale px into the cache and return the path.
+    Nearest neighbour keeps pixel art crisp. Needs Pillow; touches no Tk state, so it is safe on any thread.
+    """
+    target = sprite_cache_file(src, height, scale, frame)
+    if os.path.exists(target):
+        return target
+    from PIL import Image  # pip install Pillow
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    h = round(height * scale)
+    with Image.open(src) as img:
+        if frame is not None:
+            img = img.crop((frame * img.height, 0, (frame + 1) * img.height, img.height))
+        img.resize((round(img.width * h / img.height), h), Image.NEAREST).save(tmp, "PNG")
+    os.replace(tmp, target)
+    stem = os.path.basename(target).rsplit("-", 2)[0]
+    for stale in glob.glob(cache_path("sprites", f"{glob.escape(stem)}-{'[0-9a-f]' * 8}-{height}px@{scale:g}x.png")):
+        if stale != target:
+            try: os.remove(stale)
+            except OSError: pass
+    return target
+
+def build_sprite(src: str, height: int, scale: float) -> tk.PhotoImage | None:
+    """Scale, cache and load a single sprite (Tk thread)."""
+    try:
+        return tk.PhotoImage(file=prescale_sprite(src, height, scale))
+    except ImportError:
+        # No Pillow: Tk can only shrink by whole factors, so pick the one landing closest to the target
+        img = tk.PhotoImage(file=src)
+        return img.subsample(max(1, round(img.height() / (height * scale))))
+    except OSError:
+        return None
+
+def critique_mood(critique: str) -> str:
+    """Which expression the manager wears after a critique (cheap keyword match)."""
+    text = critique.casefold()
+    for mood, words in (("appalled", ("concern", "horrif", "alarm", "never", "disturb", "yikes")),
+                        ("amused", ("love", "bold", "delight", "points for", "charming", "!")),
+                        ("unimpressed", ("next", "napkin", "decaf", "meh", "fine", "words"))):
+        if any(w in text for w in words):
+            return mood
+    return "neutral"
+
+class SpriteCache:
+    """
+    Per-manager sprite sheets behind an LRU of at most max_images PhotoImages. Cropping and scaling run on
+    a background thread and land in the PNG cache; only the cheap PNG load happens on the Tk thread, via
+    post. request() answers from the LRU at once, or calls on_ready later. Tk-thread only.
+    """
+
+    def __init__(self, post: Callable[[Callable[[], None]], None], *, height: int, scale: float,
+                 sprite_dir: str = SPRITE_DIR, default: str | None = None, max_images: int = SPRITE_CACHE_SIZE):
+        from concurrent.futures import ThreadPoolExecutor
+        self.post, self.height, self.scale = post, height, scale
+        self.sprite_dir, self.default = sprite_dir, default or resource_path("assets", "manager_sprite.png")
+        self.max_images = max(1, max_images)
+        self.images: OrderedDict[tuple, tk.PhotoImage] = OrderedDict()
+        self._waiting: Dict[tuple, List[Callable[[tk.PhotoImage], None]]] = {}
+        self._sheets: List[str] | None = None
+        self._frames: Dict[str, int] = {}
+        self._decoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nacf-sprites")
+
+    def sheets(self) -> List[str]:
+        if self._sheets is None:
+            self._sheets = sorted(glob.glob(os.path.join(glob.escape(self.sprite_dir), "*.png")))
+        return self._sheets
+
+    def sheet_for(self, manager: str) -> str:
+        sheets = self.sheets()
+        return sheets[zlib.crc32(manager.encode("utf-8")) % len(sheets)] if sheets else self.default
+
+    def frame_for(self, sheet: str, mood: str) -> int | None:
+        """Frame index of mood in sheet, or None for a plain single sprite. Header reads are memoized."""
+        if sheet not in self._frames:
+            try:
+                width, height = png_size(sheet)
+                self._frames[sheet] = max(1, width // height)
+            except OSError:
+                self._frames[sheet] = 1
+        frames = self._frames[sheet]
+        if frames == 1:
+            return None
+        frame = SPRITE_MOODS.index(mood) if mood in SPRITE_MOODS else 0
+        return frame if frame < frames else 0
+
+    def request(self, manager: str, mood: str, on_ready: Callable[[tk.PhotoImage], None]):
+        sheet = self.sheet_for(manager)
+        key = (sheet, self.frame_for(sheet, mood))
+        if key in self.images:
+            self.images.move_to_end(key)
+            on_ready(self.images[key]); return
+        if key in self._waiting:
+            self._waiting[key].append(on_ready); return
+        self._waiting[key] = [on_ready]
+        self._decoder.submit(self._decode, key)
+
+    def _decode(self, key: tuple):  # decoder thread
+        sheet, frame = key
+        try:
+            path = prescale_sprite(sheet, self.height, self.scale, frame)
+        except ImportError:
+            path = "" if frame is None else None  # "" = single sprite: let Tk scale it
+        except OSError:
+            path = None
+        self.post(lambda: self._loaded(key, path))
+
+    def _loaded(self, key: tuple, path: str | None):
+        callbacks = self._waiting.pop(key, [])
+        try:
+            img = build_sprite(key[0], self.height, self.scale) if path == "" else \
+                  tk.PhotoImage(file=path) if path else None
+        except tk.TclError:
+            img = None
+        if img is None:
+            return
+        self.images[key] = img
+        while len(self.images) > self.max_images:
+            self.images.popitem(last=False)  # the caller holds its own reference to the one on screen
+        for on_ready in callbacks:
+            on_ready(img)
 
 # ---------- UI ----------
+class UIPump:
+    """
+    Thread-safe hand-off from workers to the Tk thread. Workers post() callables; one periodic after()
+    tick runs everything queued since the last frame, then the on_drain hooks (e.g. ChatLog.flush, which
+    also picks up writes made on the Tk thread itself), so a burst of tokens, status and progress changes
+    costs one redraw. It is the app's only frame loop. Posts with a key replace the pending
+    post with that key (only the latest status text matters). Workers never call into Tk themselves.
+    """
+
+    def __init__(self, root: tk.Misc, interval_ms: int = UI_FRAME_MS):
+        self.root, self.interval_ms = root, max(1, interval_ms)
+        self._lock = threading.Lock()
+        self._items: List[Callable[[], None]] = []
+        self._keyed: Dict[str, int] = {}      # key -> position in _items
+        self.on_drain: List[Callable[[], None]] = []
+        self.root.after(self.interval_ms, self._tick)
+
+    def post(self, fn: Callable[[], None], *, key: str | None = None):
+        with self._lock:
+            if key is not None and key in self._keyed:
+                self._items[self._keyed[key]] = fn
+                return
+            if key is not None: self._keyed[key] = len(self._items)
+            self._items.append(fn)
+
+    def _tick(self):
+        with self._lock:
+            items, self._items, self._keyed = self._items, [], {}
+        try:
+            for fn in [*items, *self.on_drain]:
+                try:
+                    fn()
+                except Exception:
+                    self.root.report_callback_exception(*sys.exc_info())
+            if items:
+                METRICS.observe("nacf_ui_updates_per_frame", len(items), buckets=RATE_BUCKETS)
+        finally:
+            self.root.after(self.interval_ms, self._tick)
+
 class NACFApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -334,6 +2147,7 @@ class NACFApp(tk.Tk):
         self.title("Not a Culture Fit — Absurd Interviewer")
         self.geometry("980x720")
         self.configure(bg=CANVAS)
+        self.ui = UIPump(self)
 
         # State
         self.company = ""
@@ -342,6 +2156,16 @@ class NACFApp(tk.Tk):
         self.idx = 0
         self.model = MODEL_NAME
         self.url = OLLAMA_URL
+        self._stream_open = False
+        self._stream_text = ""
+        self._generation = 0                      # bumped per interview; stale worker results are dropped
+        self._inflight: CancelToken | None = None
+        self.conversation: Conversation | None = None
+        self.transcript: List[Dict[str, str]] = []
+        self._spec_decision: tuple | None = None  # (answers used, letter) drafted in idle time
+        self.idle = IdleScheduler()
+        self._ready_for: tuple | None = None      # (url, model) confirmed by the last bootstrap
+        self._bootstrapping = False
 
         # Styles
         style = ttk.Style(self)
@@ -366,8 +2190,9 @@ class NACFApp(tk.Tk):
         ttk.Label(right, text="Model:", style="Header.TLabel").pack(side="left", padx=(0,4))
         ttk.Entry(right, textvariable=self.model_var, width=14).pack(side="left", padx=(0,10))
         ttk.Label(right, text="Ollama:", style="Header.TLabel").pack(side="left", padx=(0,4))
-        ttk.Entry(right, textvariable=self.url_var, width=24).pack(side="left", padx=(0,10))
-        ttk.Button(right, text="New Interview", command=self.new_interview).pack(side="left")
+        ttk.Entry(right, textvariable=self.url_var, width=24).pack(side="left", padx=(0,10))  # comma-separated for a pool
+        self.new_btn = ttk.Button(right, text="New Interview", command=self.new_interview, state="disabled")
+        self.new_btn.pack(side="left")
 
         # Body: left (sprite card) + right (chat)
         body = ttk.Frame(self, style="Card.TFrame"); body.pack(fill="both", expand=True, padx=12, pady=12)
@@ -376,6 +2201,9 @@ class NACFApp(tk.Tk):
 
         self._build_left_card(self.left)
         self._build_chat_card(self.right)
+        self.ui.on_drain.append(self.chat.flush)  # chat writes from a frame's updates land in the same redraw
+        self.sprites = SpriteCache(self.ui.post, height=SPRITE_HEIGHT, scale=sprite_scale(self))
+        self._sprite_want: tuple | None = None
         self._set_welcome()
 
     # Left card with sprite + details
@@ -384,21 +2212,11 @@ class NACFApp(tk.Tk):
         frame.pack(fill="y", padx=8, pady=8)
         ttk.Label(frame, text="Hiring Manager", font=("Segoe UI", 12, "bold")).pack(anchor="w", padx=12, pady=(12,4))
 
-        self.sprite = None
-        if Image and ImageTk:
-            try:
-                spath = resource_path("assets", "manager_sprite.png")
-                img = Image.open(spath)
-                h_target = 220
-                scale = h_target / img.height
-                img = img.resize((int(img.width * scale), int(img.height * scale)), Image.NEAREST)
-                self.sprite = ImageTk.PhotoImage(img)
-            except Exception:
-                self.sprite = None
-
-        if self.sprite:
-            lbl = ttk.Label(frame, image=self.sprite); lbl.image = self.sprite
-            lbl.pack(padx=12, pady=(4,8))
+        # Warm start: the pre-scaled PNG loads right away. Cold start: it is built after the first frame.
+        self.sprite = load_cached_sprite(resource_path("assets", "manager_sprite.png"), SPRITE_HEIGHT, sprite_scale(self))
+        self.sprite_label = ttk.Label(frame, image=self.sprite or ""); self.sprite_label.pack(padx=12, pady=(4,8))
+        if self.sprite is None:
+            self.after_idle(lambda: self.after(0, self._load_sprite))
 
         self.name_label = ttk.Label(frame, text="—", font=("Segoe UI", 11)); self.name_label.pack(anchor="w", padx=12, pady=(4,8))
         ttk.Separator(frame, orient="horizontal").pack(fill="x", padx=12, pady=8)
@@ -407,14 +2225,29 @@ class NACFApp(tk.Tk):
         ttk.Label(frame, text="Status", font=("Segoe UI", 11, "bold")).pack(anchor="w", padx=12)
         self.status_label = ttk.Label(frame, text="Waiting to start…", foreground=MUTED); self.status_label.pack(anchor="w", padx=12, pady=(2,12))
 
+    def _load_sprite(self):
+        try:
+            self.sprite = build_sprite(resource_path("assets", "manager_sprite.png"), SPRITE_HEIGHT, sprite_scale(self))
+        except Exception:
+            self.sprite = None  # the app still runs without the image
+        if self.sprite:
+            self.sprite_label.configure(image=self.sprite)
+
+    def _show_sprite(self, mood: str = "neutral"):
+        """Swap to this manager's sprite for mood; decoding happens off the Tk thread."""
+        want = self._sprite_want = (self.manager, mood)
+        def show(img: tk.PhotoImage):
+            if self._sprite_want == want:  # a later swap wins
+                self.sprite = img; self.sprite_label.configure(image=img)
+        self.sprites.request(self.manager, mood, show)
+
     # Chat card
     def _build_chat_card(self, parent):
         top = ttk.Frame(parent, style="Card.TFrame"); top.pack(fill="both", expand=True, padx=8, pady=8)
         self.progress_var = tk.StringVar(value="0/10")
         self.progress = ttk.Progressbar(top, maximum=NUM_QUESTIONS_PER_INTERVIEW, value=0); self.progress.pack(fill="x", padx=10, pady=(10,6))
         self.progress_label = ttk.Label(top, textvariable=self.progress_var); self.progress_label.pack(anchor="e", padx=12, pady=(0,4))
-        self.chat = scrolledtext.ScrolledText(top, wrap="word", height=20, bg=CARD_BG, relief="flat"); self.chat.pack(fill="both", expand=True, padx=10, pady=6)
-        self.chat.configure(state="disabled")
+        self.chat = ChatLog(top, wrap="word", height=20, bg=CARD_BG, relief="flat"); self.chat.pack(fill="both", expand=True, padx=10, pady=6)
         self.chat.tag_configure("system", foreground=MUTED, spacing1=4, spacing3=6, lmargin1=4, lmargin2=4)
         self.chat.tag_configure("manager", foreground=INK, spacing1=6, spacing3=8, lmargin1=4, lmargin2=4, background="#eef3f6")
         self.chat.tag_configure("user", foreground=INK, spacing1=6, spacing3=8, lmargin1=40, lmargin2=40, background="#fff7e8")
@@ -424,39 +2257,133 @@ class NACFApp(tk.Tk):
         ttk.Button(row, text="Send ▶", command=self.send_current).pack(side="left", padx=(8,0))
 
     def _set_welcome(self):
+        self._chat_system(f"Welcome to Not a Culture Fit.\nModel: {self.model}  •  Server: {self.url}")
+        def worker():
+            try:
+                skipped = content().skipped  # the first run compiles the question index, seconds for a large library
+            except Exception as e:  # start_bootstrap reports it too and keeps New Interview retryable
+                message = f"Content packs failed to load: {e}"
+                self.ui.post(lambda: self._chat_system(message))
+                return
+            self.ui.post(lambda: self._welcome_manager(skipped))
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _welcome_manager(self, skipped: Dict[str, str]):
+        for name, reason in skipped.items():
+            self._chat_system(f"Skipped content pack {name}: {reason}")
+        if self.questions:
+            return  # an interview started first
         self.company = gen_company_name(); self.manager = gen_manager_name()
         self.name_label.config(text=self.manager); self.company_label.config(text=self.company)
-        self.status_label.config(text="Ready")
-        self._chat_system(f"Welcome to Not a Culture Fit.\nModel: {self.model}  •  Server: {self.url}")
         self._chat_manager(f"Thank you for your time today. You’re being considered for a position at {self.company}. I’m the Hiring Manager, {self.manager}. Click 'New Interview' when ready.")
 
+    # Bootstrap runs off the Tk thread; prompts and status updates are marshalled back through self.ui
+    def start_bootstrap(self, then: Callable[[], None] | None = None):
+        if self._bootstrapping:
+            return
+        self._bootstrapping = True
+        self.new_btn.config(state="disabled")
+        url, model = self.url, self.model
+
+        def status(text: str):
+            self.ui.post(lambda: self.status_label.config(text=text), key="status")
+
+        def worker():
+            ok = OllamaBootstrap(url, model, on_status=status, ask=self._ask_from_worker).run()
+            try:
+                content()  # the interview needs the question index too; never wait for it on the Tk thread
+                error = None
+            except Exception as e:  # a broken core.json or an unwritable cache dir; retried on New Interview
+                error = f"Content packs failed to load: {e}"
+            self.ui.post(lambda: self._bootstrap_done(ok, (url, model), then, error))
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _bootstrap_done(self, ok: bool, key: tuple, then: Callable[[], None] | None, error: str | None = None):
+        self._bootstrapping = False
+        self.new_btn.config(state="normal")
+        if error:
+            self.status_label.config(text=error)
+            return
+        if not ok:
+            self.status_label.config(text="Ollama unavailable. Check settings, then New Interview.")
+            return
+        self._ready_for = key
+        self.status_label.config(text="Ready")
+        if then: then()
+        else: self._warm_model()
+
+    def _warm_model(self):
+        model, url = self.model, self.url
+        try:
+            work_queue().submit(lambda: ollama_warmup(model=model, url=url), key=f"warmup:{url}:{model}")
+        except QueueFull:
+            pass  # warm-up is best effort; the first critique loads the model anyway
+
+    def _ask_from_worker(self, kind: str, title: str, message: str) -> bool:
+        answer = [False]; done = threading.Event()
+        def show():
+            try:
+                if kind == "yesno":
+                    answer[0] = messagebox.askyesno(title, message, parent=self)
+                else:
+                    (messagebox.showerror if kind == "error" else messagebox.showinfo)(title, message, parent=self)
+            finally:
+                done.set()
+        self.ui.post(show)
+        done.wait()
+        return answer[0]
+
     def new_interview(self):
         self.model = (self.model_var.get().strip() or "llama3")
         self.url   = (self.url_var.get().strip() or "http://localhost:11434")
 
-        # Ensure Ollama is ready for the chosen URL/model
-        if not ensure_ollama(self.url, self.model, parent=self):
+        # Ensure Ollama is ready for the chosen URL/model (in the background)
+        if self._ready_for != (self.url, self.model):
+            self.start_bootstrap(then=self.new_interview)
             return
 
+        # Supersede anything still generating for the previous interview
+        self._generation += 1
+        if self._inflight: self._inflight.cancel(); self._inflight = None
+        self._stream_open = False
+        self.idle.clear()
+        self.transcript = []; self._spec_decision = None
+
         self.company = gen_company_name(); self.manager = gen_manager_name()
         self.name_label.config(text=self.manager); self.company_label.config(text=self.company)
-        self.questions = random.sample(QUESTION_BANK, NUM_QUESTIONS_PER_INTERVIEW)
-        self.idx = 0; self.progress["value"] = 0; self.progress_var.set(f"0/{NUM_QUESTIONS_PER_INTERVIEW}")
-        self.chat.configure(state="normal"); self.chat.delete("1.0","end"); self.chat.configure(state="disabled")
+        self._show_sprite()
+        self.questions = pick_questions(candidate=KIOSK_CANDIDATE, theme=INTERVIEW_THEME, ramp=parse_ramp(INTERVIEW_RAMP))
+        self.progress.config(maximum=len(self.questions))
+        self.conversation = Conversation(self.company, self.manager) if CHAT_MODE else None
+        self.idx = 0; self.progress["value"] = 0; self.progress_var.set(f"0/{len(self.questions)}")
+        self.chat.clear()
         self._chat_manager(f"Welcome back. Fresh requisition from {self.company}. I’m {self.manager}. Let's begin.")
         self._ask_next_question()
+        self._warm_model()  # loads the model while Q1 is being answered
 
     # Chat helpers
     def _chat_insert(self, text: str, tag: str):
-        self.chat.configure(state="normal"); self.chat.insert("end", text + "\n", (tag,)); self.chat.see("end"); self.chat.configure(state="disabled")
+        self.chat.add(text, tag)
 
     def _chat_system(self, text: str):  self._chat_insert(text, "system")
     def _chat_manager(self, text: str): self._chat_insert("🧑‍💼 " + text, "manager")
     def _chat_user(self, text: str):    self._chat_insert("🙋 " + text, "user")
 
+    # Streaming manager bubble: opened on the first token, closed by _handle_critique
+    def _chat_stream(self, piece: str):
+        if not self._stream_open:
+            self._stream_open = True; self._stream_text = ""
+            self.chat.add("🧑‍💼 ", "manager")
+            self.status_label.config(text="Manager is typing…")
+        self._stream_text += piece
+        self.chat.extend(piece)
+
+    def _chat_stream_end(self):
+        self._stream_open = False
+
     # Q&A flow
     def _ask_next_question(self):
-        if self.idx >= NUM_QUESTIONS_PER_INTERVIEW:
+        if self.idx >= len(self.questions):
             self._decision(); return
         q = self.questions[self.idx]
         self._chat_manager(f"Q{self.idx+1}: {q}")
@@ -470,40 +2397,89 @@ class NACFApp(tk.Tk):
 
     def send_current(self):
         user_ans = self.entry.get("1.0","end").strip()
-        if not user_ans: return
-        self.entry.delete("1.0","end"); self._chat_user(user_ans)
-        self.status_label.config(text="Scoring answer…")
-        prompt = build_critique_prompt(self.company, self.manager, self.questions[self.idx], user_ans)
+        if not user_ans or self._inflight: return  # one critique per question; extra Enters are ignored
+        company, manager, question = self.company, self.manager, self.questions[self.idx]
+        gen, cancel, trace, conversation = self._generation, CancelToken(), Trace(), self.conversation
+
+        def current(fn):  # run fn on the Tk thread only if this interview is still the active one
+            return lambda: fn() if gen == self._generation and not cancel.cancelled else None
+        on_token = (lambda piece: self.ui.post(current(lambda: self._chat_stream(piece)))) if STREAM_CRITIQUES else None
 
         def worker():
             try:
-                critique = ollama_generate(prompt, model=self.model, url=self.url)
+                cancel.raise_if_cancelled()  # superseded while it waited in the queue
+                critique = generate_critique(company, manager, question, user_ans, model=self.model,
+                                             url=self.url, on_token=on_token, cancel=cancel, trace=trace,
+                                             conversation=conversation)
+            except Cancelled:
+                return
             except Exception as e:
                 critique = f"[Ollama error: {e}]"
-            self.after(0, lambda: self._handle_critique(critique))
-        threading.Thread(target=worker, daemon=True).start()
+                METRICS.inc("nacf_critique_errors_total")
+            finally:
+                self.idle.end_interactive()
+            self.ui.post(current(lambda: self._handle_critique(critique, trace)))
+
+        self.idle.begin_interactive()
+        try:
+            work_queue().submit(worker, priority=PRIORITY_INTERACTIVE)
+        except QueueFull:
+            self.idle.end_interactive()
+            self.status_label.config(text="Ollama is busy. Try sending again in a moment.")
+            return
+        self._inflight = cancel
+        self.transcript.append({"question": question, "answer": user_ans})
+        self.entry.delete("1.0","end"); self._chat_user(user_ans)
+        self.status_label.config(text="Scoring answer…")
 
-    def _handle_critique(self, critique: str):
-        if not critique: critique = "I’ve seen stronger convictions in a lukewarm decaf. Next."
-        self._chat_manager(critique)
-        self.idx += 1; self.progress["value"] = self.idx; self.progress_var.set(f"{self.idx}/{NUM_QUESTIONS_PER_INTERVIEW}")
-        if self.idx < NUM_QUESTIONS_PER_INTERVIEW: self._ask_next_question()
+    def _handle_critique(self, critique: str, trace: Trace | None = None):
+        self._inflight = None
+        critique = critique or FALLBACK_CRITIQUE
+        if self.transcript: self.transcript[-1]["critique"] = critique
+        streamed = self._stream_text.strip() if self._stream_open else ""
+        if self._stream_open: self._chat_stream_end()
+        if critique != streamed: self._chat_manager(critique)
+        self._show_sprite(critique_mood(critique))
+        self.idx += 1; self.progress["value"] = self.idx; self.progress_var.set(f"{self.idx}/{len(self.questions)}")
+        if self.idx < len(self.questions):
+            self._ask_next_question()
+            self._speculate_decision()
         else: self._decision()
+        if trace:
+            self.chat.flush(); self.update_idletasks()  # include the redraw in ui_applied
+            trace.mark("ui_applied"); trace.finish()
+
+    def _speculate_decision(self):
+        """While the candidate types Q8+, draft the rejection letter from the answers so far."""
+        if not LLM_DECISION or self.idx + 1 < DECISION_SPECULATE_FROM_Q:
+            return
+        gen, model, url = self._generation, self.model, self.url
+        company, manager, transcript = self.company, self.manager, list(self.transcript)
+        messages = self.conversation.decision_messages() if self.conversation else None
+
+        def job(cancel: CancelToken):
+            letter = generate_decision(company, manager, transcript, model=model, url=url,
+                                       messages=messages, cancel=cancel)
+            if letter:
+                self.ui.post(lambda: self._store_decision(gen, len(transcript), letter))
+        self.idle.submit("decision", job)
+
+    def _store_decision(self, gen: int, answers: int, letter: str):
+        if gen == self._generation and (self._spec_decision is None or answers >= self._spec_decision[0]):
+            self._spec_decision = (answers, letter)
 
     def _decision(self):
         self.status_label.config(text="Final decision rendered.")
-        self._chat_manager("Decision: " + random.choice(REJECTION_REASONS))
+        self.idle.clear()
+        letter = self._spec_decision[1] if self._spec_decision else rejection_reason()
+        self._chat_manager("Decision: " + letter)
         self._chat_system("Interview again? Use the 'New Interview' button in the header.")
 
 def main():
-    # Hidden root so messageboxes can show during preflight
-    temp_root = tk.Tk(); temp_root.withdraw()
-    ok = ensure_ollama(OLLAMA_URL, MODEL_NAME, parent=temp_root)
-    try: temp_root.destroy()
-    except Exception: pass
-    if not ok: return
-
+    # Window first; Ollama bootstrap reports into the status label and unlocks "New Interview"
+    start_metrics_export()
     app = NACFApp()
+    app.start_bootstrap()
     app.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,346 @@
+# SPDX-License-Identifier: MIT
+# -*- coding: utf-8 -*-
+"""
+Not a Culture Fit — asyncio Ollama client and Tk-free interview sessions
+
+AsyncOllamaClient speaks just enough HTTP/1.1 over asyncio streams (keep-alive pool,
+chunked NDJSON streaming) to talk to Ollama without extra dependencies, and
+InterviewSession holds one candidate's interview state, so a single process can
+drive hundreds of interviews concurrently.
+
+FakeOllamaClient is a drop-in stand-in that streams canned critiques locally.
+
+    client = AsyncOllamaClient("http://localhost:11434")
+    session = InterviewSession(client, model="llama3")
+    print(session.current_question)
+    critique = await session.submit("idk", on_token=print)
+"""
+from __future__ import annotations
+import asyncio, json, random, ssl, time, uuid
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import Not_a_Culture_Fit as nacf
+
+class OllamaHTTPError(RuntimeError):
+    def __init__(self, status: int, body: str):
+        super().__init__(f"Ollama HTTP {status}: {body[:200]}")
+        self.status = status
+
+class InterviewFinished(RuntimeError):
+    """An answer arrived after the last question had already been answered."""
+
+_Conn = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+class AsyncOllamaClient:
+    """Minimal asyncio HTTP/1.1 client for one Ollama server with a bounded keep-alive pool."""
+
+    def __init__(self, url: str, *, max_connections: int = nacf.HTTP_POOL_SIZE,
+                 connect_timeout: float = nacf.HTTP_CONNECT_TIMEOUT, read_timeout: float = nacf.HTTP_READ_TIMEOUT):
+        parts = urlsplit(url.rstrip("/"))
+        self.url = url.rstrip("/")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.base_path = parts.path
+        self.connect_timeout, self.read_timeout = connect_timeout, read_timeout
+        self._slots = asyncio.Semaphore(max_connections)  # caps concurrent requests per process
+        self._idle: List[_Conn] = []
+
+    # --- connections ---
+    async def _connect(self) -> Tuple[_Conn, bool]:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return (reader, writer), True
+            writer.close()
+        # Large line limit: the final chunk carries Ollama's context token array
+        conn = await asyncio.wait_for(asyncio.open_connection(self.host, self.port, ssl=self.ssl, limit=2 ** 22),
+                                      self.connect_timeout)
+        return conn, False
+
+    def _release(self, conn: _Conn, reusable: bool):
+        if reusable:
+            self._idle.append(conn)
+        else:
+            conn[1].close()
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    # --- HTTP ---
+    async def _send(self, conn: _Conn, method: str, path: str, body: bytes):
+        head = (f"{method} {self.base_path}{path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\nConnection: keep-alive\r\n\r\n")
+        conn[1].write(head.encode("latin-1") + body)
+        await conn[1].drain()
+        status_line = await asyncio.wait_for(conn[0].readline(), self.read_timeout)
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise ValueError(f"malformed HTTP status line: {status_line[:80]!r}") from None
+        headers: Dict[str, str] = {}
+        while True:
+            line = await asyncio.wait_for(conn[0].readline(), self.read_timeout)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return status, headers
+
+    async def _body(self, reader: asyncio.StreamReader, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await asyncio.wait_for(reader.readline(), self.read_timeout)).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()  # trailer terminator
+                    return
+                data = await asyncio.wait_for(reader.readexactly(size + 2), self.read_timeout)
+                yield data[:-2]
+        elif "content-length" in headers:
+            yield await asyncio.wait_for(reader.readexactly(int(headers["content-length"])), self.read_timeout)
+        else:
+            yield await asyncio.wait_for(reader.read(), self.read_timeout)
+
+    async def request_lines(self, method: str, path: str, payload: Dict[str, Any] | None = None) -> AsyncIterator[Dict[str, Any]]:
+        """Send a request and yield the response as decoded JSON lines (one object for non-streaming replies).
+        Closing the iterator early closes the connection instead of returning it to the pool."""
+        body = json.dumps(payload or {}).encode("utf-8")
+        async with self._slots:
+            for attempt in (0, 1):
+                conn, reused = await self._connect()
+                try:
+                    status, headers = await self._send(conn, method, path, body)
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn[1].close()
+                    if not reused or attempt:  # a stale keep-alive socket gets one fresh retry
+                        raise
+                except BaseException:  # timeout, garbled response, cancellation: the socket's state is unknown
+                    conn[1].close()
+                    raise
+            reusable = False
+            try:
+                if status >= 400:
+                    err = b"".join([chunk async for chunk in self._body(conn[0], headers)])
+                    reusable = headers.get("connection", "").lower() != "close"
+                    raise OllamaHTTPError(status, err.decode("utf-8", "replace"))
+                buf = b""
+                async for chunk in self._body(conn[0], headers):
+                    buf += chunk
+                    *lines, buf = buf.split(b"\n")
+                    for line in lines:
+                        if line.strip():
+                            yield json.loads(line)
+                if buf.strip():
+                    yield json.loads(buf)
+                reusable = "content-length" in headers or "chunked" in headers.get("transfer-encoding", "")
+                reusable = reusable and headers.get("connection", "").lower() != "close"
+            finally:
+                self._release(conn, reusable)
+
+    # --- Ollama API ---
+    def _payload(self, body: Dict[str, Any], model: str, stream: bool, options: Dict[str, Any] | None) -> Dict[str, Any]:
+        return {"model": model, **body, "stream": stream,
+                "keep_alive": nacf._keep_alive_value(nacf.KEEP_ALIVE),
+                "options": dict(options or nacf.GENERATION_OPTIONS)}
+
+    @staticmethod
+    def _text(chunk: Dict[str, Any]) -> str:
+        return chunk.get("response") or (chunk.get("message") or {}).get("content") or ""
+
+    # max_sentences and trace work as in nacf.ollama_generate (see nacf.ReplyReader)
+    async def _complete(self, path: str, payload: Dict[str, Any], max_sentences: int | None,
+                        trace: nacf.Trace | None) -> str:
+        # Drain fully (one object) so the connection goes back to the pool
+        replies = [data async for data in self.request_lines("POST", path, payload)]
+        return nacf.ReplyReader(self._text, max_sentences=max_sentences, trace=trace).whole(replies[0] if replies else {})
+
+    async def _stream(self, path: str, payload: Dict[str, Any], max_sentences: int | None,
+                      trace: nacf.Trace | None) -> AsyncIterator[str]:
+        reader = nacf.ReplyReader(self._text, max_sentences=max_sentences, trace=trace)
+        lines = self.request_lines("POST", path, payload)
+        try:
+            async for chunk in lines:
+                piece = reader.feed(chunk)
+                if piece:
+                    yield piece
+                if reader.stop:
+                    break
+                # keep reading after "done" so the terminating chunk is consumed and the socket reused
+        finally:
+            await lines.aclose()
+
+    async def generate(self, prompt: str, *, model: str, options: Dict[str, Any] | None = None,
+                       max_sentences: int | None = None, trace: nacf.Trace | None = None) -> str:
+        return await self._complete("/api/generate", self._payload({"prompt": prompt}, model, False, options),
+                                    max_sentences, trace)
+
+    def stream(self, prompt: str, *, model: str, options: Dict[str, Any] | None = None,
+               max_sentences: int | None = None, trace: nacf.Trace | None = None) -> AsyncIterator[str]:
+        return self._stream("/api/generate", self._payload({"prompt": prompt}, model, True, options),
+                            max_sentences, trace)
+
+    async def chat(self, messages: List[Dict[str, str]], *, model: str, options: Dict[str, Any] | None = None,
+                   max_sentences: int | None = None, trace: nacf.Trace | None = None) -> str:
+        return await self._complete("/api/chat", self._payload({"messages": messages}, model, False, options),
+                                    max_sentences, trace)
+
+    def chat_stream(self, messages: List[Dict[str, str]], *, model: str, options: Dict[str, Any] | None = None,
+                    max_sentences: int | None = None, trace: nacf.Trace | None = None) -> AsyncIterator[str]:
+        return self._stream("/api/chat", self._payload({"messages": messages}, model, True, options),
+                            max_sentences, trace)
+
+    async def embed(self, text: str, *, model: str) -> List[float]:
+        payload = {"model": model, "prompt": text, "keep_alive": nacf._keep_alive_value(nacf.KEEP_ALIVE)}
+        replies = [data async for data in self.request_lines("POST", "/api/embeddings", payload)]
+        return replies[0]["embedding"] if replies else []
+
+class FakeOllamaClient:
+    """Local stand-in for AsyncOllamaClient: streams a canned critique word by word."""
+
+    CRITIQUES = [
+        "Bold of you to bring that energy to a room with no windows. We'll circle back, never.",
+        "I've read fortune cookies with more strategic depth. Still, points for confidence.",
+        "That answer has the structural integrity of a wet napkin in a board meeting.",
+    ]
+
+    def __init__(self, *, token_delay: float = 0.01, critiques: List[str] | None = None):
+        self.token_delay = token_delay
+        self.critiques = critiques or self.CRITIQUES
+        self.url = "fake://ollama"
+
+    async def generate(self, prompt: str, *, model: str, options: Dict[str, Any] | None = None,
+                       max_sentences: int | None = None, trace: nacf.Trace | None = None) -> str:
+        pieces = self.stream(prompt, model=model, options=options, max_sentences=max_sentences, trace=trace)
+        return "".join([piece async for piece in pieces]).strip()
+
+    async def stream(self, prompt: str, *, model: str, options: Dict[str, Any] | None = None,
+                     max_sentences: int | None = None, trace: nacf.Trace | None = None) -> AsyncIterator[str]:
+        reader = nacf.ReplyReader(lambda chunk: chunk["response"], max_sentences=max_sentences, trace=trace)
+        words = random.choice(self.critiques).split(" ")
+        for word in words:
+            await asyncio.sleep(self.token_delay)
+            piece = reader.feed({"response": word + " "})
+            if piece:
+                yield piece
+            if reader.stop:
+                return
+        piece = reader.feed({"response": "", "done": True, "eval_count": len(words)})
+        if piece:
+            yield piece
+
+    async def chat(self, messages: List[Dict[str, str]], *, model: str, options: Dict[str, Any] | None = None,
+                   max_sentences: int | None = None, trace: nacf.Trace | None = None) -> str:
+        return await self.generate("", model=model, options=options, max_sentences=max_sentences, trace=trace)
+
+    def chat_stream(self, messages: List[Dict[str, str]], *, model: str, options: Dict[str, Any] | None = None,
+                    max_sentences: int | None = None, trace: nacf.Trace | None = None) -> AsyncIterator[str]:
+        return self.stream("", model=model, options=options, max_sentences=max_sentences, trace=trace)
+
+    async def embed(self, text: str, *, model: str) -> List[float]:
+        from nacf_mock_ollama import toy_embedding
+        return toy_embedding(text)
+
+    async def close(self):
+        pass
+
+class InterviewSession:
+    """One candidate's interview, independent of Tk: company, manager, questions and progress."""
+
+    def __init__(self, client, *, model: str = nacf.MODEL_NAME, company: str | None = None,
+                 manager: str | None = None, questions: List[str] | None = None,
+                 num_questions: int = nacf.NUM_QUESTIONS_PER_INTERVIEW, candidate: str | None = None,
+                 pack: str | None = None, theme: List[str] | None = None, ramp: tuple | None = None):
+        self.id = uuid.uuid4().hex
+        self.client = client
+        self.model = model
+        self.company = company or nacf.gen_company_name()
+        self.manager = manager or nacf.gen_manager_name()
+        self.questions = questions or nacf.pick_questions(num_questions, candidate=candidate, pack=pack,
+                                                          theme=theme, ramp=ramp)
+        self.idx = 0
+        self.transcript: List[Dict[str, str]] = []
+        self.conversation = nacf.Conversation(self.company, self.manager) if nacf.CHAT_MODE else None
+        self.last_active = time.monotonic()
+        self._decision: Optional[str] = None
+        self._lock = asyncio.Lock()  # one answer at a time per session
+
+    @property
+    def current_question(self) -> Optional[str]:
+        return self.questions[self.idx] if self.idx < len(self.questions) else None
+
+    @property
+    def done(self) -> bool:
+        return self.idx >= len(self.questions)
+
+    async def submit(self, answer: str, *, on_token: Optional[Callable[[str], Any]] = None) -> str:
+        """Critique the answer to the current question and advance. on_token may be sync or async."""
+        async with self._lock:
+            question = self.current_question
+            if question is None:
+                raise InterviewFinished("interview is already finished")
+            self.last_active = time.monotonic()
+            critique = await self._critique(question, answer, on_token)
+            critique = critique or nacf.FALLBACK_CRITIQUE
+            self.transcript.append({"question": question, "answer": answer, "critique": critique})
+            self.idx += 1
+            self.last_active = time.monotonic()
+            return critique
+
+    async def _critique(self, question: str, answer: str, on_token) -> str:
+        trace = nacf.Trace()
+        cache = nacf.critique_cache()
+        loop = asyncio.get_running_loop()
+        # CachedAnswer.lookup runs on a worker thread; its embedding call goes out on this loop's client
+        embed = lambda text: asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(self.client.embed(text, model=nacf.EMBED_MODEL), nacf.EMBED_TIMEOUT_S), loop).result()
+        entry = cache and nacf.CachedAnswer(cache, self.model, question, answer, embed=embed)
+        if entry:
+            cached = await asyncio.to_thread(entry.lookup, company=self.company, manager=self.manager)
+            if cached:
+                trace.source = "cache"; trace.finish()
+                if self.conversation: self.conversation.record(question, answer, cached)
+                return cached
+        shareable = not (self.conversation and self.conversation.turns)  # as in nacf.generate_critique
+        if self.conversation:
+            messages = self.conversation.messages_for(question, answer)
+            complete, stream = partial(self.client.chat, messages), partial(self.client.chat_stream, messages)
+        else:
+            prompt = nacf.build_critique_prompt(self.company, self.manager, question, answer)
+            complete, stream = partial(self.client.generate, prompt), partial(self.client.stream, prompt)
+        trace.mark("prompt_built")
+        with nacf.GENERATION_BUDGET.generation(answer, trace) as options:
+            kw = dict(model=self.model, options=options, max_sentences=nacf.REPLY_MAX_SENTENCES, trace=trace)
+            if on_token is None:
+                critique = await complete(**kw)
+            else:
+                parts = []
+                async for piece in stream(**kw):
+                    parts.append(piece)
+                    result = on_token(piece)
+                    if asyncio.iscoroutine(result):
+                        await result
+                critique = "".join(parts).strip()
+        shareable = shareable and not nacf.GENERATION_BUDGET.trimmed(answer, options)
+        trace.finish()
+        if self.conversation and critique:
+            self.conversation.record(question, answer, critique)
+        if entry and critique and shareable:
+            await asyncio.to_thread(entry.store, critique, company=self.company, manager=self.manager)
+        return critique
+
+    def decision(self) -> str:
+        if self._decision is None:
+            self._decision = nacf.rejection_reason()
+        return self._decision
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"id": self.id, "company": self.company, "manager": self.manager,
+                "question": self.current_question, "index": self.idx, "total": len(self.questions),
+                "done": self.done, "transcript": list(self.transcript)}
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: MIT
+# -*- coding: utf-8 -*-
+"""
+Not a Culture Fit — headless batch critiques
+
+Reads a JSONL file of interview answers, critiques them through a bounded pool of
+worker threads (same prompt, cache and backend pool as the GUI, but always at full
+length: the interactive latency budget doesn't apply) and writes one JSONL result
+per input line, in input order.
+
+Usage:
+  python src/nacf_batch.py answers.jsonl critiques.jsonl --workers 4
+
+Input lines:   {"question": "...", "answer": "...", "company": "...", "manager": "..."}
+               (company/manager are optional; random ones are generated when missing)
+Output lines:  the input record plus "index", "critique" and, on failure, "error"
+               (unparseable input lines and Ollama errors alike).
+
+Results are written in input order. The output file doubles as the checkpoint:
+rerunning the same command skips every record already critiqued and retries the
+failed ones, whose results are appended after the rest.
+"""
+from __future__ import annotations
+import argparse, json, os, sys, time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, Future, wait
+from typing import Dict, Any, Iterator, Set, Tuple
+
+import Not_a_Culture_Fit as nacf
+
+def read_records(path: str, skip: Set[int]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(index, record) per non-blank line; a line that is not a JSON object comes back as {"error": ...}."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        index = 0
+        for line in f:
+            if not line.strip():
+                continue
+            if index not in skip:
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    record = {"error": f"invalid JSON: {e}"}
+                yield index, record if isinstance(record, dict) else {"error": "not a JSON object"}
+            index += 1
+
+def checkpoint(path: str) -> Set[int]:
+    """
+    Indexes already critiqued in an existing output file. Failed records, unreadable lines and a torn
+    last line are dropped from the file so that this run redoes them.
+    """
+    if not os.path.exists(path):
+        return set()
+    done: Set[int] = set()
+    dropped = 0
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(path, encoding="utf-8", errors="replace") as f, open(tmp, "w", encoding="utf-8") as kept:
+        for line in f:
+            try:
+                result = json.loads(line) if line.endswith("\n") else None
+            except ValueError:
+                result = None
+            if isinstance(result, dict) and "error" not in result and isinstance(result.get("index"), int):
+                done.add(result["index"]); kept.write(line)
+            else:
+                dropped += 1
+    if dropped:
+        os.replace(tmp, path)
+    else:
+        os.remove(tmp)
+    return done
+
+def critique_record(index: int, record: Dict[str, Any], *, model: str, url: str) -> Dict[str, Any]:
+    out = dict(record)
+    out["index"] = index
+    if "error" in record or not isinstance(record.get("question"), str):
+        out.setdefault("error", 'missing "question"')
+        out["critique"] = ""
+        return out
+    out.setdefault("company", nacf.gen_company_name())
+    out.setdefault("manager", nacf.gen_manager_name())
+    try:
+        out["critique"] = nacf.generate_critique(out["company"], out["manager"], record["question"],
+                                                 record.get("answer", ""), model=model, url=url,
+                                                 interactive=False)
+    except Exception as e:
+        out["critique"] = ""
+        out["error"] = str(e)
+    return out
+
+def run(in_path: str, out_path: str, *, model: str, url: str, workers: int) -> int:
+    done = checkpoint(out_path)
+    if done:
+        print(f"Resuming after {len(done)} completed record(s).", file=sys.stderr)
+    written, failed, started = 0, 0, time.monotonic()
+    window = workers * 2  # requests in flight: enough to keep every worker busy
+    backlog = workers * 32  # finished results held back behind a slow one; bounds memory on huge inputs
+    inflight: Dict[Future, int] = {}
+    ready: Dict[int, Dict[str, Any]] = {}
+    order: deque = deque()  # submitted indexes, oldest first
+
+    with ThreadPoolExecutor(max_workers=workers) as pool, open(out_path, "a", encoding="utf-8") as out:
+        def collect(block: bool):
+            """Take whatever has finished (at least one result if block), then write out what is in order."""
+            nonlocal written, failed
+            if inflight:
+                finished, _ = wait(inflight, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    ready[inflight.pop(future)] = future.result()
+            while order and order[0] in ready:
+                result = ready.pop(order.popleft())
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                written += 1; failed += "error" in result
+            out.flush()
+
+        for index, record in read_records(in_path, done):
+            while len(inflight) >= window or len(order) >= backlog:
+                collect(block=True)
+            order.append(index)
+            inflight[pool.submit(critique_record, index, record, model=model, url=url)] = index
+            collect(block=False)
+        while order:
+            collect(block=True)
+
+    elapsed = time.monotonic() - started
+    rate = written / elapsed if elapsed else 0.0
+    print(f"Wrote {written} critique(s) in {elapsed:.1f}s ({rate:.2f}/s).", file=sys.stderr)
+    if failed:
+        print(f"{failed} record(s) failed; rerun the same command to retry them.", file=sys.stderr)
+    return written
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Critique a JSONL file of interview answers headlessly.")
+    ap.add_argument("input", help="JSONL with question/answer[/company/manager] per line")
+    ap.add_argument("output", help="JSONL results (appended; doubles as the resume checkpoint)")
+    ap.add_argument("--workers", type=int, default=4, help="concurrent Ollama requests (default: 4)")
+    ap.add_argument("--model", default=nacf.MODEL_NAME)
+    ap.add_argument("--url", default=nacf.OLLAMA_URL, help="Ollama URL or comma-separated pool")
+    ap.add_argument("--no-cache", action="store_true", help="always ask the model; skip the critique cache")
+    args = ap.parse_args(argv)
+    if args.no_cache:
+        nacf.CRITIQUE_CACHE = False
+    pool = nacf.backend_pool(args.url)
+    pool.check_all()
+    if not any(b.healthy for b in pool.backends):
+        sys.exit(f"Ollama is not reachable at {args.url}.")
+    run(args.input, args.output, model=args.model, url=args.url, workers=max(1, args.workers))
+
+if __name__ == "__main__":
+    main()
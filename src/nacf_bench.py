@@ -0,0 +1,240 @@
+# SPDX-License-Identifier: MIT
+# -*- coding: utf-8 -*-
+"""
+Not a Culture Fit — latency/throughput benchmark
+
+Drives N concurrent simulated interviews through the same critique path as the GUI
+(generate_critique on worker threads) or the async InterviewSession, and reports
+p50/p95/p99 time-to-first-token, critique latency and critiques/sec.
+
+By default it starts an in-process mock Ollama (src/nacf_mock_ollama.py), so it
+runs anywhere; point --url at a real server to measure that instead.
+
+--startup measures cold start instead: fresh interpreters import the app (with
+-X importtime) and, when a display is available, build the window and draw the
+first frame. It runs headless too; the window column is then skipped.
+
+  python src/nacf_bench.py --interviews 20 --questions 10
+  python src/nacf_bench.py --engine async --interviews 200 --token-ms 30
+  python src/nacf_bench.py --url http://localhost:11434 --interviews 4 --json
+  python src/nacf_bench.py --startup --runs 10
+"""
+from __future__ import annotations
+import argparse, asyncio, json, os, random, subprocess, sys, threading, time
+from typing import Any, Dict, List, Optional
+
+import Not_a_Culture_Fit as nacf
+from nacf_mock_ollama import MockOllama
+
+ANSWERS = ["idk", "synergy", "I would leverage cross-functional alignment.", "Spreadsheets, mostly.",
+           "Blockchain, but emotionally.", "I'd schedule a meeting about it.", "no"]
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+class Results:
+    def __init__(self):
+        self.ttft: List[float] = []
+        self.latency: List[float] = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def add(self, ttft: Optional[float], latency: float):
+        with self._lock:
+            if ttft is not None: self.ttft.append(ttft)
+            self.latency.append(latency)
+
+    def fail(self):
+        with self._lock:
+            self.errors += 1
+
+    def summary(self, wall: float) -> Dict[str, Any]:
+        ms = lambda xs, p: round(percentile(xs, p) * 1000, 1)
+        return {"critiques": len(self.latency), "errors": self.errors, "wall_s": round(wall, 2),
+                "critiques_per_s": round(len(self.latency) / wall, 2) if wall else 0.0,
+                "ttft_ms": {f"p{p}": ms(self.ttft, p) for p in (50, 95, 99)},
+                "latency_ms": {f"p{p}": ms(self.latency, p) for p in (50, 95, 99)}}
+
+# ---------- engines ----------
+def run_threads(url: str, model: str, interviews: int, questions: int, stream: bool, think_s: float) -> Results:
+    results = Results()
+    for backend_url in nacf.parse_backend_urls(url):  # one pooled connection per simulated kiosk
+        nacf._clients[backend_url] = nacf.OllamaClient(backend_url, pool_size=max(interviews, nacf.HTTP_POOL_SIZE))
+
+    def interview():
+        company, manager = nacf.gen_company_name(), nacf.gen_manager_name()
+        conversation = nacf.Conversation(company, manager) if nacf.CHAT_MODE else None
+        for question in nacf.pick_questions(questions):
+            first: List[float] = []
+            started = time.perf_counter()
+            on_token = (lambda piece: first or first.append(time.perf_counter() - started)) if stream else None
+            try:
+                nacf.generate_critique(company, manager, question, random.choice(ANSWERS),
+                                       model=model, url=url, on_token=on_token, conversation=conversation)
+            except Exception:
+                results.fail(); continue
+            results.add(first[0] if first else None, time.perf_counter() - started)
+            time.sleep(think_s)
+
+    threads = [threading.Thread(target=interview, daemon=True) for _ in range(interviews)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return results
+
+def run_async(url: str, model: str, interviews: int, questions: int, stream: bool, think_s: float) -> Results:
+    from nacf_async import AsyncOllamaClient, InterviewSession
+    results = Results()
+
+    async def interview(client):
+        session = InterviewSession(client, model=model, num_questions=questions)
+        while not session.done:
+            first: List[float] = []
+            started = time.perf_counter()
+            on_token = (lambda piece: first or first.append(time.perf_counter() - started)) if stream else None
+            try:
+                await session.submit(random.choice(ANSWERS), on_token=on_token)
+            except Exception:
+                results.fail(); session.idx += 1; continue
+            results.add(first[0] if first else None, time.perf_counter() - started)
+            await asyncio.sleep(think_s)
+
+    async def main():
+        client = AsyncOllamaClient(nacf.parse_backend_urls(url)[0], max_connections=max(interviews, 1))
+        try:
+            await asyncio.gather(*(interview(client) for _ in range(interviews)))
+        finally:
+            await client.close()
+
+    asyncio.run(main())
+    return results
+
+# ---------- cold start ----------
+DEFERRED_MODULES = ("requests", "PIL", "subprocess", "sqlite3", "webbrowser")
+STARTUP_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import Not_a_Culture_Fit as nacf
+imported = time.perf_counter()
+window = None
+try:
+    app = nacf.NACFApp(); app.update(); window = time.perf_counter() - imported; app.destroy()
+except Exception:
+    pass  # no display
+print(json.dumps({"import_s": imported - started, "window_s": window,
+                  "loaded": [m for m in %r if m in sys.modules]}))
+""" % (DEFERRED_MODULES,)
+
+def import_profile(stderr: str) -> Dict[str, float]:
+    """Cumulative seconds of each module the app imports directly, from -X importtime output."""
+    children: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name.strip() == "Not_a_Culture_Fit":
+                return children
+            children = {}
+        elif depth == 1:
+            children[name.strip()] = int(cumulative) / 1e6
+    return children
+
+def time_startup(runs: int) -> Dict[str, Any]:
+    here = os.path.dirname(os.path.abspath(__file__))
+    walls, imports, windows, loaded = [], [], [], set()
+    modules: Dict[str, List[float]] = {}
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", STARTUP_PROBE], cwd=here,
+                              capture_output=True, text=True, env={**os.environ, "NACF_METRICS_PORT": "0"})
+        walls.append(time.perf_counter() - started)
+        if proc.returncode:
+            sys.exit(proc.stderr)
+        probe = json.loads(proc.stdout.strip().splitlines()[-1])
+        imports.append(probe["import_s"])
+        if probe["window_s"] is not None: windows.append(probe["window_s"])
+        loaded.update(probe["loaded"])
+        for name, seconds in import_profile(proc.stderr).items():
+            modules.setdefault(name, []).append(seconds)
+    ms = lambda xs: round(percentile(xs, 50) * 1000, 1) if xs else None
+    top = sorted(((ms(v), k) for k, v in modules.items()), reverse=True)[:8]
+    return {"runs": runs, "process_ms": ms(walls), "import_ms": ms(imports), "window_ms": ms(windows),
+            "top_imports_ms": {k: v for v, k in top},
+            "deferred": [m for m in DEFERRED_MODULES if m not in loaded]}
+
+def time_bootstrap(url: str, model: str) -> float:
+    started = time.perf_counter()
+    nacf.OllamaBootstrap(url, model).run()
+    return time.perf_counter() - started
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark critique latency and throughput.")
+    ap.add_argument("--url", help="Ollama URL (default: start an in-process mock)")
+    ap.add_argument("--model", default=nacf.MODEL_NAME)
+    ap.add_argument("--engine", choices=["threads", "async"], default="threads")
+    ap.add_argument("--interviews", type=int, default=10, help="concurrent simulated interviews")
+    ap.add_argument("--questions", type=int, default=nacf.NUM_QUESTIONS_PER_INTERVIEW)
+    ap.add_argument("--think-ms", type=float, default=0.0, help="pause between answers (typing time)")
+    ap.add_argument("--no-stream", action="store_true", help="non-streaming requests (no TTFT)")
+    ap.add_argument("--cache", action="store_true", help="leave the critique cache on (off by default)")
+    ap.add_argument("--token-ms", type=float, default=20.0, help="mock: delay per token")
+    ap.add_argument("--jitter-ms", type=float, default=5.0, help="mock: per-token jitter")
+    ap.add_argument("--load-ms", type=float, default=0.0, help="mock: one-time model load")
+    ap.add_argument("--fail-rate", type=float, default=0.0, help="mock: injected failure rate")
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+    ap.add_argument("--startup", action="store_true", help="measure cold start instead of critiques")
+    ap.add_argument("--runs", type=int, default=5, help="--startup: fresh interpreters to time")
+    args = ap.parse_args(argv)
+
+    if args.startup:
+        report = time_startup(max(1, args.runs))
+        if args.json:
+            print(json.dumps(report, indent=2))
+            return
+        window = f"{report['window_ms']} ms" if report["window_ms"] is not None else "n/a (no display)"
+        print(f"cold start, median of {report['runs']} fresh interpreters")
+        print(f"  process        {report['process_ms']:>8} ms   (interpreter + import + window, exit)")
+        print(f"  import         {report['import_ms']:>8} ms")
+        print(f"  first frame    {window:>8}")
+        for name, value in report["top_imports_ms"].items():
+            print(f"    {name:<22} {value:>8} ms")
+        print(f"  deferred       {', '.join(report['deferred']) or 'none'}")
+        return
+
+    nacf.CRITIQUE_CACHE = args.cache
+    mock = None
+    if args.url is None:
+        mock = MockOllama(models=[f"{args.model}:latest"], token_ms=args.token_ms, jitter_ms=args.jitter_ms,
+                          load_ms=args.load_ms, fail_rate=args.fail_rate, seed=0).start()
+    url = args.url or mock.url
+    try:
+        bootstrap_s = time_bootstrap(url, args.model)
+        engine = run_async if args.engine == "async" else run_threads
+        started = time.perf_counter()
+        results = engine(url, args.model, args.interviews, args.questions, not args.no_stream, args.think_ms / 1000)
+        report = {"engine": args.engine, "interviews": args.interviews, "target": "mock" if mock else url,
+                  "bootstrap_ms": round(bootstrap_s * 1000, 1), **results.summary(time.perf_counter() - started)}
+    finally:
+        if mock: mock.stop()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['interviews']} interviews via {report['engine']} against {report['target']}")
+    print(f"  bootstrap      {report['bootstrap_ms']:>8} ms")
+    for label, key in (("TTFT", "ttft_ms"), ("critique", "latency_ms")):
+        p = report[key]
+        print(f"  {label:<14} p50 {p['p50']:>8} ms   p95 {p['p95']:>8} ms   p99 {p['p99']:>8} ms")
+    print(f"  throughput     {report['critiques_per_s']:>8} critiques/s "
+          f"({report['critiques']} ok, {report['errors']} errors in {report['wall_s']} s)")
+
+if __name__ == "__main__":
+    main()
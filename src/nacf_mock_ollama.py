@@ -0,0 +1,238 @@
+# SPDX-License-Identifier: MIT
+# -*- coding: utf-8 -*-
+"""
+Not a Culture Fit — local stand-in for an Ollama server
+
+Speaks the parts of the Ollama API the app uses (/api/tags, /api/generate and
+/api/chat, streaming or not, /api/pull, /api/embeddings for any model name) with
+canned critiques and bag-of-trigram embeddings, configurable
+per-token latency and jitter, a one-time model load delay and failure injection.
+Use it to benchmark or demo without a model:
+
+  python src/nacf_mock_ollama.py --port 11434 --token-ms 40 --jitter-ms 15 --fail-rate 0.02
+
+or in-process:
+
+  mock = MockOllama(token_ms=5).start()   # mock.url -> "http://127.0.0.1:<port>"
+  ...
+  mock.stop()
+"""
+from __future__ import annotations
+import argparse, json, math, random, socket, sys, threading, time, zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List
+
+CRITIQUES = [
+    "Bold of you to bring that energy to a room with no windows. We'll circle back, never.",
+    "I've read fortune cookies with more strategic depth. Still, points for the confident delivery.",
+    "That answer has the structural integrity of a wet napkin in a board meeting. Next.",
+    "You said a lot of words and none of them were synergy. Frankly, I'm concerned.",
+    "Your answer was so on-brand it forgot to be useful. Love that for you, legally.",
+]
+
+def toy_embedding(text: str, dim: int = 256) -> List[float]:
+    """
+    Hashed character-trigram counts: answers sharing most of their letters land close together. The
+    last component is a constant, so unrelated texts score about 0.5 like they do with real models.
+    """
+    vector = [0.0] * dim
+    padded = f"  {' '.join(text.casefold().split())}  "
+    for i in range(len(padded) - 2):
+        h = zlib.crc32(padded[i:i + 3].encode("utf-8"))
+        vector[h % (dim - 1)] += 1.0 if h & 0x80000000 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector))
+    if not norm:
+        return vector
+    vector = [v / norm for v in vector[:-1]] + [1.0]
+    return [v / math.sqrt(2) for v in vector]
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):  # clients dropping keep-alive sockets is normal
+            super().handle_error(request, client_address)
+
+class MockOllama:
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 0, models: List[str] | None = None,
+                 token_ms: float = 20.0, jitter_ms: float = 5.0, prompt_ms: float = 50.0,
+                 load_ms: float = 0.0, fail_rate: float = 0.0, embed_ms: float = 5.0, seed: int | None = None):
+        self.models = models or ["llama3:latest"]
+        self.token_ms, self.jitter_ms, self.prompt_ms = token_ms, jitter_ms, prompt_ms
+        self.load_ms, self.fail_rate, self.embed_ms = load_ms, fail_rate, embed_ms
+        self.rng = random.Random(seed)
+        self.loaded: set = set()
+        self.requests = 0
+        self.embeddings = 0
+        self.aborted = 0
+        self._lock = threading.Lock()
+        self.server = _QuietServer((host, port), self._handler())
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "MockOllama":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    # --- behaviour ---
+    def _sleep_token(self):
+        time.sleep(max(0.0, self.token_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000)
+
+    def _load(self, model: str) -> int:
+        """Simulated model load; paid once per model like a cold Ollama. Returns load_duration in ns."""
+        with self._lock:
+            cold = model not in self.loaded
+            self.loaded.add(model)
+        if cold and self.load_ms:
+            time.sleep(self.load_ms / 1000)
+            return int(self.load_ms * 1e6)
+        return 0
+
+    def _tokens(self, options: Dict[str, Any]) -> List[str]:
+        words = self.rng.choice(CRITIQUES).split(" ")
+        tokens = [w + " " for w in words[:-1]] + [words[-1]]
+        limit = int(options.get("num_predict") or 0)
+        return tokens[:limit] if limit > 0 else tokens
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()  # headers and body go out as separate writes; don't let Nagle hold the body back
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _send_json(self, status: int, obj: Any):
+                body = json.dumps(obj).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _chunk(self, obj: Any):
+                line = (json.dumps(obj) + "\n").encode("utf-8")
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+
+            def do_GET(self):
+                if self.path.rstrip("/") == "/api/tags":
+                    return self._send_json(200, {"models": [{"name": m} for m in mock.models]})
+                self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                with mock._lock:
+                    mock.requests += 1
+                path = self.path.rstrip("/")
+                if path == "/api/pull":
+                    return self._pull(body)
+                if path == "/api/embeddings":
+                    return self._embed(body)
+                if path not in ("/api/generate", "/api/chat"):
+                    return self._send_json(404, {"error": "not found"})
+                model = body.get("model", "")
+                if model not in mock.models and model.split(":")[0] not in {m.split(":")[0] for m in mock.models}:
+                    return self._send_json(404, {"error": f"model '{model}' not found"})
+                fail = mock.rng.random() < mock.fail_rate
+                if fail and mock.rng.random() < 0.5:
+                    return self._send_json(500, {"error": "injected failure"})
+                self._generate(path == "/api/chat", model, body, drop_midway=fail)
+
+            def _pull(self, body: Dict[str, Any]):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for done in (0, 50, 100):
+                    self._chunk({"status": "pulling", "total": 100, "completed": done})
+                self._chunk({"status": "success"})
+                self.wfile.write(b"0\r\n\r\n")
+                with mock._lock:
+                    mock.models.append(body.get("model", ""))
+
+            def _embed(self, body: Dict[str, Any]):
+                prompt = body.get("prompt") or ""
+                if prompt:
+                    time.sleep(mock.embed_ms / 1000)
+                    with mock._lock:
+                        mock.embeddings += 1
+                self._send_json(200, {"embedding": toy_embedding(prompt) if prompt else []})
+
+            def _generate(self, chat: bool, model: str, body: Dict[str, Any], *, drop_midway: bool):
+                started = time.perf_counter()
+                load_ns = mock._load(model)
+                empty = not (body.get("messages") if chat else body.get("prompt"))
+                tokens = [] if empty else mock._tokens(body.get("options") or {})
+                if tokens:
+                    time.sleep(mock.prompt_ms / 1000)
+                stats = lambda: {"done": True, "done_reason": "stop", "model": model,
+                                 "total_duration": int((time.perf_counter() - started) * 1e9),
+                                 "load_duration": load_ns, "prompt_eval_count": 32,
+                                 "prompt_eval_duration": int(mock.prompt_ms * 1e6),
+                                 "eval_count": len(tokens), "eval_duration": int(len(tokens) * mock.token_ms * 1e6)}
+                piece = (lambda text: {"message": {"role": "assistant", "content": text}}) if chat else \
+                        (lambda text: {"response": text})
+
+                if not body.get("stream", True):
+                    for _ in tokens:
+                        mock._sleep_token()
+                    reply = {**piece("".join(tokens)), **stats()}
+                    if not chat: reply["context"] = [1, 2, 3]
+                    return self._send_json(200, reply)
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for i, token in enumerate(tokens):
+                        mock._sleep_token()
+                        if drop_midway and i == len(tokens) // 2:
+                            self.close_connection = True
+                            return
+                        self._chunk({"model": model, "done": False, **piece(token)})
+                    final = {**piece(""), **stats()}
+                    if not chat: final["context"] = [1, 2, 3]
+                    self._chunk(final)
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    with mock._lock:
+                        mock.aborted += 1
+                    self.close_connection = True
+
+        return Handler
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run a fake Ollama server for demos and benchmarks.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=11434)
+    ap.add_argument("--model", action="append", help="model name to advertise (repeatable; default llama3)")
+    ap.add_argument("--token-ms", type=float, default=20.0, help="mean delay per streamed token")
+    ap.add_argument("--jitter-ms", type=float, default=5.0, help="uniform +/- jitter per token")
+    ap.add_argument("--prompt-ms", type=float, default=50.0, help="prompt evaluation delay before the first token")
+    ap.add_argument("--load-ms", type=float, default=0.0, help="one-time model load delay")
+    ap.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests that 500 or drop mid-stream")
+    ap.add_argument("--embed-ms", type=float, default=5.0, help="delay per /api/embeddings call")
+    args = ap.parse_args(argv)
+    mock = MockOllama(host=args.host, port=args.port, models=args.model, token_ms=args.token_ms,
+                      jitter_ms=args.jitter_ms, prompt_ms=args.prompt_ms, load_ms=args.load_ms,
+                      fail_rate=args.fail_rate, embed_ms=args.embed_ms)
+    print(f"Mock Ollama on {mock.url}")
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        mock.stop()
+
+if __name__ == "__main__":
+    main()
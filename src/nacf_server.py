@@ -0,0 +1,323 @@
+# SPDX-License-Identifier: MIT
+# -*- coding: utf-8 -*-
+"""
+Not a Culture Fit — interview server (HTTP + WebSocket)
+
+One process fronts Ollama for many thin clients. Sessions live in memory, are
+evicted after NACF_SESSION_IDLE seconds without activity, and at most
+NACF_MAX_SESSIONS run at once (new ones get 503 until a slot frees up).
+
+Usage:
+  python src/nacf_server.py --port 8765 [--url http://localhost:11434] [--fake]
+
+HTTP (JSON):
+  POST   /interviews                 start an interview -> session (id, company, manager, question, …)
+                                     optional {"candidate", "pack", "theme": ["tag", …], "ramp": "1-3"}:
+                                     no repeats for that candidate until the pool runs dry, questions
+                                     from one pack / with those tags, difficulty rising from 1 to 3
+  GET    /interviews/{id}            current state
+  POST   /interviews/{id}/answers    {"answer": "..."} -> {"critique", "question" | "decision", …}
+  DELETE /interviews/{id}            end it early
+  GET    /healthz
+  GET    /metrics                    Prometheus text (critique stage timings, cache hits, …)
+
+WebSocket:
+  GET /interviews/{id}/ws
+    send {"type": "answer", "text": "..."}
+    recv {"type": "question"}, {"type": "token", "text"}*, {"type": "critique"}, then the next
+         question or {"type": "decision"} after the last one; {"type": "error"} on failure.
+"""
+from __future__ import annotations
+import argparse, asyncio, base64, hashlib, json, os, struct, sys, time
+from typing import Any, Dict, List, Optional, Tuple
+
+import Not_a_Culture_Fit as nacf
+from nacf_async import AsyncOllamaClient, FakeOllamaClient, InterviewFinished, InterviewSession
+
+MAX_SESSIONS = int(os.environ.get("NACF_MAX_SESSIONS", "200"))
+SESSION_IDLE_S = float(os.environ.get("NACF_SESSION_IDLE", "900"))
+MAX_BODY = 64 * 1024
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+class SessionStore:
+    """In-memory sessions with a concurrency cap and idle eviction."""
+
+    def __init__(self, client, *, model: str, max_sessions: int = MAX_SESSIONS, idle_s: float = SESSION_IDLE_S):
+        self.client, self.model = client, model
+        self.max_sessions, self.idle_s = max_sessions, idle_s
+        self.sessions: Dict[str, InterviewSession] = {}
+
+    def create(self, candidate: str | None = None, pack: str | None = None, theme: List[str] | None = None,
+               ramp: tuple | None = None) -> InterviewSession:
+        self.evict_idle()
+        if len(self.sessions) >= self.max_sessions:
+            raise HTTPError(503, "too many concurrent interviews; try again shortly")
+        index = nacf.content().questions
+        if pack is not None and pack not in index.packs:
+            raise HTTPError(400, f"no such content pack: {pack}")
+        unknown = [t for t in theme or () if t.casefold() not in index.tags]
+        if unknown:
+            raise HTTPError(400, f"no questions tagged: {', '.join(unknown)}")
+        session = InterviewSession(self.client, model=self.model, candidate=candidate, pack=pack, theme=theme, ramp=ramp)
+        self.sessions[session.id] = session
+        return session
+
+    def get(self, sid: str) -> InterviewSession:
+        session = self.sessions.get(sid)
+        if session is None:
+            raise HTTPError(404, "no such interview (finished or evicted)")
+        return session
+
+    def drop(self, sid: str):
+        self.sessions.pop(sid, None)
+
+    def evict_idle(self):
+        cutoff = time.monotonic() - self.idle_s
+        for sid in [sid for sid, s in self.sessions.items() if s.last_active < cutoff and not s._lock.locked()]:
+            del self.sessions[sid]
+
+    async def evict_forever(self, every: float = 30.0):
+        while True:
+            await asyncio.sleep(every)
+            self.evict_idle()
+
+def session_view(session: InterviewSession) -> Dict[str, Any]:
+    view = session.snapshot()
+    if session.done:
+        view["decision"] = session.decision()
+    return view
+
+# ---------- HTTP plumbing ----------
+async def read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+    headers: Dict[str, str] = {}
+    while True:
+        h = await reader.readline()
+        if h in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = h.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY:
+        raise HTTPError(413, "body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], headers, body
+
+async def write_text(writer: asyncio.StreamWriter, text: str, content_type: str = "text/plain; version=0.0.4"):
+    body = text.encode("utf-8")
+    writer.write(f"HTTP/1.1 200 OK\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n"
+                 .encode("latin-1") + body)
+    await writer.drain()
+
+async def write_json(writer: asyncio.StreamWriter, status: int, payload: Any, *, keep_alive: bool = True):
+    body = b"" if status == 204 else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\nContent-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "Access-Control-Allow-Origin: *\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+# ---------- WebSocket plumbing (RFC 6455, text frames only) ----------
+async def ws_send(writer: asyncio.StreamWriter, payload: Any, opcode: int = 0x1):
+    data = payload if isinstance(payload, bytes) else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    n = len(data)
+    head = bytes([0x80 | opcode]) + (bytes([n]) if n < 126 else
+                                     bytes([126]) + struct.pack("!H", n) if n < 65536 else
+                                     bytes([127]) + struct.pack("!Q", n))
+    writer.write(head + data)
+    await writer.drain()
+
+async def ws_recv(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[str]:
+    """Next text message, answering pings; None once the client closes."""
+    message = b""
+    while True:
+        b1, b2 = await reader.readexactly(2)
+        fin, opcode, masked, n = b1 & 0x80, b1 & 0x0F, b2 & 0x80, b2 & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", await reader.readexactly(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", await reader.readexactly(8))[0]
+        if n > MAX_BODY:
+            return None
+        mask = await reader.readexactly(4) if masked else b"\0\0\0\0"
+        data = bytes(c ^ mask[i % 4] for i, c in enumerate(await reader.readexactly(n)))
+        if opcode == 0x8:
+            await ws_send(writer, data[:2], opcode=0x8)
+            return None
+        if opcode == 0x9:
+            await ws_send(writer, data, opcode=0xA)
+            continue
+        if opcode in (0x0, 0x1, 0x2):
+            message += data
+            if fin:
+                return message.decode("utf-8", "replace")
+
+async def ws_interview(store: SessionStore, session: InterviewSession,
+                       reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    await ws_send(writer, {"type": "question", **session_view(session)})
+    while True:
+        raw = await ws_recv(reader, writer)
+        if raw is None:
+            return
+        try:
+            msg = json.loads(raw)
+        except ValueError:
+            await ws_send(writer, {"type": "error", "error": "expected JSON"}); continue
+        if not isinstance(msg, dict) or msg.get("type") != "answer" or not str(msg.get("text", "")).strip():
+            await ws_send(writer, {"type": "error", "error": "send {\"type\": \"answer\", \"text\": \"...\"}"}); continue
+        if session.done:
+            await ws_send(writer, {"type": "decision", **session_view(session)}); continue
+        try:
+            critique = await session.submit(msg["text"].strip(),
+                                            on_token=lambda piece: ws_send(writer, {"type": "token", "text": piece}))
+        except InterviewFinished:
+            await ws_send(writer, {"type": "decision", **session_view(session)}); continue
+        except Exception as e:
+            await ws_send(writer, {"type": "error", "error": f"Ollama error: {e}"}); continue
+        await ws_send(writer, {"type": "critique", "text": critique})
+        await ws_send(writer, {"type": "decision" if session.done else "question", **session_view(session)})
+
+# ---------- Routes ----------
+def json_object(body: bytes) -> Dict[str, Any]:
+    try:
+        obj = json.loads(body or b"{}")
+    except ValueError:
+        raise HTTPError(400, "body must be JSON")
+    if not isinstance(obj, dict):
+        raise HTTPError(400, "body must be a JSON object")
+    return obj
+
+def interview_options(options: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], List[str], Optional[tuple]]:
+    """candidate, pack, theme tags and difficulty ramp from a POST /interviews body."""
+    candidate, pack, theme, ramp = (options.get(k) for k in ("candidate", "pack", "theme", "ramp"))
+    if isinstance(theme, str):
+        theme = theme.split(",")
+    elif not isinstance(theme, (list, type(None))):
+        raise HTTPError(400, 'theme must be a list of tags or a comma-separated string')
+    if ramp not in (None, "", []):
+        if isinstance(ramp, list) and len(ramp) == 2 and all(type(x) is int for x in ramp):
+            ramp = nacf.parse_ramp(f"{ramp[0]}-{ramp[1]}")
+        else:
+            ramp = nacf.parse_ramp(ramp) if isinstance(ramp, str) else None
+        if ramp is None:
+            raise HTTPError(400, 'ramp must be [first, last] difficulties from 1 to 3, or "first-last"')
+    return (str(candidate) if candidate else None, str(pack) if pack else None,
+            [str(t).strip() for t in theme or () if str(t).strip()], ramp or None)
+
+async def route(store: SessionStore, method: str, path: str, headers: Dict[str, str], body: bytes,
+                reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[Tuple[int, Any]]:
+    parts = [p for p in path.split("/") if p]
+    if parts == ["metrics"]:
+        return 200, nacf.METRICS.prometheus()  # str payloads go out as text/plain
+    if parts == ["healthz"]:
+        return 200, {"ok": True, "sessions": len(store.sessions), "max_sessions": store.max_sessions}
+    if parts == ["interviews"]:
+        if method != "POST":
+            raise HTTPError(405, "use POST")
+        return 201, session_view(store.create(*interview_options(json_object(body))))
+    if len(parts) < 2 or parts[0] != "interviews":
+        raise HTTPError(404, "not found")
+    session = store.get(parts[1])
+    if len(parts) == 2:
+        if method == "GET":
+            return 200, session_view(session)
+        if method == "DELETE":
+            store.drop(session.id)
+            return 204, None
+        raise HTTPError(405, "use GET or DELETE")
+    if parts[2:] == ["answers"] and method == "POST":
+        answer = str(json_object(body).get("answer", "")).strip()
+        if not answer:
+            raise HTTPError(400, "answer is required")
+        if session.done:
+            raise HTTPError(409, "interview already finished")
+        try:
+            critique = await session.submit(answer)
+        except InterviewFinished:  # another answer took the last question first
+            raise HTTPError(409, "interview already finished")
+        except Exception as e:  # the backend failed, not the request
+            raise HTTPError(503, f"Ollama error: {e}")
+        return 200, {"critique": critique, **session_view(session)}
+    if parts[2:] == ["ws"] and method == "GET" and headers.get("upgrade", "").lower() == "websocket":
+        accept = base64.b64encode(hashlib.sha1((headers.get("sec-websocket-key", "") + WS_GUID).encode()).digest())
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                     b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+        await writer.drain()
+        await ws_interview(store, session, reader, writer)
+        return None
+    raise HTTPError(404, "not found")
+
+async def handle_connection(store: SessionStore, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                result = await route(store, method, path, headers, body, reader, writer)
+                if result is None:  # connection was upgraded and is finished
+                    break
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if isinstance(result[1], str):
+                    await write_text(writer, result[1])
+                else:
+                    await write_json(writer, *result, keep_alive=keep_alive)
+                if not keep_alive:
+                    break
+            except HTTPError as e:
+                await write_json(writer, e.status, {"error": str(e)})
+            except Exception as e:  # answer rather than dropping the socket; Ollama failures are 503s above
+                await write_json(writer, 500, {"error": f"internal error: {e}"})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(host: str, port: int, client, *, model: str, max_sessions: int, idle_s: float):
+    store = SessionStore(client, model=model, max_sessions=max_sessions, idle_s=idle_s)
+    nacf.content()  # compile/open the question index before the first request needs it
+    server = await asyncio.start_server(lambda r, w: handle_connection(store, r, w), host, port)
+    evictor = asyncio.create_task(store.evict_forever())
+    print(f"Not a Culture Fit server on http://{host}:{port} (model {model}, max {max_sessions} sessions)", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        evictor.cancel()
+        await client.close()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Serve interviews over HTTP/WebSocket.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--model", default=nacf.MODEL_NAME)
+    ap.add_argument("--url", default=nacf.OLLAMA_URL, help="Ollama server URL")
+    ap.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    ap.add_argument("--idle", type=float, default=SESSION_IDLE_S, help="evict sessions idle this many seconds")
+    ap.add_argument("--fake", action="store_true", help="use canned critiques instead of Ollama")
+    args = ap.parse_args(argv)
+    client = FakeOllamaClient() if args.fake else AsyncOllamaClient(nacf.parse_backend_urls(args.url)[0])
+    try:
+        asyncio.run(serve(args.host, args.port, client, model=args.model,
+                          max_sessions=args.max_sessions, idle_s=args.idle))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import asyncio, time
+
+import pytest
+
+from nacf_async import AsyncOllamaClient, OllamaHTTPError
+from nacf_mock_ollama import MockOllama
+
+MODEL = "llama3"
+
+@pytest.fixture
+def mock():
+    m = MockOllama(token_ms=1, jitter_ms=0, prompt_ms=5, seed=1).start()
+    yield m
+    m.stop()
+
+def tracked(client: AsyncOllamaClient) -> list:
+    """The writer of every connection the client opens or reuses, in order."""
+    conns, connect = [], client._connect
+    async def _connect():
+        conn, reused = await connect()
+        conns.append(conn[1])
+        return conn, reused
+    client._connect = _connect
+    return conns
+
+def test_streams_chunked_ndjson(mock):
+    async def go():
+        client = AsyncOllamaClient(mock.url)
+        chunks = [c async for c in client.request_lines("POST", "/api/generate", {"model": MODEL, "prompt": "hi"})]
+        await client.close()
+        return chunks
+    chunks = asyncio.run(go())
+    assert len(chunks) > 2 and chunks[-1]["done"] and not any(c["done"] for c in chunks[:-1])
+    assert chunks[-1]["context"] == [1, 2, 3]  # the large final line survives chunk boundaries
+
+def test_keep_alive_reuses_the_connection(mock):
+    async def go():
+        client = AsyncOllamaClient(mock.url)
+        conns = tracked(client)
+        first = await client.generate("one", model=MODEL)
+        pieces = [p async for p in client.stream("two", model=MODEL)]
+        third = await client.generate("three", model=MODEL)
+        await client.close()
+        return conns, first, pieces, third
+    conns, first, pieces, third = asyncio.run(go())
+    assert first and pieces and third
+    assert len(conns) == 3 and conns[0] is conns[1] is conns[2]
+
+def test_closing_a_stream_early_drops_the_connection(mock):
+    async def go():
+        client = AsyncOllamaClient(mock.url)
+        conns = tracked(client)
+        lines = client.request_lines("POST", "/api/generate", {"model": MODEL, "prompt": "hi"})
+        await lines.__anext__()
+        await lines.aclose()
+        assert conns[0].is_closing() and not client._idle
+        await client.generate("again", model=MODEL)  # opens a fresh connection
+        await client.close()
+        return conns
+    conns = asyncio.run(go())
+    assert len(conns) == 2 and conns[0] is not conns[1]
+    deadline = time.monotonic() + 2
+    while not mock.aborted and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert mock.aborted == 1
+
+def test_http_errors_raise_and_keep_the_connection(mock):
+    async def go():
+        client = AsyncOllamaClient(mock.url)
+        conns = tracked(client)
+        with pytest.raises(OllamaHTTPError) as err:
+            await client.generate("hi", model="no-such-model")
+        assert await client.generate("hi", model=MODEL)
+        await client.close()
+        return err.value, conns
+    err, conns = asyncio.run(go())
+    assert err.status == 404 and conns[0] is conns[1]
+
+def test_read_timeout_closes_the_connection():
+    m = MockOllama(token_ms=1, prompt_ms=1000).start()
+    async def go():
+        client = AsyncOllamaClient(m.url, read_timeout=0.1)
+        conns = tracked(client)
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await client.generate("hi", model=MODEL)
+        return conns, client._idle
+    try:
+        conns, idle = asyncio.run(go())
+    finally:
+        m.stop()
+    assert len(conns) == 3 and all(writer.is_closing() for writer in conns) and not idle
+
+def test_malformed_status_line_closes_the_connection():
+    async def go():
+        async def garbage(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"NONSENSE\r\n\r\n")
+            await writer.drain()
+        server = await asyncio.start_server(garbage, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncOllamaClient(f"http://127.0.0.1:{port}")
+        conns = tracked(client)
+        with pytest.raises(ValueError, match="malformed"):
+            await client.generate("hi", model=MODEL)
+        server.close()
+        return conns, client._idle
+    conns, idle = asyncio.run(go())
+    assert conns[0].is_closing() and not idle
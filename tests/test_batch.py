@@ -0,0 +1,68 @@
+import json, time
+
+import nacf_batch
+
+def fake_critique(fail=(), slow=(), calls=None):
+    """Stand-in for critique_record: fails or sleeps for the given indexes, logs the order calls finish in."""
+    def critique(index, record, *, model, url):
+        if "error" in record:
+            return {**record, "index": index, "critique": ""}
+        time.sleep(0.5 if index in slow else 0.005)
+        if calls is not None:
+            calls.append(index)
+        if index in fail:
+            return {**record, "index": index, "critique": "", "error": "Ollama error"}
+        return {**record, "index": index, "critique": f"critique {index}"}
+    return critique
+
+def write_input(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+def read_output(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+def answers(n):
+    return [json.dumps({"question": f"Q{i}?", "answer": f"A{i}"}) for i in range(n)]
+
+def test_bad_lines_become_error_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(nacf_batch, "critique_record", fake_critique())
+    src, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    lines = answers(10)
+    write_input(src, lines[:4] + ["{not json", "[1, 2]", ""] + lines[4:])
+    assert nacf_batch.run(str(src), str(out), model="m", url="u", workers=3) == 12
+    results = read_output(out)
+    assert [r["index"] for r in results] == list(range(12))
+    assert [r["index"] for r in results if "error" in r] == [4, 5]
+    assert sum(bool(r["critique"]) for r in results) == 10
+
+def test_resume_retries_failed_records(tmp_path, monkeypatch):
+    src, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_input(src, answers(8))
+    monkeypatch.setattr(nacf_batch, "critique_record", fake_critique(fail={2, 5}))
+    nacf_batch.run(str(src), str(out), model="m", url="u", workers=2)
+    with open(out, "a", encoding="utf-8") as f:
+        f.write('{"index": 7, "torn')  # killed mid-write
+    calls = []
+    monkeypatch.setattr(nacf_batch, "critique_record", fake_critique(calls=calls))
+    assert nacf_batch.checkpoint(str(out)) == {0, 1, 3, 4, 6, 7}
+    assert nacf_batch.run(str(src), str(out), model="m", url="u", workers=2) == 2
+    assert sorted(calls) == [2, 5]
+    results = read_output(out)
+    assert sorted(r["index"] for r in results) == list(range(8))
+    assert not any("error" in r for r in results)
+
+def test_slow_record_does_not_stall_the_others(tmp_path, monkeypatch):
+    calls = []
+    finished_before_slow = []
+    critique = fake_critique(slow={0}, calls=calls)
+    def watched(index, record, **kw):
+        result = critique(index, record, **kw)
+        if index == 0:
+            finished_before_slow.append(len(calls) - 1)
+        return result
+    monkeypatch.setattr(nacf_batch, "critique_record", watched)
+    src, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_input(src, answers(40))
+    nacf_batch.run(str(src), str(out), model="m", url="u", workers=2)
+    assert finished_before_slow[0] >= 30  # the other worker kept going while record 0 was generating
+    assert [r["index"] for r in read_output(out)] == list(range(40))
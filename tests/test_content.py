@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from Not_a_Culture_Fit import Content, QuestionIndex
+
+def write(tmp_path, name: str, data) -> str:
+    path = tmp_path / name
+    path.write_text(data if isinstance(data, str) else json.dumps(data), encoding="utf-8")
+    return str(path)
+
+CORE = {"questions": ["Core question one?", {"text": "Core question two?", "tags": ["Ops"], "difficulty": 3}],
+        "adjectives": ["Agile"], "nouns": ["Synergy"], "suffixes": ["LLC"],
+        "manager_first": ["Pat"], "manager_last": ["Lee"], "rejections": ["No."]}
+
+@pytest.mark.parametrize("broken", [
+    "{not json",
+    json.dumps(["a", "list"]),
+    json.dumps({"questions": [{"tags": ["no text"]}]}),
+    json.dumps({"questions": [{"text": "Hard?", "difficulty": "very"}]}),
+    json.dumps({"nouns": "not a list"}),
+])
+def test_broken_pack_is_skipped(tmp_path, broken):
+    paths = [write(tmp_path, "core.json", CORE), write(tmp_path, "bad.json", broken),
+             write(tmp_path, "good.json", {"questions": ["Extra question?"], "tags": ["extra"]})]
+    QuestionIndex.build(paths, str(tmp_path / "q.idx"), "0000beef")
+    c = Content(QuestionIndex(str(tmp_path / "q.idx")))
+    try:
+        assert list(c.skipped) == ["bad.json"]
+        assert [c.questions[i] for i in range(len(c.questions))] == \
+            ["Core question one?", "Core question two?", "Extra question?"]
+        assert set(c.questions.packs) == {"core", "good"}
+        assert list(c.questions.tagged("ops")) == [1] and list(c.questions.tagged("extra")) == [2]
+        assert c.questions.difficulty(1) == 3 and c.nouns == ("Synergy",)
+    finally:
+        c.questions.close()
+
+def test_broken_core_pack_raises(tmp_path):
+    with pytest.raises(ValueError, match="core.json"):
+        QuestionIndex.build([write(tmp_path, "core.json", "{")], str(tmp_path / "q.idx"), "0000beef")
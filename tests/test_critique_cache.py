@@ -0,0 +1,130 @@
+import sqlite3, threading, time
+from array import array
+
+import pytest
+
+import Not_a_Culture_Fit as nacf
+from Not_a_Culture_Fit import CachedAnswer, CritiqueCache, SemanticIndex, unit_vector
+from nacf_mock_ollama import toy_embedding
+
+@pytest.fixture(autouse=True)
+def semantic_on(monkeypatch):
+    monkeypatch.setattr(nacf, "SEMANTIC_CACHE", True)
+    monkeypatch.setattr(nacf, "_embed_retry_at", 0.0)
+
+@pytest.fixture
+def open_cache(tmp_path):
+    opened = []
+    def make(**kw) -> CritiqueCache:
+        opened.append(CritiqueCache(str(tmp_path / "critiques.sqlite3"), **kw))
+        return opened[-1]
+    return make
+
+def key(answer: str, question: str = "Why us?") -> str:
+    return CritiqueCache.key("llama3", nacf.GENERATION_OPTIONS, question, answer)
+
+def test_served_once_variants_are_generated(open_cache):
+    cache = open_cache(variants=3)
+    cache.put(key("idk"), "One."); cache.put(key("idk"), "Two.")
+    assert cache.get(key("idk")) is None
+    cache.put(key("idk"), "Three.")
+    assert {cache.get(key("idk")) for _ in range(50)} == {"One.", "Two.", "Three."}
+
+def test_repeated_critiques_count_towards_variants(open_cache):
+    cache = open_cache(variants=3)
+    for _ in range(3):
+        cache.put(key("idk"), "Same again.")
+    assert cache.get(key("idk")) == "Same again."
+    assert cache.stats()["entries"] == 1
+
+def test_names_are_templated_out(open_cache):
+    cache = open_cache(variants=1)
+    cache.put(key("no"), "Bob at Acme says no.", company="Acme", manager="Bob")
+    assert cache.get(key("no"), company="Initech", manager="Alice") == "Alice at Initech says no."
+
+def test_key_ignores_case_and_punctuation():
+    assert key("IDK!!  ") == key("idk") != key("i know")
+
+def test_expired_rows_are_not_served_and_purged_on_open(open_cache):
+    cache = open_cache(variants=1, ttl_s=0.05)
+    cache.put(key("late"), "Too late.")
+    assert cache.get(key("late")) == "Too late."
+    time.sleep(0.1)
+    assert cache.get(key("late")) is None
+    assert open_cache(variants=1, ttl_s=0.05).stats()["entries"] == 0
+
+def test_least_recently_used_rows_are_evicted(open_cache):
+    cache = open_cache(variants=1, max_entries=3)
+    for answer in ("a", "b", "c"):
+        cache.put(key(answer), f"Critique {answer}."); time.sleep(0.002)
+    cache.get(key("a")); time.sleep(0.002)
+    cache.put(key("d"), "Critique d.")
+    assert [cache.get(key(a)) is not None for a in "abcd"] == [True, False, True, True]
+
+def test_get_any_pools_near_duplicate_keys(open_cache):
+    cache = open_cache(variants=3)
+    cache.put(key("idk"), "One."); cache.put(key("idk"), "Two."); cache.put(key("i dunno"), "Three.")
+    assert cache.get(key("idk")) is None
+    assert cache.get_any([key("idk"), key("i dunno")]) in {"One.", "Two.", "Three."}
+    assert cache.get_any([]) is None
+
+def test_old_databases_are_migrated(tmp_path):
+    path = str(tmp_path / "critiques.sqlite3")
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE critiques (key TEXT NOT NULL, critique TEXT NOT NULL, created REAL NOT NULL, "
+               "last_used REAL NOT NULL, PRIMARY KEY (key, critique))")
+    db.execute("INSERT INTO critiques VALUES (?, 'Old.', ?, ?)", (key("x"), time.time(), time.time()))
+    db.commit(); db.close()
+    cache = CritiqueCache(path, variants=2)
+    assert cache.get(key("x")) is None
+    cache.put(key("x"), "Old.")
+    assert cache.get(key("x")) == "Old."
+
+# ---------- semantic index ----------
+def vec(*values: float) -> array:
+    return unit_vector(list(values))
+
+@pytest.fixture
+def index():
+    db = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+    return SemanticIndex(db, threading.Lock(), threshold=0.9, per_question=2, max_entries=3)
+
+def test_similar_returns_close_keys_closest_first(index):
+    index.add("q", "exact", vec(1, 0, 0)); index.add("q", "close", vec(1, 0.3, 0))
+    assert index.similar("q", vec(1, 0.05, 0)) == ["exact", "close"]
+    assert index.similar("q", vec(0, 1, 0)) == []
+    assert index.similar("other", vec(1, 0, 0)) == []
+
+def test_least_recently_matched_vector_leaves_a_full_bucket(index):
+    index.add("q", "a", vec(1, 0, 0)); time.sleep(0.002)
+    index.add("q", "b", vec(0, 1, 0)); time.sleep(0.002)
+    index.similar("q", vec(1, 0, 0)); time.sleep(0.002)  # a is now the most recently used
+    index.add("q", "c", vec(0, 0, 1))
+    assert index.vector("q", "a") is not None and index.vector("q", "b") is None
+    assert index.size() == 2
+
+def test_table_is_bounded_across_buckets(index):
+    for n, bucket in enumerate(("q1", "q2", "q3", "q4")):
+        index.add(bucket, f"k{n}", vec(1, n, 0)); time.sleep(0.002)
+    assert index.size() == 3 and index.vector("q1", "k0") is None
+
+def test_vectors_survive_a_restart(open_cache):
+    open_cache().semantic.add("q", "k", vec(1, 2, 3))
+    assert list(open_cache().semantic.vector("q", "k")) == pytest.approx(list(vec(1, 2, 3)))
+
+def test_cached_answer_exact_and_near_hits(open_cache):
+    cache = open_cache(variants=1)
+    calls = []
+    def embed(text):
+        calls.append(text)
+        return toy_embedding(text)
+    def entry(answer):
+        return CachedAnswer(cache, "llama3", "Why us?", answer, embed=embed)
+    first = entry("I love building reliable systems with great teams every day")
+    assert first.lookup() is None
+    first.store("Reliable? Bold.")
+    assert entry("I LOVE building reliable systems with great teams every day!").lookup() == "Reliable? Bold."
+    assert entry("I love building reliable systems with great teams every single day").lookup() == "Reliable? Bold."
+    assert entry("Cats.").lookup() is None
+    assert len(calls) == 3  # the exact hit never embeds
+    assert {k: cache.stats()[k] for k in ("hits", "near_hits", "misses")} == {"hits": 1, "near_hits": 1, "misses": 2}
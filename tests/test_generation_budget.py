@@ -0,0 +1,63 @@
+from Not_a_Culture_Fit import GenerationBudget, Trace
+
+def trace(latency: float, *, tokens: int = 0, eval_s: float = 0.0, first_token: float = 0.1) -> Trace:
+    t = Trace()
+    t.marks = {"prompt_built": 0.0, "first_token": first_token, "last_byte": latency}
+    t.ollama = {"eval_count": tokens, "eval_duration": eval_s * 1e9} if tokens else {}
+    return t
+
+def run(budget: GenerationBudget, latency: float, n: int, **kw):
+    for _ in range(n):
+        with budget.generation("short answer", trace(latency, **kw)):
+            pass
+
+def test_answer_length_sets_the_unpressured_budget():
+    budget = GenerationBudget(slo_s=0, ceiling=160)
+    assert budget.wanted("idk") == 68 and budget.wanted("word " * 100) == 160
+    assert budget.tokens_for("idk") == 160  # no SLO: the fixed num_predict
+
+def test_shrinks_while_p95_is_over_the_slo():
+    budget = GenerationBudget(slo_s=1.0, ceiling=160, min_samples=4)
+    run(budget, 3.0, 3)
+    assert budget.scale == 1.0  # waits for min_samples
+    run(budget, 3.0, 1)
+    assert budget.scale == 0.8 and not budget.latencies
+    run(budget, 3.0, 4)
+    assert budget.scale == 0.8 * 0.8
+    long = "word " * 40
+    assert budget.tokens_for(long) == int(160 * 0.64)
+    options = budget.start(long); budget.finish(None)
+    assert budget.trimmed(long, options)
+
+def test_never_below_floor_or_quarter_scale():
+    budget = GenerationBudget(slo_s=1.0, ceiling=160, floor=48, min_samples=2)
+    run(budget, 10.0, 40)
+    assert budget.scale == 0.25 and budget.tokens_for("idk") == 48
+
+def test_grows_back_only_when_idle():
+    budget = GenerationBudget(slo_s=1.0, ceiling=160, min_samples=2)
+    run(budget, 3.0, 2)
+    assert budget.scale == 0.8
+    budget.start("busy")  # another critique still generating
+    run(budget, 0.2, 2)
+    assert budget.scale == 0.8
+    budget.finish(None)
+    run(budget, 0.2, 2)
+    assert abs(budget.scale - 0.9) < 1e-9
+    run(budget, 0.2, 2)
+    assert budget.scale == 1.0
+    assert not budget.trimmed("short answer", budget.start("short answer"))
+
+def test_token_rate_caps_the_budget():
+    budget = GenerationBudget(slo_s=2.0, ceiling=160, min_samples=100)
+    run(budget, 1.1, 1, tokens=40, eval_s=1.0, first_token=0.1)  # 40 tok/s, 0.1 s to first token
+    assert budget.tokens_for("word " * 100) == int(40 * (2.0 - 0.1))
+
+def test_failed_generation_teaches_nothing():
+    budget = GenerationBudget(slo_s=1.0, ceiling=160, min_samples=1)
+    try:
+        with budget.generation("x", trace(5.0)):
+            raise RuntimeError("backend down")
+    except RuntimeError:
+        pass
+    assert budget.inflight == 0 and budget.scale == 1.0 and not budget.latencies
@@ -0,0 +1,105 @@
+import pytest
+
+from Not_a_Culture_Fit import ProseFilter, ReplyReader, Trace
+
+def stream(text: str, size: int, max_sentences: int = 3) -> tuple:
+    """Feed text in chunks of `size` characters, as a token stream would; returns (output, filter)."""
+    prose, out = ProseFilter(max_sentences), []
+    for i in range(0, len(text), size):
+        out.append(prose.feed(text[i:i + size]))
+        if prose.done:
+            break
+    else:
+        out.append(prose.flush())
+    return "".join(out).strip(), prose
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_stops_after_max_sentences(size):
+    out, prose = stream("One thing. Two things! Three things? Four things. Five.", size)
+    assert out == "One thing. Two things! Three things?"
+    assert prose.done and prose.sentences == 3
+
+def test_abbreviations_do_not_end_sentences():
+    out, prose = stream("Dr. Smith vs. Mr. Jones, e.g. a duel. The end. Not this.", 4, max_sentences=2)
+    assert out == "Dr. Smith vs. Mr. Jones, e.g. a duel. The end."
+
+def test_ellipsis_trails_off_without_ending_a_sentence():
+    out, prose = stream("Well... I suppose… Fine. Done.", 2, max_sentences=1)
+    assert out == "Well... I suppose… Fine."
+
+def test_closing_quotes_and_brackets_end_a_sentence():
+    out, _ = stream('He said "no." (Really.) Then left.', 5, max_sentences=2)
+    assert out == 'He said "no." (Really.)'
+
+@pytest.mark.parametrize("size", [1, 3, 7])
+def test_markup_split_across_tokens(size):
+    text = "## Verdict\n- **Bold** move, `truly`.\n1. See [the memo](http://x.io/a) _now_.\n> Quoted ~~not~~ fine."
+    out, _ = stream(text, size, max_sentences=0)
+    assert out == "Verdict Bold move, truly. See the memo now. Quoted not fine."
+
+def test_list_markers_only_stripped_at_line_start():
+    assert ProseFilter(0).clean("Costs - and benefits - vary.\n2) Numbered.") == "Costs - and benefits - vary. Numbered."
+
+def test_intra_word_underscores_survive():
+    assert ProseFilter(0).clean("Rename my_var to new_var_2 now.") == "Rename my_var to new_var_2 now."
+
+def test_zero_means_no_limit():
+    text = " ".join(f"Sentence {i}." for i in range(20))
+    out, prose = stream(text, 3, max_sentences=0)
+    assert out == text and not prose.done and prose.sentences == 20
+
+def test_clean_whole_reply():
+    assert ProseFilter(2).clean("* First point.\n* Second point.\n* Third point.") == "First point. Second point."
+
+def test_nothing_after_done():
+    prose = ProseFilter(1)
+    assert prose.feed("Stop here. ") == "Stop here."
+    assert prose.done
+    assert prose.feed("More text. ") == "" and prose.flush() == ""
+
+# ---------- ReplyReader ----------
+def chunks(text: str, **final):
+    for word in text.split(" "):
+        yield {"response": word + " "}
+    yield {"response": "", "done": True, **final}
+
+def read(reader: ReplyReader, text: str, **final) -> list:
+    shown = []
+    for chunk in chunks(text, **final):
+        shown.append(reader.feed(chunk))
+        if reader.stop:
+            break
+    return shown
+
+def response(chunk):
+    return chunk["response"]
+
+def test_reader_runs_to_done_and_keeps_ollama_stats():
+    trace = Trace()
+    reader = ReplyReader(response, max_sentences=3, trace=trace)
+    read(reader, "**One.** Two.", eval_count=4)
+    assert reader.text == "One. Two." and not reader.stop
+    assert trace.ollama == {"response": "", "done": True, "eval_count": 4}
+    assert trace.marks["first_token"] <= trace.marks["last_byte"]
+
+def test_reader_stops_early_and_records_what_was_received():
+    trace = Trace()
+    reader = ReplyReader(response, max_sentences=1, trace=trace)
+    shown = read(reader, "Short. And then it rambles on.")
+    assert reader.stop and reader.text == "Short." and "".join(shown).strip() == "Short."
+    assert trace.ollama == {"eval_count": 1, "done_reason": "sentences"}
+
+def test_reader_without_a_limit_passes_text_through():
+    reader = ReplyReader(response)
+    read(reader, "- *raw* text. More. Even more. And more.")
+    assert reader.text == "- *raw* text. More. Even more. And more." and not reader.stop
+
+def test_reader_raises_on_error_chunks():
+    with pytest.raises(RuntimeError, match="model not found"):
+        ReplyReader(response).feed({"error": "model not found"})
+
+def test_reader_whole_reply():
+    trace = Trace()
+    reply = {"response": "# Verdict\nNo. Never. Not ever.", "done": True, "eval_count": 9}
+    assert ReplyReader(response, max_sentences=2, trace=trace).whole(reply) == "Verdict No. Never."
+    assert trace.ollama is reply and "last_byte" in trace.marks
@@ -0,0 +1,101 @@
+import json, random
+from itertools import combinations
+
+import pytest
+
+from Not_a_Culture_Fit import QuestionIndex, SeenSet, near_duplicate, select_questions
+
+def word(i: int) -> str:
+    """A distinct letters-only word per i, so generated questions never look like near-duplicates."""
+    letters = ""
+    for _ in range(3):
+        i, r = divmod(i, 26)
+        letters += chr(ord("a") + r)
+    return "zq" + letters
+
+def question(i: int) -> str:
+    return f"How would you {word(4 * i)} the {word(4 * i + 1)} {word(4 * i + 2)} {word(4 * i + 3)}?"
+
+@pytest.fixture
+def make_index(tmp_path):
+    opened = []
+
+    def make(*packs) -> QuestionIndex:
+        paths = []
+        for n, pack in enumerate(packs):
+            path = tmp_path / f"{n:02d}-{pack['name']}.json"
+            path.write_text(json.dumps(pack), encoding="utf-8")
+            paths.append(str(path))
+        out = str(tmp_path / f"questions-{len(opened)}.idx")
+        QuestionIndex.build(paths, out, "0000beef")
+        opened.append(QuestionIndex(out))
+        return opened[-1]
+
+    yield make
+    for index in opened:
+        index.close()
+
+def pack(name: str, ids, *, difficulty=lambda i: 0, tags=()) -> dict:
+    return {"name": name, "tags": list(tags),
+            "questions": [{"text": question(i), "difficulty": difficulty(i)} for i in ids]}
+
+def fresh(index: QuestionIndex) -> SeenSet:
+    return SeenSet(None, len(index), "0000beef")
+
+def test_picks_are_unique_and_marked_seen(make_index):
+    index = make_index(pack("core", range(40)))
+    seen = fresh(index)
+    picked = select_questions(index, 10, seen, rng=random.Random(1))
+    assert len(picked) == len(set(picked)) == 10
+    assert all(i in seen for i in picked)
+
+def test_near_duplicates_are_not_picked_together(make_index):
+    copies = {"name": "core", "questions": [f"{question(i)} (variant {v})" for i in range(12) for v in range(3)]}
+    index = make_index(copies)
+    picked = select_questions(index, 8, fresh(index), rng=random.Random(2))
+    assert len(picked) == 8
+    assert not any(near_duplicate(index.signature(a), index.signature(b)) for a, b in combinations(picked, 2))
+
+def test_small_theme_is_topped_up_from_the_bank(make_index):
+    index = make_index(pack("core", range(30)), pack("tiny", range(30, 33), tags=["tiny"]))
+    themed = set(index.tagged("tiny"))
+    picked = select_questions(index, 10, fresh(index), theme=["tiny"], rng=random.Random(3))
+    assert len(picked) == len(set(picked)) == 10
+    assert themed <= set(picked)
+
+def test_large_theme_stays_on_theme(make_index):
+    index = make_index(pack("core", range(30)), pack("big", range(30, 50), tags=["big"]))
+    picked = select_questions(index, 10, fresh(index), theme=["big", "unknown"], rng=random.Random(4))
+    assert set(picked) <= set(index.tagged("big"))
+
+def test_span_limits_picks_to_one_pack(make_index):
+    index = make_index(pack("core", range(20)), pack("extra", range(20, 40)))
+    lo, hi = index.packs["extra"]
+    picked = select_questions(index, 15, fresh(index), span=(lo, hi), rng=random.Random(5))
+    assert len(picked) == 15 and all(lo <= i < hi for i in picked)
+
+def test_ramp_follows_difficulty(make_index):
+    index = make_index(pack("core", range(60), difficulty=lambda i: 1 + i % 3))
+    picked = select_questions(index, 5, fresh(index), ramp=(1, 3), rng=random.Random(6))
+    assert [index.difficulty(i) for i in picked] == [1, 2, 2, 2, 3]
+
+def test_ramp_slack_when_a_level_is_missing(make_index):
+    # Nothing at difficulty 3: the last slots take the closest level rather than coming up short
+    index = make_index(pack("core", range(20), difficulty=lambda i: 1 + i % 2))
+    picked = select_questions(index, 5, fresh(index), ramp=(1, 3), rng=random.Random(7))
+    assert len(picked) == 5
+    assert [index.difficulty(i) for i in picked][:2] == [1, 2]
+
+def test_exhausted_pool_starts_a_new_round(make_index):
+    index = make_index(pack("core", range(6)))
+    seen = fresh(index)
+    first = select_questions(index, 4, seen, rng=random.Random(8))
+    second = select_questions(index, 4, seen, rng=random.Random(9))
+    assert len(second) == len(set(second)) == 4
+    assert set(range(6)) - set(first) <= set(second)  # the unseen ones come first
+    assert all(i in seen for i in second)
+    assert sum(i in seen for i in range(6)) < 6  # the previous round was forgotten
+
+def test_never_more_than_the_span(make_index):
+    index = make_index(pack("core", range(4)))
+    assert sorted(select_questions(index, 10, fresh(index), rng=random.Random(10))) == [0, 1, 2, 3]
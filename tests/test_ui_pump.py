@@ -0,0 +1,45 @@
+from Not_a_Culture_Fit import UIPump
+
+class FakeRoot:
+    """Just the after() scheduling and error reporting UIPump uses."""
+
+    def __init__(self):
+        self.scheduled, self.reported = [], []
+
+    def after(self, ms, fn):
+        self.scheduled.append(fn)
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.reported.append((exc_type, tb))
+
+    def frame(self):
+        self.scheduled.pop(0)()
+
+def test_runs_posts_in_order_and_keyed_posts_replace():
+    root, ran = FakeRoot(), []
+    pump = UIPump(root)
+    pump.post(lambda: ran.append("a"))
+    pump.post(lambda: ran.append("status 1"), key="status")
+    pump.post(lambda: ran.append("b"))
+    pump.post(lambda: ran.append("status 2"), key="status")
+    root.frame()
+    assert ran == ["a", "status 2", "b"]
+    assert len(root.scheduled) == 1  # the next tick
+
+def test_drain_hooks_run_every_frame():
+    root, drained = FakeRoot(), []
+    pump = UIPump(root)
+    pump.on_drain.append(lambda: drained.append(1))
+    root.frame(); root.frame()
+    assert drained == [1, 1]
+
+def test_errors_reach_tk_with_traceback_and_the_loop_survives():
+    root, ran = FakeRoot(), []
+    pump = UIPump(root)
+    pump.post(lambda: 1 / 0)
+    pump.post(lambda: ran.append("after"))
+    pump.on_drain.append(lambda: {}["missing"])
+    root.frame()
+    assert [t for t, _ in root.reported] == [ZeroDivisionError, KeyError]
+    assert all(tb is not None for _, tb in root.reported)
+    assert ran == ["after"] and len(root.scheduled) == 1
@@ -0,0 +1,122 @@
+import threading, time
+
+import pytest
+
+import Not_a_Culture_Fit as nacf
+from Not_a_Culture_Fit import (PRIORITY_INTERACTIVE, IdleScheduler, Metrics, QueueFull, WorkQueue)
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+class Blocker:
+    """A job that holds its worker until released."""
+
+    def __init__(self):
+        self.started, self.release = threading.Event(), threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.release.wait(5)
+
+def test_interactive_runs_before_older_background():
+    queue, ran, blocker = WorkQueue(workers=1, metrics=Metrics()), [], Blocker()
+    queue.submit(blocker, priority=PRIORITY_INTERACTIVE)
+    assert blocker.started.wait(2)
+    queue.submit(lambda: ran.append("b1"))
+    queue.submit(lambda: ran.append("i1"), priority=PRIORITY_INTERACTIVE)
+    queue.submit(lambda: ran.append("b2"))
+    blocker.release.set()
+    assert wait_for(lambda: len(ran) == 3)
+    assert ran == ["i1", "b1", "b2"]
+
+def test_same_key_replaces_the_pending_item():
+    metrics = Metrics()
+    queue, ran, blocker = WorkQueue(workers=1, metrics=metrics), [], Blocker()
+    queue.submit(blocker, priority=PRIORITY_INTERACTIVE)
+    assert blocker.started.wait(2)
+    first = queue.submit(lambda: ran.append("old"), key="status")
+    queue.submit(lambda: ran.append("new"), key="status")
+    assert first.dropped and queue.depth() == 1
+    blocker.release.set()
+    assert wait_for(lambda: ran == ["new"])
+    assert 'nacf_queue_coalesced_total{priority="background"} 1' in metrics.prometheus()
+
+def test_full_queue_drops_background_for_interactive():
+    queue, blocker = WorkQueue(workers=1, max_size=2, metrics=Metrics()), Blocker()
+    queue.submit(blocker, priority=PRIORITY_INTERACTIVE)
+    assert blocker.started.wait(2)
+    older, newer = queue.submit(lambda: None), queue.submit(lambda: None)
+    with pytest.raises(QueueFull):
+        queue.submit(lambda: None)
+    queue.submit(lambda: None, priority=PRIORITY_INTERACTIVE)
+    assert newer.dropped and not older.dropped
+    blocker.release.set()
+
+def test_background_leaves_a_worker_for_interactive():
+    queue, first, second = WorkQueue(workers=2, metrics=Metrics()), Blocker(), Blocker()
+    queue.submit(first)
+    assert first.started.wait(2)
+    queue.submit(second)
+    assert not second.started.wait(0.1)  # the other worker stays free ...
+    ran = threading.Event()
+    queue.submit(ran.set, priority=PRIORITY_INTERACTIVE)
+    assert ran.wait(2)  # ... for this
+    first.release.set()
+    assert second.started.wait(2)
+    second.release.set()
+
+def test_single_worker_still_runs_background():
+    queue, ran = WorkQueue(workers=1, metrics=Metrics()), threading.Event()
+    queue.submit(ran.set)
+    assert ran.wait(2)
+
+# ---------- idle scheduler ----------
+@pytest.fixture
+def idle(monkeypatch):
+    monkeypatch.setattr(nacf, "_work_queue", WorkQueue(workers=2, metrics=Metrics()))
+    return IdleScheduler()
+
+def cancellable(runs: list, name: str, done: threading.Event | None = None):
+    def job(token):
+        runs.append(name)
+        while not token.cancelled and not (done and done.is_set()):
+            time.sleep(0.005)
+    return job
+
+def test_preempted_job_runs_again_after_the_foreground(idle):
+    runs, done = [], threading.Event()
+    idle.submit("decision", cancellable(runs, "draft", done))
+    assert wait_for(lambda: runs == ["draft"])
+    idle.begin_interactive()
+    time.sleep(0.05)
+    assert runs == ["draft"]  # not while the foreground request is in flight
+    idle.end_interactive()
+    assert wait_for(lambda: runs == ["draft", "draft"])
+    done.set()
+
+def test_resubmitted_key_wins_over_the_preempted_job(idle):
+    runs, done = [], threading.Event()
+    idle.submit("decision", cancellable(runs, "old", done))
+    assert wait_for(lambda: runs == ["old"])
+    idle.begin_interactive()
+    idle.submit("decision", cancellable(runs, "new", done))
+    idle.end_interactive()
+    assert wait_for(lambda: runs == ["old", "new"])
+    time.sleep(0.05)
+    assert runs == ["old", "new"]
+    done.set()
+
+def test_clear_does_not_bring_the_job_back(idle):
+    runs = []
+    idle.submit("decision", cancellable(runs, "draft"))
+    assert wait_for(lambda: runs == ["draft"])
+    idle.begin_interactive()
+    idle.clear()
+    idle.end_interactive()
+    time.sleep(0.1)
+    assert runs == ["draft"]